@@ -18,9 +18,10 @@ config = context.config
 settings = get_settings()
 config.set_main_option("sqlalchemy.url", settings.database_url)
 
-# Interpret the config file for Python logging
+# Interpret the config file for Python logging, leaving loggers of an importing process
+# (e.g. the test suite's app.accrual) enabled
 if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
 
 # Model's MetaData for 'autogenerate' support
 target_metadata = Base.metadata
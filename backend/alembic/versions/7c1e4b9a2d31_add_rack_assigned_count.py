@@ -0,0 +1,40 @@
+"""Add maintained assigned_count counter to racks
+
+Revision ID: 7c1e4b9a2d31
+Revises: 2dfad462594b
+Create Date: 2026-10-18 09:12:04.118230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b9a2d31'
+down_revision: Union[str, Sequence[str], None] = '2dfad462594b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('racks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('assigned_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill counters from existing cage assignments
+    op.execute(
+        """
+        UPDATE racks SET assigned_count = (
+            SELECT COUNT(*) FROM cages
+            WHERE cages.rack_id = racks.id AND cages.current_professor_id IS NOT NULL
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('racks', schema=None) as batch_op:
+        batch_op.drop_column('assigned_count')
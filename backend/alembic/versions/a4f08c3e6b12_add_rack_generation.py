@@ -0,0 +1,30 @@
+"""Add generation stamp to racks for cage grid ETags
+
+Revision ID: a4f08c3e6b12
+Revises: 7c1e4b9a2d31
+Create Date: 2026-10-18 10:03:41.552917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f08c3e6b12'
+down_revision: Union[str, Sequence[str], None] = '7c1e4b9a2d31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('racks', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('generation', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('racks', schema=None) as batch_op:
+        batch_op.drop_column('generation')
@@ -0,0 +1,103 @@
+"""Replace the change counter row with a sequence
+
+The single change_counter row was locked by every write transaction until
+commit. On PostgreSQL change numbers now come from the change_seq sequence, and
+each number is held as a transaction-level advisory lock until its transaction
+ends, so delta sync can read the committed watermark: one below the lowest number
+still in flight. On SQLite, where writers are already serialized, a one-row
+table hands out numbers.
+
+Revision ID: a6d3f9b2c185
+Revises: f4c2e8a1b637
+Create Date: 2026-10-19 00:41:06.528814
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d3f9b2c185'
+down_revision: Union[str, Sequence[str], None] = 'f4c2e8a1b637'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Two-key advisory lock held by allocators (shared) and the watermark read (exclusive)
+# around "allocate a number, lock it". Single bigint keys are the allocated numbers.
+GATE = '19795, 1'
+
+NEXT_CHANGE_SEQ = f"""
+CREATE FUNCTION next_change_seq() RETURNS bigint AS $$
+DECLARE
+    seq bigint;
+BEGIN
+    PERFORM pg_advisory_lock_shared({GATE});
+    seq := nextval('change_seq');
+    PERFORM pg_advisory_xact_lock_shared(seq);
+    PERFORM pg_advisory_unlock_shared({GATE});
+    RETURN seq;
+END
+$$ LANGUAGE plpgsql
+"""
+
+COMMITTED_CHANGE_SEQ = f"""
+CREATE FUNCTION committed_change_seq() RETURNS bigint AS $$
+DECLARE
+    allocated bigint;
+    pending bigint;
+BEGIN
+    PERFORM pg_advisory_lock({GATE});
+    SELECT CASE WHEN is_called THEN last_value ELSE last_value - 1 END INTO allocated FROM change_seq;
+    SELECT MIN((classid::bigint << 32) | objid::bigint) INTO pending
+    FROM pg_locks
+    WHERE locktype = 'advisory' AND objsubid = 1 AND database = (
+        SELECT oid FROM pg_database WHERE datname = current_database()
+    );
+    PERFORM pg_advisory_unlock({GATE});
+    RETURN LEAST(allocated, COALESCE(pending - 1, allocated));
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    last = conn.scalar(sa.text("SELECT value FROM change_counter WHERE id = 1")) or 0
+
+    if conn.dialect.name == 'postgresql':
+        op.execute("CREATE SEQUENCE change_seq")
+        op.execute(f"SELECT setval('change_seq', {max(last, 1)}, {'true' if last else 'false'})")
+        op.execute(NEXT_CHANGE_SEQ)
+        op.execute(COMMITTED_CHANGE_SEQ)
+    else:
+        op.create_table('change_sequence',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        if last:
+            op.execute(f"INSERT INTO change_sequence (id) VALUES ({last})")
+
+    op.drop_table('change_counter')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    op.create_table('change_counter',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    if conn.dialect.name == 'postgresql':
+        op.execute("INSERT INTO change_counter (id, value) SELECT 1, committed_change_seq()")
+        op.execute("DROP FUNCTION committed_change_seq()")
+        op.execute("DROP FUNCTION next_change_seq()")
+        op.execute("DROP SEQUENCE change_seq")
+    else:
+        op.execute("INSERT INTO change_counter (id, value) SELECT 1, COALESCE(MAX(id), 0) FROM change_sequence")
+        op.drop_table('change_sequence')
@@ -0,0 +1,54 @@
+"""Add global change sequence for delta sync
+
+Revision ID: b7e3a1f9d254
+Revises: f2b8d4a6c913
+Create Date: 2026-10-18 18:41:27.630914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3a1f9d254'
+down_revision: Union[str, Sequence[str], None] = 'f2b8d4a6c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('change_counter',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO change_counter (id, value) VALUES (1, 0)")
+    op.create_table('change_tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('change_seq', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_tombstones_change_seq', 'change_tombstones', ['change_seq'], unique=False)
+
+    # Existing rows predate the sequence: change_seq 0, included in any full load
+    for table in ('cages', 'racks', 'professors'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('change_seq', sa.Integer(), nullable=False, server_default='0'))
+            batch_op.create_index(f'ix_{table}_change_seq', ['change_seq'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('professors', 'racks', 'cages'):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(f'ix_{table}_change_seq')
+            batch_op.drop_column('change_seq')
+
+    op.drop_index('ix_change_tombstones_change_seq', table_name='change_tombstones')
+    op.drop_table('change_tombstones')
+    op.drop_table('change_counter')
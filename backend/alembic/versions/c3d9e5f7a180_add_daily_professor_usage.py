@@ -0,0 +1,44 @@
+"""Add daily_professor_usage rollup table
+
+Revision ID: c3d9e5f7a180
+Revises: a4f08c3e6b12
+Create Date: 2026-10-18 13:27:19.804415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9e5f7a180'
+down_revision: Union[str, Sequence[str], None] = 'a4f08c3e6b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_professor_usage',
+    sa.Column('usage_date', sa.Date(), nullable=False),
+    sa.Column('professor_id', sa.Integer(), nullable=False),
+    sa.Column('cage_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['professor_id'], ['professors.id'], ),
+    sa.PrimaryKeyConstraint('usage_date', 'professor_id')
+    )
+
+    # Backfill from existing assignment history
+    op.execute(
+        """
+        INSERT INTO daily_professor_usage (usage_date, professor_id, cage_count)
+        SELECT assigned_date, professor_id, COUNT(*)
+        FROM assignments
+        GROUP BY assigned_date, professor_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_professor_usage')
@@ -0,0 +1,169 @@
+"""Partition assignments by month and add the cold archive table
+
+On PostgreSQL, assignments is rebuilt as a table range-partitioned by month of
+assigned_date (primary key becomes (id, assigned_date), as partitioning requires),
+with monthly partitions for existing data and a DEFAULT partition.
+assignments_archive is partitioned the same way. On SQLite the archive is a
+plain table.
+
+Revision ID: c8f4d2a7b915
+Revises: b7e3a1f9d254
+Create Date: 2026-10-18 21:12:48.203517
+
+"""
+from datetime import date, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f4d2a7b915'
+down_revision: Union[str, Sequence[str], None] = 'b7e3a1f9d254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = 'id, cage_id, professor_id, assigned_by_user_id, assigned_date, assigned_at, released_at, cost'
+INDEXES = [
+    ('ix_{table}_cage_date', ['cage_id', 'assigned_date']),
+    ('ix_{table}_professor_date', ['professor_id', 'assigned_date']),
+    ('ix_{table}_date', ['assigned_date']),
+]
+HOT_INDEXES = INDEXES + [
+    ('ix_{table}_cage_id', ['cage_id']),
+    ('ix_{table}_professor_id', ['professor_id']),
+    ('ix_{table}_released_at', ['released_at']),
+]
+
+
+def _archive_columns():
+    return [
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('cage_id', sa.Integer(), nullable=False),
+        sa.Column('professor_id', sa.Integer(), nullable=False),
+        sa.Column('assigned_by_user_id', sa.Integer(), nullable=False),
+        sa.Column('assigned_date', sa.Date(), nullable=False),
+        sa.Column('assigned_at', sa.DateTime(), nullable=False),
+        sa.Column('released_at', sa.DateTime(), nullable=True),
+        sa.Column('cost', sa.Integer(), nullable=False),
+    ]
+
+
+def _create_indexes(table, indexes):
+    for name, columns in indexes:
+        op.create_index(name.format(table=table), table, columns, unique=False)
+
+
+def _months(first, last):
+    month = first.replace(day=1)
+    while month <= last:
+        end = (month + timedelta(days=32)).replace(day=1)
+        yield month, end
+        month = end
+
+
+def _create_partitioned(table, id_default, foreign_keys, first, last):
+    """Create table partitioned by month with partitions for first..last and a DEFAULT partition."""
+    op.execute(f"""
+        CREATE TABLE {table} (
+            id INTEGER NOT NULL{id_default},
+            cage_id INTEGER NOT NULL{foreign_keys['cage_id']},
+            professor_id INTEGER NOT NULL{foreign_keys['professor_id']},
+            assigned_by_user_id INTEGER NOT NULL{foreign_keys['assigned_by_user_id']},
+            assigned_date DATE NOT NULL,
+            assigned_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            released_at TIMESTAMP WITHOUT TIME ZONE,
+            cost INTEGER NOT NULL,
+            CONSTRAINT {table}_pkey PRIMARY KEY (id, assigned_date)
+        ) PARTITION BY RANGE (assigned_date)
+    """)
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+    for month, end in _months(first, last):
+        op.execute(
+            f"CREATE TABLE {table}_{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('assignment_archive_runs',
+    sa.Column('archived_before', sa.Date(), nullable=False),
+    sa.Column('moved_count', sa.Integer(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('archived_before')
+    )
+
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        op.create_table('assignments_archive', *_archive_columns(), sa.PrimaryKeyConstraint('id'))
+        _create_indexes('assignments_archive', INDEXES)
+        return
+
+    today = date.today()
+    first = conn.scalar(sa.text("SELECT MIN(assigned_date) FROM assignments")) or today
+    ahead = today + timedelta(days=62)
+    id_sequence = conn.scalar(sa.text("SELECT pg_get_serial_sequence('assignments', 'id')"))
+
+    op.rename_table('assignments', 'assignments_unpartitioned')
+    op.execute("ALTER TABLE assignments_unpartitioned RENAME CONSTRAINT assignments_pkey TO assignments_unpartitioned_pkey")
+    _create_partitioned(
+        'assignments',
+        f" DEFAULT nextval('{id_sequence}'::regclass)",
+        {
+            'cage_id': ' REFERENCES cages (id)',
+            'professor_id': ' REFERENCES professors (id)',
+            'assigned_by_user_id': ' REFERENCES users (id)',
+        },
+        first,
+        ahead,
+    )
+    op.execute(f"INSERT INTO assignments ({COLUMNS}) SELECT {COLUMNS} FROM assignments_unpartitioned")
+    op.execute(f"ALTER SEQUENCE {id_sequence} OWNED BY assignments.id")
+    op.drop_table('assignments_unpartitioned')
+    _create_indexes('assignments', HOT_INDEXES)
+
+    _create_partitioned(
+        'assignments_archive',
+        '',
+        {'cage_id': '', 'professor_id': '', 'assigned_by_user_id': ''},
+        first,
+        first,
+    )
+    _create_indexes('assignments_archive', INDEXES)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    op.execute(f"INSERT INTO assignments ({COLUMNS}) SELECT {COLUMNS} FROM assignments_archive")
+
+    if conn.dialect.name == 'postgresql':
+        id_sequence = conn.scalar(sa.text("SELECT pg_get_serial_sequence('assignments', 'id')"))
+        op.rename_table('assignments', 'assignments_partitioned')
+        op.execute("ALTER TABLE assignments_partitioned RENAME CONSTRAINT assignments_pkey TO assignments_partitioned_pkey")
+        for name, _ in HOT_INDEXES:
+            op.execute(f"ALTER INDEX {name.format(table='assignments')} RENAME TO {name.format(table='assignments_partitioned')}")
+        op.create_table('assignments',
+        sa.Column('id', sa.Integer(), server_default=sa.text(f"nextval('{id_sequence}'::regclass)"), nullable=False),
+        sa.Column('cage_id', sa.Integer(), nullable=False),
+        sa.Column('professor_id', sa.Integer(), nullable=False),
+        sa.Column('assigned_by_user_id', sa.Integer(), nullable=False),
+        sa.Column('assigned_date', sa.Date(), nullable=False),
+        sa.Column('assigned_at', sa.DateTime(), nullable=False),
+        sa.Column('released_at', sa.DateTime(), nullable=True),
+        sa.Column('cost', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['assigned_by_user_id'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['cage_id'], ['cages.id'], ),
+        sa.ForeignKeyConstraint(['professor_id'], ['professors.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.execute(f"INSERT INTO assignments ({COLUMNS}) SELECT {COLUMNS} FROM assignments_partitioned")
+        op.execute(f"ALTER SEQUENCE {id_sequence} OWNED BY assignments.id")
+        op.drop_table('assignments_partitioned')  # Drops its partitions too
+        _create_indexes('assignments', HOT_INDEXES)
+
+    op.drop_table('assignments_archive')
+    op.drop_table('assignment_archive_runs')
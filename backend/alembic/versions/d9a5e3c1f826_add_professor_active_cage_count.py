@@ -0,0 +1,48 @@
+"""Add maintained active cage counter to professors
+
+Revision ID: d9a5e3c1f826
+Revises: c8f4d2a7b915
+Create Date: 2026-10-18 22:04:13.518240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a5e3c1f826'
+down_revision: Union[str, Sequence[str], None] = 'c8f4d2a7b915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('professors', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('active_cage_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.create_index('ix_professors_name', ['name'], unique=False)
+        batch_op.create_index(
+            'ix_professors_active_cage_count_name',
+            [sa.text('active_cage_count DESC'), 'name'],
+            unique=False,
+        )
+
+    # Backfill counters from current cage assignments
+    op.execute(
+        """
+        UPDATE professors SET active_cage_count = (
+            SELECT COUNT(*) FROM cages
+            WHERE cages.current_professor_id = professors.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('professors', schema=None) as batch_op:
+        batch_op.drop_index('ix_professors_active_cage_count_name')
+        batch_op.drop_index('ix_professors_name')
+        batch_op.drop_column('active_cage_count')
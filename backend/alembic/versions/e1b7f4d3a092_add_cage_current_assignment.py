@@ -0,0 +1,43 @@
+"""Add current assignment pointer to cages
+
+Revision ID: e1b7f4d3a092
+Revises: d9a5e3c1f826
+Create Date: 2026-10-18 22:47:35.906144
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b7f4d3a092'
+down_revision: Union[str, Sequence[str], None] = 'd9a5e3c1f826'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('cages', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('current_assignment_id', sa.Integer(), nullable=True))
+
+    # Backfill from each held cage's latest open assignment of its current professor
+    op.execute(
+        """
+        UPDATE cages SET current_assignment_id = (
+            SELECT MAX(assignments.id) FROM assignments
+            WHERE assignments.cage_id = cages.id
+              AND assignments.professor_id = cages.current_professor_id
+              AND assignments.released_at IS NULL
+        )
+        WHERE current_professor_id IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('cages', schema=None) as batch_op:
+        batch_op.drop_column('current_assignment_id')
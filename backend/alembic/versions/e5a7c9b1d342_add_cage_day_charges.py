@@ -0,0 +1,83 @@
+"""Add cage_day_charges ledger and accrual_runs
+
+Revision ID: e5a7c9b1d342
+Revises: c3d9e5f7a180
+Create Date: 2026-10-18 15:02:41.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c9b1d342'
+down_revision: Union[str, Sequence[str], None] = 'c3d9e5f7a180'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cage_day_charges',
+    sa.Column('assignment_id', sa.Integer(), nullable=False),
+    sa.Column('charge_date', sa.Date(), nullable=False),
+    sa.Column('cage_id', sa.Integer(), nullable=False),
+    sa.Column('professor_id', sa.Integer(), nullable=False),
+    sa.Column('cost', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['professor_id'], ['professors.id'], ),
+    sa.PrimaryKeyConstraint('assignment_id', 'charge_date')
+    )
+    op.create_index('ix_cage_day_charges_date_professor', 'cage_day_charges', ['charge_date', 'professor_id'], unique=False)
+    op.create_index('ix_cage_day_charges_professor_date', 'cage_day_charges', ['professor_id', 'charge_date'], unique=False)
+    op.create_table('accrual_runs',
+    sa.Column('charge_date', sa.Date(), nullable=False),
+    sa.Column('charge_count', sa.Integer(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('charge_date')
+    )
+    with op.batch_alter_table('assignments', schema=None) as batch_op:
+        batch_op.create_index('ix_assignments_released_at', ['released_at'], unique=False)
+
+    # Reassigning an occupied cage used to leave the previous assignment open;
+    # close those at the time the next assignment started
+    op.execute(
+        """
+        UPDATE assignments
+        SET released_at = (
+            SELECT MIN(later.assigned_at)
+            FROM assignments later
+            WHERE later.cage_id = assignments.cage_id
+              AND later.id > assignments.id
+        )
+        WHERE released_at IS NULL
+          AND EXISTS (
+            SELECT 1
+            FROM assignments later
+            WHERE later.cage_id = assignments.cage_id
+              AND later.id > assignments.id
+          )
+        """
+    )
+
+    # Existing history was billed one day per assignment; keep those charges as-is.
+    # Accrual of held days starts with the first run after this migration.
+    op.execute(
+        """
+        INSERT INTO cage_day_charges (assignment_id, charge_date, cage_id, professor_id, cost)
+        SELECT id, assigned_date, cage_id, professor_id, cost
+        FROM assignments
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('assignments', schema=None) as batch_op:
+        batch_op.drop_index('ix_assignments_released_at')
+
+    op.drop_table('accrual_runs')
+    op.drop_index('ix_cage_day_charges_professor_date', table_name='cage_day_charges')
+    op.drop_index('ix_cage_day_charges_date_professor', table_name='cage_day_charges')
+    op.drop_table('cage_day_charges')
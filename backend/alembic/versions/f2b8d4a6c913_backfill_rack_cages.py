@@ -0,0 +1,64 @@
+"""Backfill cages for racks whose grid was never provisioned
+
+Cage grids used to be created lazily on the first grid GET; the GET is now
+read-only, so every rack needs its full grid up front.
+
+Revision ID: f2b8d4a6c913
+Revises: e5a7c9b1d342
+Create Date: 2026-10-18 17:26:09.304551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4a6c913'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c9b1d342'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+racks = sa.table(
+    'racks',
+    sa.column('id', sa.Integer),
+    sa.column('rows', sa.Integer),
+    sa.column('columns', sa.Integer),
+)
+cages = sa.table(
+    'cages',
+    sa.column('rack_id', sa.Integer),
+    sa.column('position', sa.String),
+    sa.column('row_index', sa.Integer),
+    sa.column('col_index', sa.Integer),
+    sa.column('version', sa.Integer),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    existing = set(conn.execute(sa.select(cages.c.rack_id, cages.c.row_index, cages.c.col_index)))
+    missing = [
+        {
+            'rack_id': rack_id,
+            'position': f"{chr(ord('A') + row)}{col + 1}",
+            'row_index': row,
+            'col_index': col,
+            'version': 1,
+        }
+        for rack_id, rows, columns in conn.execute(sa.select(racks.c.id, racks.c.rows, racks.c.columns))
+        for row in range(rows)
+        for col in range(columns)
+        if (rack_id, row, col) not in existing
+    ]
+    if missing:
+        conn.execute(sa.insert(cages), missing)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Backfilled cages are indistinguishable from provisioned ones; leave them in place
+    pass
@@ -0,0 +1,43 @@
+"""Add current assignment date to cages
+
+The cage pointer now carries the assignment's full key (id, assigned_date), so
+lookups through it prune to one partition of the partitioned assignments table.
+
+Revision ID: f4c2e8a1b637
+Revises: e1b7f4d3a092
+Create Date: 2026-10-18 23:58:12.417309
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c2e8a1b637'
+down_revision: Union[str, Sequence[str], None] = 'e1b7f4d3a092'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('cages', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('current_assignment_date', sa.Date(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE cages SET current_assignment_date = (
+            SELECT assignments.assigned_date FROM assignments
+            WHERE assignments.id = cages.current_assignment_id
+        )
+        WHERE current_assignment_id IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('cages', schema=None) as batch_op:
+        batch_op.drop_column('current_assignment_date')
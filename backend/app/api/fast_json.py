@@ -0,0 +1,58 @@
+"""Opt-in fast JSON path for hot read endpoints (FAST_JSON=true).
+
+Hot read handlers build plain payloads from row tuples, mirroring their response
+schemas field for field. By default FastAPI still validates and encodes those
+payloads through response_model. With the fast path on, handlers return them as
+orjson-encoded responses that skip the second validation pass; the bytes on the
+wire are the same. Requires the "fastjson" extra (orjson).
+"""
+
+import json
+from typing import Any
+
+from fastapi import Response
+
+from app.config import get_settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if get_settings().fast_json and orjson is None:
+    raise RuntimeError('FAST_JSON=true requires the "fastjson" extra (orjson)')
+
+
+class FastJSONResponse(Response):
+    """JSON response encoded with orjson."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def fast_json_enabled() -> bool:
+    """Whether hot read endpoints bypass response_model validation."""
+    return get_settings().fast_json
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode a payload for a hand-built response body, compact like FastAPI's own output."""
+    if fast_json_enabled():
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_payload(payload: dict, response: Response | None = None) -> dict | Response:
+    """Return payload for response_model handling, or pre-encoded when the fast path is on.
+
+    Headers set on the route's injected Response are carried over, since FastAPI
+    only merges them into responses it builds itself.
+    """
+    if not fast_json_enabled():
+        return payload
+    fast_response = FastJSONResponse(payload)
+    if response is not None:
+        fast_response.headers.raw.extend(response.headers.raw)
+    return fast_response
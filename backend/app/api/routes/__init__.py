@@ -1,9 +1,21 @@
 """API routes package."""
 
+from app.api.routes.assignments import router as assignments_router
+from app.api.routes.async_routes import router as async_router
 from app.api.routes.cages import router as cages_router
+from app.api.routes.changes import router as changes_router
 from app.api.routes.dashboard import router as dashboard_router
 from app.api.routes.professors import router as professors_router
 from app.api.routes.racks import router as racks_router
 from app.api.routes.reports import router as reports_router
 
-__all__ = ["cages_router", "dashboard_router", "professors_router", "racks_router", "reports_router"]
+__all__ = [
+    "assignments_router",
+    "async_router",
+    "cages_router",
+    "changes_router",
+    "dashboard_router",
+    "professors_router",
+    "racks_router",
+    "reports_router",
+]
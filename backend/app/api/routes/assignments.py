@@ -0,0 +1,119 @@
+"""Assignment history API route - filtered, keyset-paginated reads."""
+
+import base64
+import binascii
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import Cage, Professor, Rack
+from app.schemas import AssignmentPageResponse
+from app.services import assignment_source
+
+router = APIRouter(prefix="/assignments", tags=["assignments"])
+
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(assigned_date: date, assignment_id: int) -> str:
+    """Opaque cursor for the position after (assigned_date, id)."""
+    raw = f"{assigned_date.isoformat()}:{assignment_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    """Inverse of encode_cursor. Raises ValueError on anything it did not produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError(cursor) from exc
+    day, _, assignment_id = raw.partition(":")
+    return date.fromisoformat(day), int(assignment_id)
+
+
+@router.get("", response_model=AssignmentPageResponse)
+def get_assignments(
+    cage_id: int | None = Query(default=None),
+    rack_id: int | None = Query(default=None),
+    professor_id: int | None = Query(default=None),
+    start: date | None = Query(default=None, description="배정 날짜 시작 (YYYY-MM-DD, 포함)"),
+    end: date | None = Query(default=None, description="배정 날짜 끝 (YYYY-MM-DD, 포함)"),
+    open_only: bool = Query(default=False, description="반납되지 않은 배정만"),
+    limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description="이전 응답의 next_cursor"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get assignment history, newest first, one page at a time.
+    Pages are keyed on (assigned_date, id) rather than an offset, so with a cage or
+    professor filter every page is a range scan on ix_assignments_cage_date or
+    ix_assignments_professor_date (ix_assignments_date without one) and a deep page
+    costs the same as the first. Ranges that start before the archive boundary
+    (or have no start) also read the archived months.
+    """
+    if start is not None and end is not None and start > end:
+        raise HTTPException(status_code=400, detail="시작 날짜가 종료 날짜보다 늦습니다.")
+
+    source = assignment_source(db, start)
+    query = select(source)
+    if cage_id is not None:
+        query = query.where(source.c.cage_id == cage_id)
+    if rack_id is not None:
+        query = query.where(source.c.cage_id.in_(select(Cage.id).where(Cage.rack_id == rack_id)))
+    if professor_id is not None:
+        query = query.where(source.c.professor_id == professor_id)
+    if start is not None:
+        query = query.where(source.c.assigned_date >= start)
+    if end is not None:
+        query = query.where(source.c.assigned_date <= end)
+    if open_only:
+        query = query.where(source.c.released_at.is_(None))
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+        query = query.where(tuple_(source.c.assigned_date, source.c.id) < after)
+
+    # Page first, then join display columns for just this page. Outer joins: archived
+    # rows have no foreign keys, and a page row must never drop out because its cage
+    # or professor is gone - that would end pagination early
+    page = (
+        query.order_by(source.c.assigned_date.desc(), source.c.id.desc())
+        .limit(limit + 1)
+        .subquery()
+    )
+    rows = db.execute(
+        select(
+            page.c.id,
+            page.c.cage_id,
+            Cage.rack_id,
+            Rack.name.label("rack_name"),
+            Cage.position,
+            page.c.professor_id,
+            Professor.name.label("professor_name"),
+            page.c.assigned_date,
+            page.c.assigned_at,
+            page.c.released_at,
+            page.c.cost,
+        )
+        .select_from(page)
+        .outerjoin(Cage, Cage.id == page.c.cage_id)
+        .outerjoin(Rack, Rack.id == Cage.rack_id)
+        .outerjoin(Professor, Professor.id == page.c.professor_id)
+        .order_by(page.c.assigned_date.desc(), page.c.id.desc())
+    ).all()
+
+    # Every page row survives the outer joins, so the extra row still means another page
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].assigned_date, rows[-1].id)
+
+    return {
+        "assignments": [row._asdict() for row in rows],
+        "next_cursor": next_cursor,
+    }
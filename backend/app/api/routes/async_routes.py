@@ -0,0 +1,85 @@
+"""Async variants of the hot endpoints, served ahead of the sync routes when DB_MODE=async.
+
+Handlers await an AsyncSession instead of holding a threadpool thread while the
+database works, so concurrency is bounded by the connection pool. Endpoint logic
+is shared with the sync routes through AsyncSession.run_sync, which runs it on
+the session's greenlet rather than in a worker thread.
+"""
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes import cages, dashboard, racks
+from app.database import get_async_db
+from app.schemas import (
+    AssignRequest,
+    BulkCageRequest,
+    BulkCageResponse,
+    CageActionResponse,
+    CageGridCompactResponse,
+    CageGridResponse,
+    DashboardSummaryResponse,
+    RackListResponse,
+    ReleaseRequest,
+)
+
+router = APIRouter()
+
+
+@router.get("/cages/rack/{rack_id}", response_model=CageGridResponse | CageGridCompactResponse, tags=["cages"])
+async def get_cage_grid(
+    rack_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+    format: Literal["full", "compact"] | None = Query(default=None, description="compact: 행 우선 배열 + 교수 팔레트"),
+    accept: str | None = Header(default=None),
+):
+    """Get all cages for a specific rack as a grid."""
+    return await db.run_sync(
+        lambda session: cages.get_cage_grid(rack_id, response, if_none_match, session, format, accept)
+    )
+
+
+@router.post("/cages/{cage_id}/assign", response_model=CageActionResponse, tags=["cages"])
+async def assign_cage(
+    cage_id: int,
+    request: AssignRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Assign a cage to a professor."""
+    return await db.run_sync(lambda session: cages.assign_cage(cage_id, request, session))
+
+
+@router.post("/cages/{cage_id}/release", response_model=CageActionResponse, tags=["cages"])
+async def release_cage(
+    cage_id: int,
+    request: ReleaseRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Release a cage (remove professor assignment)."""
+    return await db.run_sync(lambda session: cages.release_cage(cage_id, request, session))
+
+
+@router.post("/cages/bulk", response_model=BulkCageResponse, tags=["cages"])
+async def bulk_update_cages(
+    request: BulkCageRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Assign/release many cages in one transaction."""
+    return await db.run_sync(lambda session: cages.bulk_update_cages(request, response, session))
+
+
+@router.get("/racks", response_model=RackListResponse, tags=["racks"])
+async def get_racks(db: AsyncSession = Depends(get_async_db)):
+    """Get all racks ordered by display_order with assigned cage count."""
+    return await db.run_sync(racks.get_racks)
+
+
+@router.get("/dashboard/summary", response_model=DashboardSummaryResponse, tags=["dashboard"])
+async def get_dashboard_summary(db: AsyncSession = Depends(get_async_db)):
+    """Get rack usage summary for dashboard."""
+    return await db.run_sync(dashboard.get_dashboard_summary)
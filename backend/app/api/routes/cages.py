@@ -1,22 +1,68 @@
 """Cage API routes with Optimistic Locking."""
 
+import json
 from datetime import date, datetime
+from itertools import groupby
+from typing import Iterable, Iterator, Literal, NamedTuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import ColumnElement, and_, bindparam, insert, or_, select, tuple_, update
 from sqlalchemy.orm import Session, joinedload
 
+from app.api.fast_json import encode_json, json_payload
+from app.config import get_settings
 from app.database import get_db
 from app.models import Assignment, Cage, Professor, Rack
 from app.schemas import (
     AssignRequest,
+    BulkCageOperation,
+    BulkCageRequest,
+    BulkCageResponse,
+    BulkCageResult,
     CageActionResponse,
+    CageGridCompactResponse,
+    CageGridListResponse,
     CageGridResponse,
     CageResponse,
+    ProfessorInfo,
     ReleaseRequest,
 )
+from app.services import (
+    adjust_professor_occupancy,
+    adjust_rack_occupancy,
+    bump_data_version,
+    change_feed,
+    change_seq,
+    charge_new_assignments,
+    etag_matches,
+    publish_cage_changes,
+    rack_etag,
+)
 
 router = APIRouter(prefix="/cages", tags=["cages"])
 
+GRID_STREAM_BATCH_SIZE = 2000
+
+# Cell columns shared by the grid endpoints, in the order the payload builders unpack them
+_GRID_CELL_COLUMNS = (
+    Cage.id,
+    Cage.position,
+    Cage.row_index,
+    Cage.col_index,
+    Cage.version,
+    Professor.id,
+    Professor.name,
+    Professor.color_code,
+    Assignment.assigned_at,
+)
+
+# Join a cage to its current assignment on the full key, so PostgreSQL prunes to one partition
+_CURRENT_ASSIGNMENT_JOIN = and_(
+    Assignment.id == Cage.current_assignment_id,
+    Assignment.assigned_date == Cage.current_assignment_date,
+)
+
 
 def get_cage_response(cage: Cage) -> CageResponse:
     """Convert Cage model to CageResponse."""
@@ -28,56 +74,403 @@ def get_cage_response(cage: Cage) -> CageResponse:
         col_index=cage.col_index,
         version=cage.version,
         current_professor=cage.current_professor,
+        assigned_since=cage.current_assignment.assigned_at if cage.current_assignment else None,
     )
 
 
-@router.get("/rack/{rack_id}", response_model=CageGridResponse)
-def get_cage_grid(rack_id: int, db: Session = Depends(get_db)):
-    """Get all cages for a specific rack as a grid."""
+COMPACT_GRID_MEDIA_TYPE = "application/vnd.mslab.cage-grid.compact+json"
+
+
+def wants_compact_grid(format: str | None, accept: str | None) -> bool:
+    """Whether a grid request asks for the compact representation (query param wins)."""
+    if format is not None:
+        return format == "compact"
+    return accept is not None and COMPACT_GRID_MEDIA_TYPE in accept
+
+
+@router.get("/rack/{rack_id}", response_model=CageGridResponse | CageGridCompactResponse)
+def get_cage_grid(
+    rack_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+    format: Literal["full", "compact"] | None = Query(default=None, description="compact: 행 우선 배열 + 교수 팔레트"),
+    accept: str | None = Header(default=None),
+):
+    """
+    Get all cages for a specific rack as a grid.
+    Supports conditional GET - returns 304 if the rack's ETag is unchanged.
+    The compact representation is chosen with ?format=compact or
+    Accept: application/vnd.mslab.cage-grid.compact+json.
+    """
     rack = db.query(Rack).filter(Rack.id == rack_id).first()
     if not rack:
         raise HTTPException(status_code=404, detail="Rack not found")
 
-    cages = (
-        db.query(Cage)
-        .options(joinedload(Cage.current_professor))
-        .filter(Cage.rack_id == rack_id)
+    compact = wants_compact_grid(format, accept)
+
+    # Conditional GET: the rack generation changes on every grid mutation
+    etag = rack_etag(rack, "compact" if compact else None)
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    response.headers.update(cache_headers)
+    # Feed position before reading cages, so a subscriber resuming here misses nothing
+    response.headers["X-Change-Token"] = change_feed.token(change_feed.last_seq)
+
+    cells = db.execute(
+        select(*_GRID_CELL_COLUMNS)
+        .outerjoin(Professor, Professor.id == Cage.current_professor_id)
+        .outerjoin(Assignment, _CURRENT_ASSIGNMENT_JOIN)
+        .where(Cage.rack_id == rack_id)
         .order_by(Cage.row_index, Cage.col_index)
-        .all()
     )
+    build = _compact_grid_payload if compact else _grid_payload
+    return json_payload(build(rack.id, rack.name, rack.rows, rack.columns, cells), response)
 
-    # If no cages exist, create them
-    if not cages:
-        cages = create_cages_for_rack(db, rack)
 
-    return CageGridResponse(
-        rack_id=rack.id,
-        rack_name=rack.name,
-        rows=rack.rows,
-        columns=rack.columns,
-        cages=[get_cage_response(cage) for cage in cages],
+@router.get(
+    "/grid",
+    response_model=None,
+    responses={200: {"model": CageGridListResponse}},
+)
+def get_all_cage_grids(
+    rack_ids: list[int] | None = Query(default=None, description="조회할 랙 ID (반복 지정, 생략 시 전체 랙)"),
+    format: Literal["full", "compact"] | None = Query(default=None, description="compact: 행 우선 배열 + 교수 팔레트"),
+    accept: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+):
+    """
+    Get the grids of every rack (or of rack_ids) in display order.
+    One ordered joined query feeds the whole response, which is streamed rack by rack
+    as {"racks": [grid, ...]} with each grid shaped like the per-rack endpoint.
+    """
+    build = _compact_grid_payload if wants_compact_grid(format, accept) else _grid_payload
+    change_token = change_feed.token(change_feed.last_seq)
+
+    query = (
+        select(Rack.id, Rack.name, Rack.rows, Rack.columns, *_GRID_CELL_COLUMNS)
+        .join(Cage, Cage.rack_id == Rack.id)
+        .outerjoin(Professor, Professor.id == Cage.current_professor_id)
+        .outerjoin(Assignment, _CURRENT_ASSIGNMENT_JOIN)
+        .order_by(Rack.display_order, Rack.id, Cage.row_index, Cage.col_index)
+    )
+    if rack_ids:
+        query = query.where(Rack.id.in_(rack_ids))
+    rows = db.execute(query.execution_options(stream_results=True, yield_per=GRID_STREAM_BATCH_SIZE))
+
+    def stream_grids() -> Iterator[bytes]:
+        yield b'{"racks":['
+        for index, (rack, group) in enumerate(groupby(rows, key=lambda row: row[:4])):
+            payload = build(*rack, (row[4:] for row in group))
+            yield (b"," if index else b"") + encode_json(payload)
+        yield b"]}"
+
+    return StreamingResponse(
+        stream_grids(),
+        media_type="application/json",
+        headers={"Cache-Control": "no-cache", "Vary": "Accept", "X-Change-Token": change_token},
     )
 
 
-def create_cages_for_rack(db: Session, rack: Rack) -> list[Cage]:
-    """Create cages for a rack if they don't exist."""
-    cages = []
-    for row in range(rack.rows):
-        for col in range(rack.columns):
-            position = f"{chr(65 + row)}{col + 1}"  # A1, A2, ..., B1, B2, ...
-            cage = Cage(
-                rack_id=rack.id,
-                position=position,
-                row_index=row,
-                col_index=col,
-                version=1,
+def _grid_payload(rack_id: int, rack_name: str, rows: int, columns: int, cells: Iterable[tuple]) -> dict:
+    """Build the CageGridResponse payload from cell tuples, mirroring its field order."""
+    return {
+        "rack_id": rack_id,
+        "rack_name": rack_name,
+        "rows": rows,
+        "columns": columns,
+        "cages": [
+            {
+                "id": cage_id,
+                "rack_id": rack_id,
+                "position": position,
+                "row_index": row_index,
+                "col_index": col_index,
+                "version": version,
+                "current_professor": (
+                    {"id": professor_id, "name": name, "color_code": color_code}
+                    if professor_id is not None
+                    else None
+                ),
+                "assigned_since": assigned_at.isoformat() if assigned_at is not None else None,
+            }
+            for cage_id, position, row_index, col_index, version, professor_id, name, color_code, assigned_at in cells
+        ],
+    }
+
+
+def _compact_grid_payload(rack_id: int, rack_name: str, rows: int, columns: int, cells: Iterable[tuple]) -> dict:
+    """Build the CageGridCompactResponse payload from cell tuples."""
+    cell_count = rows * columns
+    cage_ids: list[int | None] = [None] * cell_count
+    versions: list[int | None] = [None] * cell_count
+    professor_ids: list[int | None] = [None] * cell_count
+    assigned_since: list[str | None] = [None] * cell_count
+    palette: dict[int, dict] = {}
+    for cage_id, _, row_index, col_index, version, professor_id, name, color_code, assigned_at in cells:
+        cell = row_index * columns + col_index
+        cage_ids[cell] = cage_id
+        versions[cell] = version
+        professor_ids[cell] = professor_id
+        if assigned_at is not None:
+            assigned_since[cell] = assigned_at.isoformat()
+        if professor_id is not None and professor_id not in palette:
+            palette[professor_id] = {"id": professor_id, "name": name, "color_code": color_code}
+    return {
+        "format": "compact",
+        "rack_id": rack_id,
+        "rack_name": rack_name,
+        "rows": rows,
+        "columns": columns,
+        "cage_ids": cage_ids,
+        "versions": versions,
+        "professor_ids": professor_ids,
+        "assigned_since": assigned_since,
+        "professors": list(palette.values()),
+    }
+
+
+def _sse_message(event: str, token: str, data: dict) -> str:
+    """Format a server-sent event."""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"id: {token}\nevent: {event}\ndata: {payload}\n\n"
+
+
+@router.get("/stream")
+async def stream_cage_changes(
+    request: Request,
+    rack_id: int | None = Query(default=None, description="구독할 랙 ID (생략 시 전체 랙)"),
+    since: str | None = Query(default=None, description="재개 토큰 (X-Change-Token 또는 마지막 이벤트 ID)"),
+    last_event_id: str | None = Header(default=None),
+):
+    """
+    Stream committed cage changes as server-sent events.
+    Reconnects resume from Last-Event-ID (or `since`); a `reset` event tells the
+    client its token is too old to replay and the grid must be refetched.
+    """
+    settings = get_settings()
+    token = last_event_id or since
+    start = change_feed.parse_token(token)
+    needs_reset = token is not None and start is None
+    if start is None:
+        start = change_feed.last_seq
+
+    async def event_stream():
+        if needs_reset:
+            yield _sse_message("reset", change_feed.token(start), {})
+        try:
+            async for batch in change_feed.subscribe(start, settings.change_feed_keepalive_seconds):
+                if await request.is_disconnected():
+                    break
+                if batch is None:
+                    yield ": keepalive\n\n"
+                    continue
+                for event in batch:
+                    if rack_id is not None and event.rack_id not in (None, rack_id):
+                        continue
+                    yield _sse_message(
+                        event.type,
+                        change_feed.token(event.seq),
+                        {"rack_id": event.rack_id, **event.data},
+                    )
+        except LookupError:
+            yield _sse_message("reset", change_feed.token(change_feed.last_seq), {})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+class _CageSwap(NamedTuple):
+    """New cage state after a successful compare-and-swap, plus who held it before."""
+    id: int
+    rack_id: int
+    position: str
+    row_index: int
+    col_index: int
+    version: int
+    previous_professor_id: int | None
+    previous_professor_name: str | None
+    previous_assignment_id: int | None
+    previous_assignment_date: date | None
+
+    @property
+    def previous_assignment(self) -> tuple[int, date] | None:
+        """Full key of the assignment the swap replaced, if any."""
+        if self.previous_assignment_id is None:
+            return None
+        return self.previous_assignment_id, self.previous_assignment_date
+
+
+def _swap_cage(
+    db: Session,
+    cage_id: int,
+    version: int,
+    professor_id: int | None,
+    *conditions: ColumnElement[bool],
+) -> _CageSwap | None:
+    """
+    Atomically set a cage's professor if its version still matches, clearing its
+    current assignment pointer. Returns None if the version (or any extra condition)
+    no longer holds.
+    """
+    values = {
+        "current_professor_id": professor_id,
+        "current_assignment_id": None,
+        "current_assignment_date": None,
+        "version": Cage.version + 1,
+        "change_seq": change_seq(db),
+    }
+
+    if db.get_bind().dialect.name == "postgresql":
+        # One round trip: lock the row, check and update it, return old and new state
+        old = (
+            select(
+                Cage.id,
+                Cage.current_professor_id.label("previous_professor_id"),
+                Professor.name.label("previous_professor_name"),
+                Cage.current_assignment_id.label("previous_assignment_id"),
+                Cage.current_assignment_date.label("previous_assignment_date"),
             )
-            db.add(cage)
-            cages.append(cage)
-    db.commit()
-    for cage in cages:
-        db.refresh(cage)
-    return cages
+            .outerjoin(Professor, Professor.id == Cage.current_professor_id)
+            .where(Cage.id == cage_id)
+            .with_for_update(of=Cage)
+            .subquery("old")
+        )
+        row = db.execute(
+            update(Cage)
+            .where(Cage.id == old.c.id, Cage.version == version, *conditions)
+            .values(**values)
+            .returning(
+                Cage.id,
+                Cage.rack_id,
+                Cage.position,
+                Cage.row_index,
+                Cage.col_index,
+                Cage.version,
+                old.c.previous_professor_id,
+                old.c.previous_professor_name,
+                old.c.previous_assignment_id,
+                old.c.previous_assignment_date,
+            )
+        ).first()
+        return _CageSwap(*row) if row else None
+
+    # SQLite cannot RETURNING from joined tables: read the old state, then CAS on version.
+    # The version guard makes the pair atomic - a concurrent write leaves rowcount at 0.
+    old = db.execute(
+        select(
+            Cage.rack_id,
+            Cage.position,
+            Cage.row_index,
+            Cage.col_index,
+            Cage.current_professor_id,
+            Professor.name,
+            Cage.current_assignment_id,
+            Cage.current_assignment_date,
+        )
+        .outerjoin(Professor, Professor.id == Cage.current_professor_id)
+        .where(Cage.id == cage_id, Cage.version == version, *conditions)
+    ).first()
+    if old is None:
+        return None
+    result = db.execute(
+        update(Cage)
+        .where(Cage.id == cage_id, Cage.version == version)
+        .values(**values)
+    )
+    if result.rowcount != 1:
+        return None
+    return _CageSwap(cage_id, old[0], old[1], old[2], old[3], version + 1, old[4], old[5], old[6], old[7])
+
+
+def _swap_response(
+    swap: _CageSwap,
+    professor: ProfessorInfo | None,
+    assigned_since: datetime | None = None,
+) -> CageResponse:
+    """Build the CageResponse for a swapped cage without reloading it."""
+    return CageResponse(
+        id=swap.id,
+        rack_id=swap.rack_id,
+        position=swap.position,
+        row_index=swap.row_index,
+        col_index=swap.col_index,
+        version=swap.version,
+        current_professor=professor,
+        assigned_since=assigned_since,
+    )
+
+
+def _open_assignment(db: Session, cage_id: int, professor_id: int, assigned_at: datetime) -> int:
+    """Insert a cage's new assignment and point the (already swapped) cage at it."""
+    # Using a dummy user_id=1 for now (will be replaced with actual auth later)
+    assignment_id = db.scalar(
+        insert(Assignment)
+        .values(
+            cage_id=cage_id,
+            professor_id=professor_id,
+            assigned_by_user_id=1,
+            assigned_date=assigned_at.date(),
+            assigned_at=assigned_at,
+            cost=800,
+        )
+        .returning(Assignment.id)
+    )
+    db.execute(
+        update(Cage)
+        .where(Cage.id == cage_id)
+        .values(current_assignment_id=assignment_id, current_assignment_date=assigned_at.date())
+    )
+    return assignment_id
+
+
+def _close_assignments(
+    db: Session,
+    cages: list[tuple[int, tuple[int, date] | None]],
+    released_at: datetime,
+) -> None:
+    """
+    Set released_at on cages' current assignments, given (cage_id, pointer key) pairs.
+    Pointed assignments are found by full key (id, assigned_date); a held cage without
+    a pointer (data predating it) has every open assignment of the cage closed instead.
+    Must run before the cages' new assignments are inserted.
+    """
+    keys = [key for _, key in cages if key is not None]
+    unpointed = [cage_id for cage_id, key in cages if key is None]
+    if keys:
+        db.execute(
+            update(Assignment)
+            .where(
+                # The plain date filter lets PostgreSQL prune partitions before matching keys
+                Assignment.assigned_date.in_({assigned_date for _, assigned_date in keys}),
+                tuple_(Assignment.id, Assignment.assigned_date).in_(keys),
+                Assignment.released_at.is_(None),
+            )
+            .values(released_at=released_at)
+        )
+    if unpointed:
+        db.execute(
+            update(Assignment)
+            .where(Assignment.cage_id.in_(unpointed), Assignment.released_at.is_(None))
+            .values(released_at=released_at)
+        )
+
+
+def _get_cage_or_raise(db: Session, cage_id: int, version: int) -> Cage:
+    """Explain a failed swap: 404 if the cage is gone, 409 if its version moved on."""
+    cage = db.query(Cage).filter(Cage.id == cage_id).first()
+    if not cage:
+        raise HTTPException(status_code=404, detail="Cage not found")
+    if cage.version != version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Version mismatch. The cage has been modified by another user.",
+        )
+    return cage
 
 
 @router.post("/{cage_id}/assign", response_model=CageActionResponse)
@@ -89,57 +482,61 @@ def assign_cage(
     """
     Assign a cage to a professor.
     Uses Optimistic Locking - returns 409 if version mismatch.
+    The version check and update run as one compare-and-swap statement; the new
+    assignment is inserted only after it succeeds, in the same transaction.
     """
-    cage = (
-        db.query(Cage)
-        .options(joinedload(Cage.current_professor))
-        .filter(Cage.id == cage_id)
-        .first()
-    )
-    if not cage:
-        raise HTTPException(status_code=404, detail="Cage not found")
+    professor = db.query(Professor).filter(Professor.id == request.professor_id).first()
 
-    # Optimistic Locking check
-    if cage.version != request.version:
+    swap = None
+    if professor:
+        swap = _swap_cage(
+            db,
+            cage_id,
+            request.version,
+            request.professor_id,
+            or_(
+                Cage.current_professor_id.is_(None),
+                Cage.current_professor_id != request.professor_id,
+            ),
+        )
+    if swap is None:
+        # Slow path: work out why the swap did not apply
+        cage = _get_cage_or_raise(db, cage_id, request.version)
+        if not professor:
+            raise HTTPException(status_code=404, detail="Professor not found")
+        if cage.current_professor_id == request.professor_id:
+            raise HTTPException(
+                status_code=400,
+                detail="Cage is already assigned to this professor",
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Version mismatch. The cage has been modified by another user.",
         )
 
-    # Check if professor exists
-    professor = db.query(Professor).filter(Professor.id == request.professor_id).first()
-    if not professor:
-        raise HTTPException(status_code=404, detail="Professor not found")
-
-    # Check if already assigned to same professor
-    if cage.current_professor_id == request.professor_id:
-        raise HTTPException(
-            status_code=400,
-            detail="Cage is already assigned to this professor",
-        )
+    # Reassigning an occupied cage leaves the rack counter unchanged
+    adjust_rack_occupancy(db, swap.rack_id, 1 if swap.previous_professor_id is None else 0)
+    professor_deltas = {request.professor_id: 1}
+    if swap.previous_professor_id is not None:
+        professor_deltas[swap.previous_professor_id] = -1
+    adjust_professor_occupancy(db, professor_deltas)
 
-    # Update cage
-    cage.current_professor_id = request.professor_id
-    cage.version += 1
+    now = datetime.now()
+    if swap.previous_professor_id is not None:
+        # Close the previous professor's assignment so it stops accruing
+        _close_assignments(db, [(swap.id, swap.previous_assignment)], now)
+    assignment_id = _open_assignment(db, swap.id, request.professor_id, now)
+    charge_new_assignments(db, now.date(), [assignment_id])
 
-    # Create assignment record
-    # Using a dummy user_id=1 for now (will be replaced with actual auth later)
-    assignment = Assignment(
-        cage_id=cage.id,
-        professor_id=request.professor_id,
-        assigned_by_user_id=1,
-        assigned_date=date.today(),
-        assigned_at=datetime.now(),
-        cost=800,
-    )
-    db.add(assignment)
+    cage_response = _swap_response(swap, ProfessorInfo.model_validate(professor), now)
     db.commit()
-    db.refresh(cage)
+    bump_data_version()
+    publish_cage_changes([cage_response])
 
     return CageActionResponse(
         success=True,
-        message=f"Cage {cage.position} assigned to {professor.name}",
-        cage=get_cage_response(cage),
+        message=f"Cage {swap.position} assigned to {cage_response.current_professor.name}",
+        cage=cage_response,
     )
 
 
@@ -152,50 +549,217 @@ def release_cage(
     """
     Release a cage (remove professor assignment).
     Uses Optimistic Locking - returns 409 if version mismatch.
+    The version check and update run as one compare-and-swap statement.
     """
-    cage = (
-        db.query(Cage)
-        .options(joinedload(Cage.current_professor))
-        .filter(Cage.id == cage_id)
-        .first()
+    swap = _swap_cage(db, cage_id, request.version, None, Cage.current_professor_id.isnot(None))
+    if swap is None:
+        _get_cage_or_raise(db, cage_id, request.version)
+        raise HTTPException(status_code=400, detail="Cage is not assigned")
+
+    # Mark the current assignment as released
+    _close_assignments(db, [(swap.id, swap.previous_assignment)], datetime.now())
+    adjust_rack_occupancy(db, swap.rack_id, -1)
+    adjust_professor_occupancy(db, {swap.previous_professor_id: -1})
+    db.commit()
+    bump_data_version()
+
+    cage_response = _swap_response(swap, None)
+    publish_cage_changes([cage_response])
+
+    old_professor_name = swap.previous_professor_name or "Unknown"
+    return CageActionResponse(
+        success=True,
+        message=f"Cage {swap.position} released (was assigned to {old_professor_name})",
+        cage=cage_response,
     )
-    if not cage:
-        raise HTTPException(status_code=404, detail="Cage not found")
 
-    # Optimistic Locking check
-    if cage.version != request.version:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Version mismatch. The cage has been modified by another user.",
-        )
 
-    # Check if actually assigned
-    if cage.current_professor_id is None:
-        raise HTTPException(status_code=400, detail="Cage is not assigned")
+def _check_bulk_operation(
+    operation: BulkCageOperation,
+    cage: Cage | None,
+    professors: dict[int, Professor],
+) -> tuple[int, str] | None:
+    """Validate one bulk operation against the locked cage state. Returns (status, message) on failure."""
+    if cage is None:
+        return 404, "Cage not found"
+    if cage.version != operation.version:
+        return status.HTTP_409_CONFLICT, "Version mismatch. The cage has been modified by another user."
+    if operation.action == "assign":
+        if operation.professor_id is None:
+            return 400, "professor_id is required for assign"
+        if operation.professor_id not in professors:
+            return 404, "Professor not found"
+        if cage.current_professor_id == operation.professor_id:
+            return 400, "Cage is already assigned to this professor"
+    elif cage.current_professor_id is None:
+        return 400, "Cage is not assigned"
+    return None
+
+
+@router.post("/bulk", response_model=BulkCageResponse)
+def bulk_update_cages(
+    request: BulkCageRequest,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """
+    Assign/release many cages in one transaction.
+    All version checks run in one statement; in all_or_nothing mode any failure
+    rejects the whole request with 409, in best_effort mode valid operations are applied.
+    """
+    cage_ids = [operation.cage_id for operation in request.operations]
+    if len(set(cage_ids)) != len(cage_ids):
+        raise HTTPException(status_code=400, detail="Each cage may appear only once per request")
+
+    # Lock and check every target cage in one statement
+    cages = {
+        cage.id: cage
+        for cage in db.scalars(
+            select(Cage)
+            .options(joinedload(Cage.current_professor), joinedload(Cage.current_assignment))
+            .where(Cage.id.in_(cage_ids))
+            .with_for_update(of=Cage)
+        ).unique()
+    }
+    professor_ids = {op.professor_id for op in request.operations if op.professor_id is not None}
+    professors = {
+        professor.id: professor
+        for professor in db.scalars(select(Professor).where(Professor.id.in_(professor_ids)))
+    } if professor_ids else {}
+
+    failures: dict[int, tuple[int, str]] = {}
+    valid: list[BulkCageOperation] = []
+    for operation in request.operations:
+        failure = _check_bulk_operation(operation, cages.get(operation.cage_id), professors)
+        if failure:
+            failures[operation.cage_id] = failure
+        else:
+            valid.append(operation)
 
-    # Get current assignment and mark as released
-    current_assignment = (
-        db.query(Assignment)
-        .filter(
-            Assignment.cage_id == cage.id,
-            Assignment.professor_id == cage.current_professor_id,
-            Assignment.released_at.is_(None),
+    if failures and request.mode == "all_or_nothing":
+        valid = []
+
+    if valid:
+        now = datetime.now()
+        today = now.date()
+        rack_deltas: dict[int, int] = {}
+        professor_deltas: dict[int, int] = {}
+        released = []
+        new_assignments = []
+        for operation in valid:
+            cage = cages[operation.cage_id]
+            if cage.current_professor_id is not None:
+                pointer = (
+                    (cage.current_assignment_id, cage.current_assignment_date)
+                    if cage.current_assignment_id is not None
+                    else None
+                )
+                released.append((cage.id, pointer))
+                professor_deltas[cage.current_professor_id] = professor_deltas.get(cage.current_professor_id, 0) - 1
+            if operation.action == "assign":
+                delta = 1 if cage.current_professor_id is None else 0
+                professor_deltas[operation.professor_id] = professor_deltas.get(operation.professor_id, 0) + 1
+                new_assignments.append({
+                    "cage_id": cage.id,
+                    "professor_id": operation.professor_id,
+                    "assigned_by_user_id": 1,
+                    "assigned_date": today,
+                    "assigned_at": now,
+                    "cost": 800,
+                })
+            else:
+                delta = -1
+            rack_deltas[cage.rack_id] = rack_deltas.get(cage.rack_id, 0) + delta
+
+        # Close the replaced assignments, then open the new ones so the swap can point each cage at its own
+        _close_assignments(db, released, now)
+        assignment_ids: dict[int, int] = {}
+        if new_assignments:
+            assignment_ids = dict(
+                db.execute(insert(Assignment).returning(Assignment.cage_id, Assignment.id), new_assignments).all()
+            )
+
+        # Compare-and-swap every cage in one executemany
+        cage_table = Cage.__table__
+        result = db.execute(
+            update(cage_table)
+            .where(
+                cage_table.c.id == bindparam("b_id"),
+                cage_table.c.version == bindparam("b_version"),
+            )
+            .values(
+                current_professor_id=bindparam("b_professor_id"),
+                current_assignment_id=bindparam("b_assignment_id"),
+                current_assignment_date=bindparam("b_assignment_date"),
+                version=cage_table.c.version + 1,
+                change_seq=change_seq(db),
+            ),
+            [
+                {
+                    "b_id": op.cage_id,
+                    "b_version": op.version,
+                    "b_professor_id": op.professor_id if op.action == "assign" else None,
+                    "b_assignment_id": assignment_ids.get(op.cage_id),
+                    "b_assignment_date": today if op.cage_id in assignment_ids else None,
+                }
+                for op in valid
+            ],
         )
-        .first()
-    )
-    if current_assignment:
-        current_assignment.released_at = datetime.now()
+        if db.get_bind().dialect.supports_sane_multi_rowcount and result.rowcount != len(valid):
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Version mismatch. Cages were modified by another user during the request.",
+            )
 
-    # Update cage
-    old_professor_name = cage.current_professor.name if cage.current_professor else "Unknown"
-    cage.current_professor_id = None
-    cage.version += 1
+        if new_assignments:
+            charge_new_assignments(db, today, list(assignment_ids.values()))
 
-    db.commit()
-    db.refresh(cage)
+        for rack_id, delta in rack_deltas.items():
+            adjust_rack_occupancy(db, rack_id, delta)
+        adjust_professor_occupancy(db, professor_deltas)
 
-    return CageActionResponse(
-        success=True,
-        message=f"Cage {cage.position} released (was assigned to {old_professor_name})",
-        cage=get_cage_response(cage),
+        db.commit()
+        bump_data_version()
+
+        # Reload the committed state of all requested cages
+        cages = {
+            cage.id: cage
+            for cage in db.scalars(
+                select(Cage)
+                .options(joinedload(Cage.current_professor), joinedload(Cage.current_assignment))
+                .where(Cage.id.in_(cage_ids))
+                .execution_options(populate_existing=True)
+            ).unique()
+        }
+        publish_cage_changes([get_cage_response(cages[op.cage_id]) for op in valid])
+
+    applied = {op.cage_id for op in valid}
+    results = []
+    for operation in request.operations:
+        cage = cages.get(operation.cage_id)
+        if operation.cage_id in applied:
+            status_code = 200
+            message = f"Cage {cage.position} {'assigned' if operation.action == 'assign' else 'released'}"
+        elif operation.cage_id in failures:
+            status_code, message = failures[operation.cage_id]
+        else:
+            status_code, message = status.HTTP_409_CONFLICT, "Not applied because another operation failed"
+        results.append(
+            BulkCageResult(
+                cage_id=operation.cage_id,
+                success=operation.cage_id in applied,
+                status_code=status_code,
+                message=message,
+                cage=get_cage_response(cage) if cage else None,
+            )
+        )
+
+    if failures and not valid:
+        response.status_code = status.HTTP_409_CONFLICT
+    return BulkCageResponse(
+        success=not failures,
+        message=f"{len(applied)} of {len(request.operations)} operations applied",
+        applied_count=len(applied),
+        results=results,
     )
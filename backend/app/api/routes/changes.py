@@ -0,0 +1,67 @@
+"""Delta sync API route - rows changed since a global change sequence number."""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import get_db
+from app.models import Cage, ChangeTombstone, Professor, Rack
+from app.schemas import ChangesResponse
+from app.services import current_change_seq
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+
+@router.get("", response_model=ChangesResponse)
+def get_changes(
+    since: int | None = Query(default=None, ge=0, description="마지막으로 동기화한 변경 번호 (생략 시 현재 번호만 반환)"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get cages, racks and professors changed after `since`, plus deletions.
+    Each table is read with a range scan on its change_seq index. Without `since`,
+    only the current sequence number is returned, as a starting point before a full load.
+    `since=0` is a full load: rows never changed since they were seeded or migrated
+    carry change_seq 0 and are included.
+    """
+    seq = current_change_seq(db)
+    if since is None or since == seq != 0:
+        return {"seq": seq}
+    if since > seq:
+        # Client state comes from another database (e.g. restored or reseeded)
+        return {"seq": seq, "reset": True}
+
+    limit = get_settings().change_sync_max_rows
+
+    def changed(columns, change_seq):
+        return db.execute(
+            select(*columns)
+            .where(change_seq >= since if since == 0 else change_seq > since, change_seq <= seq)
+            .order_by(change_seq)
+            .limit(limit + 1)
+        ).all()
+
+    cages = changed(
+        (Cage.id, Cage.rack_id, Cage.position, Cage.row_index, Cage.col_index, Cage.version, Cage.current_professor_id),
+        Cage.change_seq,
+    )
+    racks = changed(
+        (Rack.name, Rack.rows, Rack.columns, Rack.display_order, Rack.id, Rack.assigned_count),
+        Rack.change_seq,
+    )
+    professors = changed(
+        (Professor.name, Professor.student_name, Professor.contact, Professor.color_code, Professor.id),
+        Professor.change_seq,
+    )
+    deleted = changed((ChangeTombstone.entity, ChangeTombstone.entity_id), ChangeTombstone.change_seq)
+    if len(cages) + len(racks) + len(professors) + len(deleted) > limit:
+        return {"seq": seq, "reset": True}
+
+    return {
+        "seq": seq,
+        "cages": [row._asdict() for row in cages],
+        "racks": [row._asdict() for row in racks],
+        "professors": [row._asdict() for row in professors],
+        "deleted": [{"type": entity, "id": entity_id} for entity, entity_id in deleted],
+    }
@@ -4,20 +4,18 @@ from datetime import date, timedelta
 from typing import Literal
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.api.fast_json import json_payload
 from app.database import get_db
-from app.models import Assignment, Cage, Professor, Rack
+from app.models import DailyProfessorUsage, Professor, Rack
 from app.schemas import (
-    DailyCost,
     DashboardCostsResponse,
     DashboardProfessorsResponse,
     DashboardSummaryResponse,
-    ProfessorCostSummary,
-    ProfessorUsage,
-    RackSummary,
 )
+from app.services import response_cache
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -26,75 +24,87 @@ COST_PER_CAGE_DAY = 800
 
 @router.get("/summary", response_model=DashboardSummaryResponse)
 def get_dashboard_summary(db: Session = Depends(get_db)):
-    """Get rack usage summary for dashboard."""
-    racks = db.query(Rack).order_by(Rack.display_order).all()
+    """Get rack usage summary for dashboard. Served from the response cache between writes."""
+    return json_payload(response_cache.get_or_compute(("dashboard.summary",), lambda: _build_summary(db)))
+
+
+def _build_summary(db: Session) -> dict:
+    """Compute the rack usage summary (DashboardSummaryResponse payload)."""
+    racks = db.execute(
+        select(Rack.id, Rack.name, Rack.rows, Rack.columns, Rack.assigned_count)
+        .order_by(Rack.display_order)
+    ).all()
 
     rack_summaries = []
     total_cages = 0
     total_used = 0
 
-    for rack in racks:
-        cage_count = rack.rows * rack.columns
-        used_count = (
-            db.query(Cage)
-            .filter(Cage.rack_id == rack.id, Cage.current_professor_id.isnot(None))
-            .count()
-        )
+    for rack_id, rack_name, rows, columns, used_count in racks:
+        cage_count = rows * columns
         available_count = cage_count - used_count
-        usage_rate = (used_count / cage_count * 100) if cage_count > 0 else 0
-
-        rack_summaries.append(
-            RackSummary(
-                rack_id=rack.id,
-                rack_name=rack.name,
-                total_cages=cage_count,
-                used_cages=used_count,
-                available_cages=available_count,
-                usage_rate=round(usage_rate, 1),
-            )
-        )
+        usage_rate = (used_count / cage_count * 100) if cage_count > 0 else 0.0
+
+        rack_summaries.append({
+            "rack_id": rack_id,
+            "rack_name": rack_name,
+            "total_cages": cage_count,
+            "used_cages": used_count,
+            "available_cages": available_count,
+            "usage_rate": round(usage_rate, 1),
+        })
 
         total_cages += cage_count
         total_used += used_count
 
     total_available = total_cages - total_used
-    overall_usage_rate = (total_used / total_cages * 100) if total_cages > 0 else 0
-
-    return DashboardSummaryResponse(
-        total_racks=len(racks),
-        total_cages=total_cages,
-        total_used=total_used,
-        total_available=total_available,
-        overall_usage_rate=round(overall_usage_rate, 1),
-        racks=rack_summaries,
-    )
+    overall_usage_rate = (total_used / total_cages * 100) if total_cages > 0 else 0.0
 
+    return {
+        "total_racks": len(racks),
+        "total_cages": total_cages,
+        "total_used": total_used,
+        "total_available": total_available,
+        "overall_usage_rate": round(overall_usage_rate, 1),
+        "racks": rack_summaries,
+    }
 
-@router.get("/professors", response_model=DashboardProfessorsResponse)
-def get_dashboard_professors(db: Session = Depends(get_db)):
-    """Get professor cage usage for dashboard."""
-    professors = db.query(Professor).order_by(Professor.name).all()
-
-    professor_usages = []
-    for professor in professors:
-        cage_count = (
-            db.query(Cage)
-            .filter(Cage.current_professor_id == professor.id)
-            .count()
-        )
-        professor_usages.append(
-            ProfessorUsage(
-                professor_id=professor.id,
-                professor_name=professor.name,
-                color_code=professor.color_code,
-                cage_count=cage_count,
-            )
-        )
 
-    # Sort by cage_count descending, then by name
-    professor_usages.sort(key=lambda x: (-x.cage_count, x.professor_name))
+@router.get("/professors", response_model=DashboardProfessorsResponse)
+def get_dashboard_professors(
+    limit: int | None = Query(default=None, ge=1, le=1000, description="페이지 크기 (생략 시 전체)"),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Get professor cage usage for dashboard. Served from the response cache between writes."""
+    return json_payload(response_cache.get_or_compute(
+        ("dashboard.professors", limit, offset),
+        lambda: _build_professors(db, limit, offset),
+    ))
+
+
+def _build_professors(db: Session, limit: int | None, offset: int) -> dict:
+    """Read current cage counts per professor, most cages first (DashboardProfessorsResponse payload).
+
+    One ordered read of the maintained counters along ix_professors_active_cage_count_name.
+    """
+    rows = db.execute(
+        select(Professor.id, Professor.name, Professor.color_code, Professor.active_cage_count)
+        .order_by(Professor.active_cage_count.desc(), Professor.name)
+        .limit(limit)
+        .offset(offset)
+    )
 
-    return DashboardProfessorsResponse(professors=professor_usages)
+    return {
+        "professors": [
+            {
+                "professor_id": professor_id,
+                "professor_name": professor_name,
+                "color_code": color_code,
+                "cage_count": cage_count,
+            }
+            for professor_id, professor_name, color_code, cage_count in rows
+        ]
+    }
 
 
 @router.get("/costs", response_model=DashboardCostsResponse)
@@ -102,9 +112,16 @@ def get_dashboard_costs(
     period: Literal["daily", "weekly", "monthly"] = Query(default="weekly"),
     db: Session = Depends(get_db),
 ):
-    """Get cost chart data for dashboard."""
+    """Get cost chart data for dashboard. Served from the response cache between writes."""
     today = date.today()
+    return json_payload(response_cache.get_or_compute(
+        ("dashboard.costs", period, today),
+        lambda: _build_costs(db, period, today),
+    ))
 
+
+def _build_costs(db: Session, period: str, today: date) -> dict:
+    """Compute cost chart data for the period ending today (DashboardCostsResponse payload)."""
     if period == "daily":
         start_date = today - timedelta(days=6)
     elif period == "weekly":
@@ -114,72 +131,62 @@ def get_dashboard_costs(
 
     end_date = today
 
-    # Get assignments in the date range
-    assignments = (
-        db.query(Assignment)
-        .filter(
-            Assignment.assigned_date >= start_date,
-            Assignment.assigned_date <= end_date,
+    # Pre-aggregated usage rows: days x professors, independent of assignment volume
+    usage_rows = db.execute(
+        select(
+            DailyProfessorUsage.usage_date,
+            DailyProfessorUsage.professor_id,
+            DailyProfessorUsage.cage_count,
+            Professor.name,
+            Professor.color_code,
         )
-        .all()
-    )
-
-    # Build professor lookup
-    professors = {p.id: p for p in db.query(Professor).all()}
-
-    # Build daily costs
-    daily_costs_map: dict[tuple[date, int], int] = {}
-    for assignment in assignments:
-        key = (assignment.assigned_date, assignment.professor_id)
-        daily_costs_map[key] = daily_costs_map.get(key, 0) + 1
+        .join(Professor, Professor.id == DailyProfessorUsage.professor_id)
+        .where(
+            DailyProfessorUsage.usage_date >= start_date,
+            DailyProfessorUsage.usage_date <= end_date,
+            DailyProfessorUsage.cage_count > 0,
+        )
+        .order_by(DailyProfessorUsage.usage_date, DailyProfessorUsage.professor_id)
+    ).all()
 
+    # Build daily costs and professor summaries
     daily_costs = []
-    for (assigned_date, professor_id), cage_count in sorted(daily_costs_map.items()):
-        professor = professors.get(professor_id)
-        if professor:
-            daily_costs.append(
-                DailyCost(
-                    date=assigned_date,
-                    professor_id=professor_id,
-                    professor_name=professor.name,
-                    color_code=professor.color_code,
-                    cage_count=cage_count,
-                    cost=cage_count * COST_PER_CAGE_DAY,
-                )
-            )
-
-    # Build professor summaries
-    professor_totals: dict[int, int] = {}
-    for assignment in assignments:
-        professor_totals[assignment.professor_id] = (
-            professor_totals.get(assignment.professor_id, 0) + 1
+    professor_totals: dict[int, dict] = {}
+    for usage_date, professor_id, cage_count, professor_name, color_code in usage_rows:
+        daily_costs.append({
+            "date": usage_date,
+            "professor_id": professor_id,
+            "professor_name": professor_name,
+            "color_code": color_code,
+            "cage_count": cage_count,
+            "cost": cage_count * COST_PER_CAGE_DAY,
+        })
+        summary = professor_totals.setdefault(
+            professor_id,
+            {
+                "professor_id": professor_id,
+                "professor_name": professor_name,
+                "color_code": color_code,
+                "total_cage_days": 0,
+                "total_cost": 0,
+            },
         )
+        summary["total_cage_days"] += cage_count
+        summary["total_cost"] += cage_count * COST_PER_CAGE_DAY
 
-    professor_summaries = []
-    for professor_id, total_cage_days in professor_totals.items():
-        professor = professors.get(professor_id)
-        if professor:
-            professor_summaries.append(
-                ProfessorCostSummary(
-                    professor_id=professor_id,
-                    professor_name=professor.name,
-                    color_code=professor.color_code,
-                    total_cage_days=total_cage_days,
-                    total_cost=total_cage_days * COST_PER_CAGE_DAY,
-                )
-            )
+    professor_summaries = list(professor_totals.values())
 
     # Sort by total_cost descending
-    professor_summaries.sort(key=lambda x: -x.total_cost)
-
-    total_cost = sum(s.total_cost for s in professor_summaries)
-
-    return DashboardCostsResponse(
-        period=period,
-        start_date=start_date,
-        end_date=end_date,
-        cost_per_cage_day=COST_PER_CAGE_DAY,
-        total_cost=total_cost,
-        daily_costs=daily_costs,
-        professor_summaries=professor_summaries,
-    )
+    professor_summaries.sort(key=lambda x: -x["total_cost"])
+
+    total_cost = sum(s["total_cost"] for s in professor_summaries)
+
+    return {
+        "period": period,
+        "start_date": start_date,
+        "end_date": end_date,
+        "cost_per_cage_day": COST_PER_CAGE_DAY,
+        "total_cost": total_cost,
+        "daily_costs": daily_costs,
+        "professor_summaries": professor_summaries,
+    }
@@ -1,10 +1,12 @@
 """Professor API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.api.fast_json import json_payload
 from app.database import get_db
-from app.models import Cage, Professor
+from app.models import Professor
 from app.schemas import (
     ProfessorActionResponse,
     ProfessorCreate,
@@ -12,32 +14,52 @@ from app.schemas import (
     ProfessorResponse,
     ProfessorUpdate,
 )
+from app.services import (
+    bump_data_version,
+    bump_professor_rack_generations,
+    change_seq,
+    publish_professor_change,
+    record_deletions,
+)
 
 router = APIRouter(prefix="/professors", tags=["professors"])
 
 
 @router.get("", response_model=ProfessorListResponse)
-def get_professors(db: Session = Depends(get_db)):
-    """Get all professors with assigned cage count."""
-    professors = db.query(Professor).order_by(Professor.name).all()
-
-    professor_responses = []
-    for professor in professors:
-        assigned_count = (
-            db.query(Cage)
-            .filter(Cage.current_professor_id == professor.id)
-            .count()
+def get_professors(
+    limit: int | None = Query(default=None, ge=1, le=1000, description="페이지 크기 (생략 시 전체)"),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """Get professors by name with assigned cage count, read from the maintained counter."""
+    rows = db.execute(
+        select(
+            Professor.name,
+            Professor.student_name,
+            Professor.contact,
+            Professor.color_code,
+            Professor.id,
+            Professor.active_cage_count,
         )
-        professor_responses.append({
-            "id": professor.id,
-            "name": professor.name,
-            "student_name": professor.student_name,
-            "contact": professor.contact,
-            "color_code": professor.color_code,
-            "assigned_count": assigned_count,
-        })
+        .order_by(Professor.name)
+        .limit(limit)
+        .offset(offset)
+    )
 
-    return ProfessorListResponse(professors=professor_responses)
+    # Payload mirrors ProfessorResponse field order
+    return json_payload({
+        "professors": [
+            {
+                "name": name,
+                "student_name": student_name,
+                "contact": contact,
+                "color_code": color_code,
+                "id": professor_id,
+                "assigned_count": assigned_count,
+            }
+            for name, student_name, contact, color_code, professor_id, assigned_count in rows
+        ]
+    })
 
 
 @router.get("/{professor_id}", response_model=ProfessorResponse)
@@ -47,19 +69,13 @@ def get_professor(professor_id: int, db: Session = Depends(get_db)):
     if not professor:
         raise HTTPException(status_code=404, detail="교수를 찾을 수 없습니다.")
 
-    assigned_count = (
-        db.query(Cage)
-        .filter(Cage.current_professor_id == professor_id)
-        .count()
-    )
-
     return ProfessorResponse(
         id=professor.id,
         name=professor.name,
         student_name=professor.student_name,
         contact=professor.contact,
         color_code=professor.color_code,
-        assigned_count=assigned_count,
+        assigned_count=professor.active_cage_count,
     )
 
 
@@ -75,9 +91,11 @@ def create_professor(professor_data: ProfessorCreate, db: Session = Depends(get_
         student_name=professor_data.student_name,
         contact=professor_data.contact,
         color_code=professor_data.color_code,
+        change_seq=change_seq(db),
     )
     db.add(professor)
     db.commit()
+    bump_data_version()
     db.refresh(professor)
 
     return ProfessorActionResponse(
@@ -124,14 +142,14 @@ def update_professor(
     if professor_data.color_code is not None:
         professor.color_code = professor_data.color_code
 
+    professor.change_seq = change_seq(db)
+
+    # Name and color are embedded in cage grids showing this professor
+    bump_professor_rack_generations(db, professor_id)
     db.commit()
+    bump_data_version()
     db.refresh(professor)
-
-    assigned_count = (
-        db.query(Cage)
-        .filter(Cage.current_professor_id == professor_id)
-        .count()
-    )
+    publish_professor_change(professor)
 
     return ProfessorActionResponse(
         success=True,
@@ -142,7 +160,7 @@ def update_professor(
             student_name=professor.student_name,
             contact=professor.contact,
             color_code=professor.color_code,
-            assigned_count=assigned_count,
+            assigned_count=professor.active_cage_count,
         ),
     )
 
@@ -154,20 +172,17 @@ def delete_professor(professor_id: int, db: Session = Depends(get_db)):
     if not professor:
         raise HTTPException(status_code=404, detail="교수를 찾을 수 없습니다.")
 
-    has_assigned = (
-        db.query(Cage)
-        .filter(Cage.current_professor_id == professor_id)
-        .first()
-    )
-    if has_assigned:
+    if professor.active_cage_count > 0:
         raise HTTPException(
             status_code=400,
             detail="배정된 케이지가 있어 삭제할 수 없습니다. 모든 케이지를 해제한 후 다시 시도하세요.",
         )
 
     professor_name = professor.name
+    record_deletions(db, "professor", [professor_id])
     db.delete(professor)
     db.commit()
+    bump_data_version()
 
     return ProfessorActionResponse(
         success=True,
@@ -1,10 +1,12 @@
 """Rack API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
+from app.api.fast_json import json_payload
 from app.database import get_db
-from app.models import Cage, Rack
+from app.models import AssignmentArchive, Cage, Rack
 from app.schemas import (
     RackActionResponse,
     RackCreate,
@@ -12,52 +14,39 @@ from app.schemas import (
     RackResponse,
     RackUpdate,
 )
+from app.services import (
+    bump_data_version,
+    change_seq,
+    provision_cages,
+    publish_rack_change,
+    record_deletions,
+    trim_cages,
+)
 
 router = APIRouter(prefix="/racks", tags=["racks"])
 
 
-def _generate_position(row_index: int, col_index: int) -> str:
-    """Generate position string like 'A1', 'B2'."""
-    row_letter = chr(ord("A") + row_index)
-    col_number = col_index + 1
-    return f"{row_letter}{col_number}"
-
-
-def _create_cages_for_rack(db: Session, rack: Rack) -> None:
-    """Create cage records for all positions in a rack."""
-    for row in range(rack.rows):
-        for col in range(rack.columns):
-            cage = Cage(
-                rack_id=rack.id,
-                position=_generate_position(row, col),
-                row_index=row,
-                col_index=col,
-            )
-            db.add(cage)
-
-
 @router.get("", response_model=RackListResponse)
 def get_racks(db: Session = Depends(get_db)):
     """Get all racks ordered by display_order with assigned cage count."""
-    racks = db.query(Rack).order_by(Rack.display_order).all()
-
-    rack_responses = []
-    for rack in racks:
-        assigned_count = (
-            db.query(Cage)
-            .filter(Cage.rack_id == rack.id, Cage.current_professor_id.isnot(None))
-            .count()
-        )
-        rack_responses.append({
-            "id": rack.id,
-            "name": rack.name,
-            "rows": rack.rows,
-            "columns": rack.columns,
-            "display_order": rack.display_order,
-            "assigned_count": assigned_count,
-        })
-
-    return RackListResponse(racks=rack_responses)
+    result = db.execute(
+        select(Rack.name, Rack.rows, Rack.columns, Rack.display_order, Rack.id, Rack.assigned_count)
+        .order_by(Rack.display_order)
+    )
+    # Payload mirrors RackResponse field order
+    return json_payload({
+        "racks": [
+            {
+                "name": name,
+                "rows": rows,
+                "columns": columns,
+                "display_order": display_order,
+                "id": rack_id,
+                "assigned_count": assigned_count,
+            }
+            for name, rows, columns, display_order, rack_id, assigned_count in result
+        ]
+    })
 
 
 @router.get("/{rack_id}", response_model=RackResponse)
@@ -81,12 +70,14 @@ def create_rack(rack_data: RackCreate, db: Session = Depends(get_db)):
         rows=rack_data.rows,
         columns=rack_data.columns,
         display_order=rack_data.display_order,
+        change_seq=change_seq(db),
     )
     db.add(rack)
     db.flush()
 
-    _create_cages_for_rack(db, rack)
+    provision_cages(db, rack.id, rack.rows, rack.columns)
     db.commit()
+    bump_data_version()
     db.refresh(rack)
 
     return RackActionResponse(
@@ -98,7 +89,10 @@ def create_rack(rack_data: RackCreate, db: Session = Depends(get_db)):
 
 @router.put("/{rack_id}", response_model=RackActionResponse)
 def update_rack(rack_id: int, rack_data: RackUpdate, db: Session = Depends(get_db)):
-    """Update a rack. Size can be increased freely, but decreasing requires checking assigned cages."""
+    """Update a rack. Size can be increased freely, but decreasing requires checking assigned cages.
+
+    Shrinking only ever deletes unassigned cages, so the rack's assigned_count is unchanged.
+    """
     rack = db.query(Rack).filter(Rack.id == rack_id).first()
     if not rack:
         raise HTTPException(status_code=404, detail="랙을 찾을 수 없습니다.")
@@ -116,6 +110,7 @@ def update_rack(rack_id: int, rack_data: RackUpdate, db: Session = Depends(get_d
     if rack_data.display_order is not None:
         rack.display_order = rack_data.display_order
 
+    resized = False
     if rack_data.rows is not None or rack_data.columns is not None:
         new_rows = rack_data.rows if rack_data.rows is not None else rack.rows
         new_cols = rack_data.columns if rack_data.columns is not None else rack.columns
@@ -163,45 +158,27 @@ def update_rack(rack_id: int, rack_data: RackUpdate, db: Session = Depends(get_d
                     detail=f"삭제될 열({removed_col_numbers}번)에 배정된 케이지가 있어 크기를 줄일 수 없습니다.",
                 )
 
-        if is_shrinking_rows:
-            db.query(Cage).filter(
-                Cage.rack_id == rack_id,
-                Cage.row_index >= new_rows,
-            ).delete()
-
-        if is_shrinking_cols:
-            db.query(Cage).filter(
-                Cage.rack_id == rack_id,
-                Cage.col_index >= new_cols,
-            ).delete()
-
-        if new_rows > old_rows:
-            for row in range(old_rows, new_rows):
-                for col in range(new_cols):
-                    cage = Cage(
-                        rack_id=rack_id,
-                        position=_generate_position(row, col),
-                        row_index=row,
-                        col_index=col,
-                    )
-                    db.add(cage)
-
-        if new_cols > old_cols:
-            for row in range(min(old_rows, new_rows)):
-                for col in range(old_cols, new_cols):
-                    cage = Cage(
-                        rack_id=rack_id,
-                        position=_generate_position(row, col),
-                        row_index=row,
-                        col_index=col,
-                    )
-                    db.add(cage)
+        # One DELETE for cells outside the new grid, one INSERT for the cells it adds
+        if is_shrinking_rows or is_shrinking_cols:
+            if trim_cages(db, rack_id, new_rows, new_cols) is None:
+                # A cage was assigned after the checks above
+                db.rollback()
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="삭제될 영역의 케이지가 방금 배정되어 크기를 줄일 수 없습니다. 다시 시도하세요.",
+                )
+        provision_cages(db, rack_id, new_rows, new_cols, existing=(min(old_rows, new_rows), min(old_cols, new_cols)))
 
+        resized = (new_rows, new_cols) != (old_rows, old_cols)
         rack.rows = new_rows
         rack.columns = new_cols
 
+    rack.generation = Rack.generation + 1
+    rack.change_seq = change_seq(db)
     db.commit()
+    bump_data_version()
     db.refresh(rack)
+    publish_rack_change(rack, resized)
 
     return RackActionResponse(
         success=True,
@@ -217,20 +194,21 @@ def delete_rack(rack_id: int, db: Session = Depends(get_db)):
     if not rack:
         raise HTTPException(status_code=404, detail="랙을 찾을 수 없습니다.")
 
-    has_assigned = (
-        db.query(Cage)
-        .filter(Cage.rack_id == rack_id, Cage.current_professor_id.isnot(None))
-        .first()
-    )
-    if has_assigned:
+    if rack.assigned_count > 0:
         raise HTTPException(
             status_code=400,
             detail="배정된 케이지가 있어 삭제할 수 없습니다. 모든 케이지를 해제한 후 다시 시도하세요.",
         )
 
     rack_name = rack.name
+    cage_ids = list(db.scalars(select(Cage.id).where(Cage.rack_id == rack_id)))
+    record_deletions(db, "cage", cage_ids)
+    # Hot assignments go with their cages via the ORM cascade; archived ones have no FK
+    db.execute(delete(AssignmentArchive).where(AssignmentArchive.cage_id.in_(cage_ids)))
+    record_deletions(db, "rack", [rack_id])
     db.delete(rack)
     db.commit()
+    bump_data_version()
 
     return RackActionResponse(
         success=True,
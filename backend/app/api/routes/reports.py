@@ -1,174 +1,97 @@
-"""Reports API routes - xlsx download."""
+"""Reports API routes - xlsx download, background report jobs and raw exports."""
 
+import io
+import queue
+import threading
 from datetime import date
-from io import BytesIO
+from typing import Iterator
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
+from urllib.parse import quote
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.models import Assignment, Cage, Professor, Rack
+from app.schemas import ReportJobCreate, ReportJobResponse
+from app.services import ExportFormat, ReportJob, iter_export, report_jobs, write_xlsx_report
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
-COST_PER_CAGE_DAY = 800
-
-
-def create_xlsx_report(
-    db: Session,
-    start_date: date,
-    end_date: date,
-) -> BytesIO:
-    """Create xlsx report with summary and detail sheets."""
-    wb = Workbook()
-
-    # Styles
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="3B82F6", end_color="3B82F6", fill_type="solid")
-    header_alignment = Alignment(horizontal="center", vertical="center")
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
-    number_format = "#,##0"
-    currency_format = "#,##0원"
-
-    # Get assignments in the date range
-    assignments = (
-        db.query(Assignment)
-        .filter(
-            Assignment.assigned_date >= start_date,
-            Assignment.assigned_date <= end_date,
-        )
-        .order_by(Assignment.assigned_date, Assignment.cage_id)
-        .all()
-    )
-
-    # Build lookups
-    professors = {p.id: p for p in db.query(Professor).all()}
-    cages = {c.id: c for c in db.query(Cage).all()}
-    racks = {r.id: r for r in db.query(Rack).all()}
-
-    # ========== [요약] Sheet ==========
-    ws_summary = wb.active
-    ws_summary.title = "요약"
-
-    # Header
-    summary_headers = ["교수명", "담당 학생", "사용 케이지 수", "총 비용"]
-    for col, header in enumerate(summary_headers, 1):
-        cell = ws_summary.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-
-    # Calculate professor summaries
-    professor_summary: dict[int, int] = {}
-    for assignment in assignments:
-        professor_summary[assignment.professor_id] = (
-            professor_summary.get(assignment.professor_id, 0) + 1
-        )
-
-    # Data rows
-    row = 2
-    total_cage_count = 0
-    total_cost = 0
-
-    for professor_id, cage_count in sorted(
-        professor_summary.items(),
-        key=lambda x: -x[1],
-    ):
-        professor = professors.get(professor_id)
-        if not professor:
-            continue
-
-        cost = cage_count * COST_PER_CAGE_DAY
-        total_cage_count += cage_count
-        total_cost += cost
-
-        ws_summary.cell(row=row, column=1, value=professor.name).border = thin_border
-        ws_summary.cell(row=row, column=2, value=professor.student_name or "-").border = thin_border
-        cell_count = ws_summary.cell(row=row, column=3, value=cage_count)
-        cell_count.border = thin_border
-        cell_count.number_format = number_format
-        cell_count.alignment = Alignment(horizontal="right")
-        cell_cost = ws_summary.cell(row=row, column=4, value=cost)
-        cell_cost.border = thin_border
-        cell_cost.number_format = currency_format
-        cell_cost.alignment = Alignment(horizontal="right")
-        row += 1
-
-    # Total row
-    total_font = Font(bold=True)
-    ws_summary.cell(row=row, column=1, value="합계").font = total_font
-    ws_summary.cell(row=row, column=1).border = thin_border
-    ws_summary.cell(row=row, column=2, value="").border = thin_border
-    cell_total_count = ws_summary.cell(row=row, column=3, value=total_cage_count)
-    cell_total_count.font = total_font
-    cell_total_count.border = thin_border
-    cell_total_count.number_format = number_format
-    cell_total_count.alignment = Alignment(horizontal="right")
-    cell_total_cost = ws_summary.cell(row=row, column=4, value=total_cost)
-    cell_total_cost.font = total_font
-    cell_total_cost.border = thin_border
-    cell_total_cost.number_format = currency_format
-    cell_total_cost.alignment = Alignment(horizontal="right")
-
-    # Column widths
-    ws_summary.column_dimensions["A"].width = 15
-    ws_summary.column_dimensions["B"].width = 15
-    ws_summary.column_dimensions["C"].width = 18
-    ws_summary.column_dimensions["D"].width = 15
-
-    # ========== [상세] Sheet ==========
-    ws_detail = wb.create_sheet(title="상세")
-
-    # Header
-    detail_headers = ["날짜", "랙", "케이지 위치", "교수명", "담당 학생", "비용"]
-    for col, header in enumerate(detail_headers, 1):
-        cell = ws_detail.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_alignment
-        cell.border = thin_border
-
-    # Data rows
-    row = 2
-    for assignment in assignments:
-        professor = professors.get(assignment.professor_id)
-        cage = cages.get(assignment.cage_id)
-        rack = racks.get(cage.rack_id) if cage else None
-
-        ws_detail.cell(row=row, column=1, value=assignment.assigned_date.strftime("%Y-%m-%d")).border = thin_border
-        ws_detail.cell(row=row, column=2, value=rack.name if rack else "-").border = thin_border
-        ws_detail.cell(row=row, column=3, value=cage.position if cage else "-").border = thin_border
-        ws_detail.cell(row=row, column=4, value=professor.name if professor else "-").border = thin_border
-        ws_detail.cell(row=row, column=5, value=professor.student_name if professor and professor.student_name else "-").border = thin_border
-        cell_cost = ws_detail.cell(row=row, column=6, value=COST_PER_CAGE_DAY)
-        cell_cost.border = thin_border
-        cell_cost.number_format = currency_format
-        cell_cost.alignment = Alignment(horizontal="right")
-        row += 1
-
-    # Column widths
-    ws_detail.column_dimensions["A"].width = 12
-    ws_detail.column_dimensions["B"].width = 12
-    ws_detail.column_dimensions["C"].width = 12
-    ws_detail.column_dimensions["D"].width = 15
-    ws_detail.column_dimensions["E"].width = 15
-    ws_detail.column_dimensions["F"].width = 12
-
-    # Save to BytesIO
-    output = BytesIO()
-    wb.save(output)
-    output.seek(0)
-    return output
+STREAM_CHUNK_SIZE = 64 * 1024
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+class _ChunkPipe(io.RawIOBase):
+    """Non-seekable write end that hands fixed-size chunks to a reader through a bounded queue."""
+
+    _DONE = object()
+
+    def __init__(self, max_chunks: int = 8):
+        self._queue: queue.Queue = queue.Queue(maxsize=max_chunks)
+        self._buffer = bytearray()
+        self._cancelled = threading.Event()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self._cancelled.is_set():
+            raise BrokenPipeError("Report download was cancelled")
+        self._buffer += data
+        if len(self._buffer) >= STREAM_CHUNK_SIZE:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+        return len(data)
+
+    def _put(self, item) -> None:
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Flush remaining bytes and signal the end of the stream."""
+        if error is None and self._buffer:
+            self._put(bytes(self._buffer))
+        self._put(error or self._DONE)
+
+    def cancel(self) -> None:
+        """Stop the writer, e.g. when the client disconnects."""
+        self._cancelled.set()
+
+    def chunks(self) -> Iterator[bytes]:
+        """Yield chunks as the writer produces them."""
+        while True:
+            item = self._queue.get()
+            if item is self._DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+
+def stream_xlsx_report(db: Session, start_date: date, end_date: date) -> Iterator[bytes]:
+    """Build the report on a worker thread and yield xlsx bytes while the archive is written."""
+    pipe = _ChunkPipe()
+
+    def build() -> None:
+        try:
+            write_xlsx_report(db, start_date, end_date, pipe)
+        except BaseException as exc:  # Re-raised on the reading side
+            pipe.finish(exc)
+        else:
+            pipe.finish()
+
+    worker = threading.Thread(target=build, name="xlsx-report", daemon=True)
+    worker.start()
+    try:
+        yield from pipe.chunks()
+    finally:
+        pipe.cancel()
+        worker.join()
 
 
 @router.get("/download")
@@ -177,18 +100,90 @@ def download_report(
     end: date = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
     db: Session = Depends(get_db),
 ):
-    """Download xlsx report for the specified date range."""
-    from urllib.parse import quote
-
-    xlsx_file = create_xlsx_report(db, start, end)
+    """Download xlsx report for the specified date range, streamed while it is written."""
+    return StreamingResponse(
+        stream_xlsx_report(db, start, end),
+        media_type=XLSX_MEDIA_TYPE,
+        headers=_attachment_headers(start, end),
+    )
 
-    filename = f"케이지_사용_리포트_{start}_{end}.xlsx"
-    encoded_filename = quote(filename)
 
+@router.get("/export")
+def export_report(
+    start: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
+    end: date = Query(..., description="종료 날짜 (YYYY-MM-DD)"),
+    format: ExportFormat = Query(default="csv", description="csv 또는 ndjson"),
+    gzip: bool = Query(default=False, description="gzip 압축 전송"),
+    db: Session = Depends(get_db),
+):
+    """
+    Export raw detail rows (date, rack, position, professor, student, cost) for billing.
+    Streams straight from a server-side cursor with no workbook in between.
+    """
+    media_type = "text/csv; charset=utf-8" if format == "csv" else "application/x-ndjson"
+    headers = _attachment_headers(start, end, format)
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
     return StreamingResponse(
-        xlsx_file,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={
-            "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}",
-        },
+        iter_export(db, start, end, format, gzip=gzip),
+        media_type=media_type,
+        headers=headers,
     )
+
+
+def _attachment_headers(start: date, end: date, extension: str = "xlsx") -> dict[str, str]:
+    """Content-Disposition header for a report file."""
+    filename = f"케이지_사용_리포트_{start}_{end}.{extension}"
+    encoded_filename = quote(filename)
+    return {"Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"}
+
+
+def _job_response(job: ReportJob) -> ReportJobResponse:
+    """Convert ReportJob to ReportJobResponse."""
+    job_status = job.status
+    return ReportJobResponse(
+        job_id=job.id,
+        status=job_status,
+        start=job.start,
+        end=job.end,
+        cached=job.cached,
+        created_at=job.created_at,
+        download_url=f"/api/reports/jobs/{job.id}/download" if job_status == "completed" else None,
+        error=job.error,
+    )
+
+
+def _get_job_or_404(job_id: str) -> ReportJob:
+    job = report_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="리포트 작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.post("/jobs", response_model=ReportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_report_job(request: ReportJobCreate, db: Session = Depends(get_db)):
+    """
+    Start building a report in the background worker pool.
+    Returns a completed job immediately if the range is cached and unchanged.
+    """
+    return _job_response(report_jobs.submit(db, request.start, request.end))
+
+
+@router.get("/jobs/{job_id}", response_model=ReportJobResponse)
+def get_report_job(job_id: str):
+    """Get the status of a report job."""
+    return _job_response(_get_job_or_404(job_id))
+
+
+@router.get("/jobs/{job_id}/download")
+def download_report_job(job_id: str):
+    """Download the file built by a completed report job."""
+    job = _get_job_or_404(job_id)
+    if job.status != "completed":
+        raise HTTPException(status_code=409, detail="리포트가 아직 준비되지 않았습니다.")
+    if not job.path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="데이터가 변경되어 리포트가 만료되었습니다. 다시 요청하세요.",
+        )
+    return FileResponse(job.path, media_type=XLSX_MEDIA_TYPE, headers=_attachment_headers(job.start, job.end))
@@ -1,6 +1,7 @@
 """Application configuration management."""
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,6 +11,26 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./mslab.db"
+    db_mode: Literal["sync", "async"] = "sync"  # async serves hot endpoints from AsyncSession
+    async_database_url: str | None = None  # Derived from database_url when unset
+
+    # Connection pool (PostgreSQL also gets pre-ping and recycle)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+
+    # Per-request query stats (X-DB-Query-Count / X-DB-Time-Ms headers)
+    query_stats_enabled: bool = True
+    query_count_warn_threshold: int = 50  # Log a warning above this many queries per request
+
+    # SQLite pragmas applied on every new connection
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size: int = -64000  # Negative = KiB, i.e. 64 MB page cache
 
     # Security
     secret_key: str = "your-secret-key-change-in-production"
@@ -17,6 +38,30 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
 
+    # Hot read endpoints skip response_model validation and encode with orjson ("fastjson" extra)
+    fast_json: bool = False
+
+    # Dashboard response cache (invalidated by this process's write routes)
+    response_cache_enabled: bool = True
+    response_cache_max_entries: int = 256
+    response_cache_ttl_seconds: float = 5.0  # Bounds staleness from other workers and the CLI
+
+    # Change feed (server-sent events)
+    change_feed_buffer_size: int = 1000
+    change_feed_keepalive_seconds: float = 15.0
+    change_sync_max_rows: int = 5000  # Larger deltas answer reset=true
+
+    # Report jobs
+    report_cache_dir: str = "./report_cache"
+    report_workers: int = 2
+
+    # Cage-day accrual
+    accrual_enabled: bool = True
+    accrual_interval_seconds: float = 3600.0
+
+    # Assignment archive
+    assignment_hot_months: int = 6  # Months kept in the hot table; older closed rows move to the archive
+
     # CORS
     cors_origins: str = "http://localhost:5173"
 
@@ -26,6 +71,19 @@ class Settings(BaseSettings):
         case_sensitive=False,
     )
 
+    @property
+    def async_database_url_resolved(self) -> str:
+        """Async driver URL: aiosqlite for SQLite, asyncpg for PostgreSQL."""
+        if self.async_database_url:
+            return self.async_database_url
+        scheme, _, rest = self.database_url.partition("://")
+        driver = scheme.split("+")[0]
+        if driver == "sqlite":
+            return f"sqlite+aiosqlite://{rest}"
+        if driver in ("postgresql", "postgres"):
+            return f"postgresql+asyncpg://{rest}"
+        raise ValueError(f"No async driver known for database URL scheme '{scheme}'")
+
     @property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins from comma-separated string."""
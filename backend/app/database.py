@@ -1,9 +1,15 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+import threading
+import time
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-from app.config import get_settings
+from app.config import Settings, get_settings
+from app.query_stats import install_query_hooks
 
 
 class Base(DeclarativeBase):
@@ -11,17 +17,129 @@ class Base(DeclarativeBase):
     pass
 
 
+class _TimedPoolMixin:
+    """Records how long checkouts take, including waits for a free connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """QueuePool with checkout wait telemetry."""
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout wait telemetry."""
+
+
+def _engine_options(url: str, settings: Settings, is_async: bool = False) -> dict:
+    """Engine keyword arguments for the backend profile."""
+    parsed = make_url(url)
+    options = {"echo": False}
+    if parsed.get_backend_name() == "sqlite":
+        if not is_async:
+            options["connect_args"] = {"check_same_thread": False}
+        if parsed.database in (None, "", ":memory:"):
+            # In-memory databases keep SQLAlchemy's per-thread pool
+            return options
+    else:
+        options["pool_pre_ping"] = settings.db_pool_pre_ping
+        options["pool_recycle"] = settings.db_pool_recycle
+    options.update(
+        poolclass=TimedAsyncQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+    )
+    return options
+
+
+def _apply_sqlite_pragmas(engine: Engine, settings: Settings) -> None:
+    """Set per-connection SQLite pragmas (WAL, sync level, mmap, busy timeout, page cache)."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    pragmas = [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA cache_size={int(settings.sqlite_cache_size)}",
+    ]
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def pool_stats(engine: Engine) -> dict:
+    """Live pool statistics for tuning pool size and overflow."""
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, _TimedPoolMixin):
+        stats.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            wait_ms_avg=round(pool.wait_seconds_total / pool.checkouts * 1000, 3) if pool.checkouts else 0.0,
+            wait_ms_max=round(pool.wait_seconds_max * 1000, 3),
+        )
+    return stats
+
+
 settings = get_settings()
 
-# Create engine with SQLite-specific settings
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-    echo=False,
-)
+# Create engine with the backend profile (SQLite pragmas / PostgreSQL pool policy)
+engine = create_engine(settings.database_url, **_engine_options(settings.database_url, settings))
+_apply_sqlite_pragmas(engine, settings)
+install_query_hooks(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for DB_MODE=async; requires the "async" extra (aiosqlite/asyncpg)
+async_engine = None
+AsyncSessionLocal = None
+if settings.db_mode == "async":
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_url = settings.async_database_url_resolved
+    async_engine = create_async_engine(async_url, **_engine_options(async_url, settings, is_async=True))
+    _apply_sqlite_pragmas(async_engine.sync_engine, settings)
+    install_query_hooks(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 
 def get_db():
     """Dependency for getting database session."""
@@ -30,3 +148,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency for getting an async database session (DB_MODE=async only)."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database sessions require DB_MODE=async")
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,21 +1,36 @@
 """FastAPI application entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routes import cages_router, dashboard_router, professors_router, racks_router, reports_router
+from app.api.routes import (
+    assignments_router,
+    async_router,
+    cages_router,
+    changes_router,
+    dashboard_router,
+    professors_router,
+    racks_router,
+    reports_router,
+)
 from app.config import get_settings
+from app.query_stats import QueryStatsMiddleware
 
 settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Run seed on startup if database is empty."""
-    from app.database import SessionLocal
+    """
+    Run seed on startup if database is empty and start cage-day accrual;
+    stop accrual, report workers and the async engine on shutdown.
+    """
+    from app.database import SessionLocal, async_engine
     from app.models import User
+    from app.services import accrual_loop, report_jobs
 
     db = SessionLocal()
     try:
@@ -24,8 +39,18 @@ async def lifespan(app: FastAPI):
             seed_database()
     finally:
         db.close()
+
+    accrual_task = None
+    if settings.accrual_enabled:
+        accrual_task = asyncio.create_task(accrual_loop(settings.accrual_interval_seconds))
     yield
 
+    if accrual_task:
+        accrual_task.cancel()
+    report_jobs.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+
 
 app = FastAPI(
     title="MSLab Cage Management API",
@@ -41,11 +66,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Change-Token", "X-DB-Query-Count", "X-DB-Time-Ms"],
 )
 
+if settings.query_stats_enabled:
+    app.add_middleware(QueryStatsMiddleware, warn_threshold=settings.query_count_warn_threshold)
+
 # API Routes
+if settings.db_mode == "async":
+    # Registered first so they take precedence over the sync handlers for the same paths
+    app.include_router(async_router, prefix="/api")
 app.include_router(racks_router, prefix="/api")
 app.include_router(cages_router, prefix="/api")
+app.include_router(changes_router, prefix="/api")
+app.include_router(assignments_router, prefix="/api")
 app.include_router(professors_router, prefix="/api")
 app.include_router(dashboard_router, prefix="/api")
 app.include_router(reports_router, prefix="/api")
@@ -57,6 +91,25 @@ async def health_check():
     return {"status": "healthy", "message": "MSLab API is running"}
 
 
+@app.get("/health/db")
+async def database_health():
+    """Connection pool statistics (checked out, overflow, checkout wait)."""
+    from app.database import async_engine, engine, pool_stats
+
+    stats = {"sync": pool_stats(engine)}
+    if async_engine is not None:
+        stats["async"] = pool_stats(async_engine.sync_engine)
+    return stats
+
+
+@app.get("/health/cache")
+async def response_cache_health():
+    """Dashboard response cache hit/miss statistics."""
+    from app.services import response_cache
+
+    return response_cache.stats()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -0,0 +1,113 @@
+"""Maintenance commands.
+
+Usage:
+    python -m app.manage accrue [--since YYYY-MM-DD] [--through YYYY-MM-DD]
+    python -m app.manage archive-assignments [--before YYYY-MM-DD]
+    python -m app.manage rebuild-counters
+    python -m app.manage rebuild-usage [--start YYYY-MM-DD] [--end YYYY-MM-DD]
+"""
+
+import argparse
+from datetime import date
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.services import (
+    accrue_through,
+    add_months,
+    archive_assignments,
+    ensure_month_partitions,
+    rebuild_daily_usage,
+    rebuild_professor_counters,
+    rebuild_rack_counters,
+)
+
+
+def accrue(args: argparse.Namespace) -> None:
+    """Charge cage-days for held assignments, catching up on missed dates."""
+    db = SessionLocal()
+    try:
+        accrued = accrue_through(db, args.through, args.since)
+        for charge_date, count in accrued.items():
+            print(f"   - {charge_date}: {count} charges")
+        print(f"✅ Cage-day accrual complete ({len(accrued)} dates, {sum(accrued.values())} charges)")
+    finally:
+        db.close()
+
+
+def archive(args: argparse.Namespace) -> None:
+    """Move closed months of assignments to the archive and create upcoming partitions."""
+    today = date.today()
+    before = args.before or add_months(today, -get_settings().assignment_hot_months)
+    db = SessionLocal()
+    try:
+        created = ensure_month_partitions(db.connection(), "assignments", today, add_months(today, 2))
+        db.commit()
+        for name in created:
+            print(f"   - partition {name} created")
+        moved = archive_assignments(db, before)
+        for month, count in moved.items():
+            print(f"   - {month:%Y-%m}: {count} assignments archived")
+        print(f"✅ Assignment archive complete (before {before}, {sum(moved.values())} rows)")
+    finally:
+        db.close()
+
+
+def rebuild_counters(args: argparse.Namespace) -> None:
+    """Rebuild maintained occupancy counters from the cages table."""
+    db = SessionLocal()
+    try:
+        racks = rebuild_rack_counters(db)
+        professors = rebuild_professor_counters(db)
+        print(f"✅ Occupancy counters rebuilt ({racks} racks, {professors} professors)")
+    finally:
+        db.close()
+
+
+def rebuild_usage(args: argparse.Namespace) -> None:
+    """Backfill or rebuild the daily professor usage rollup from the cage-day ledger."""
+    db = SessionLocal()
+    try:
+        written = rebuild_daily_usage(db, args.start, args.end)
+        print(f"✅ Daily usage rollup rebuilt ({written} rows)")
+    finally:
+        db.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(prog="python -m app.manage", description="MSLab maintenance commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    cmd = subparsers.add_parser("accrue", help="Accrue cage-day charges through a date")
+    cmd.add_argument("--since", type=date.fromisoformat, help="First date to accrue (default: day after last run)")
+    cmd.add_argument("--through", type=date.fromisoformat, help="Last date to accrue (default: today)")
+    cmd.set_defaults(func=accrue)
+
+    cmd = subparsers.add_parser("archive-assignments", help="Move closed months of assignments to the archive")
+    cmd.add_argument(
+        "--before",
+        type=date.fromisoformat,
+        help="Archive months before this date's month (default: ASSIGNMENT_HOT_MONTHS ago)",
+    )
+    cmd.set_defaults(func=archive)
+
+    cmd = subparsers.add_parser("rebuild-counters", help="Rebuild rack and professor occupancy counters from cages")
+    cmd.set_defaults(func=rebuild_counters)
+
+    cmd = subparsers.add_parser("rebuild-usage", help="Rebuild the daily professor usage rollup")
+    cmd.add_argument("--start", type=date.fromisoformat, help="First date to rebuild (default: all)")
+    cmd.add_argument("--end", type=date.fromisoformat, help="Last date to rebuild (default: all)")
+    cmd.set_defaults(func=rebuild_usage)
+
+    return parser
+
+
+def main() -> None:
+    """Parse arguments and run the selected command."""
+    args = build_parser().parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
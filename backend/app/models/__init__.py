@@ -1,15 +1,26 @@
 """Models package - exports all models."""
 
+from app.models.archive import AssignmentArchive, AssignmentArchiveRun
 from app.models.assignment import Assignment
 from app.models.base import TimestampMixin
 from app.models.cage import Cage
+from app.models.change import ChangeSequence, ChangeTombstone
+from app.models.charge import AccrualRun, CageDayCharge
+from app.models.daily_usage import DailyProfessorUsage
 from app.models.professor import Professor
 from app.models.rack import Rack
 from app.models.user import User
 
 __all__ = [
+    "AccrualRun",
     "Assignment",
+    "AssignmentArchive",
+    "AssignmentArchiveRun",
     "Cage",
+    "CageDayCharge",
+    "ChangeSequence",
+    "ChangeTombstone",
+    "DailyProfessorUsage",
     "Professor",
     "Rack",
     "TimestampMixin",
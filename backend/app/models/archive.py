@@ -0,0 +1,43 @@
+"""Cold archive for assignment history."""
+
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Date, DateTime, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class AssignmentArchive(Base):
+    """Released, fully billed assignments moved out of the hot assignments table.
+
+    Same columns as Assignment. No FKs, so archived history does not hold back cage or
+    professor deletes (the billing ledger's professor FK still does).
+    """
+
+    __tablename__ = "assignments_archive"
+    __table_args__ = (
+        Index("ix_assignments_archive_cage_date", "cage_id", "assigned_date"),
+        Index("ix_assignments_archive_professor_date", "professor_id", "assigned_date"),
+        Index("ix_assignments_archive_date", "assigned_date"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    cage_id: Mapped[int] = mapped_column(Integer)
+    professor_id: Mapped[int] = mapped_column(Integer)
+    assigned_by_user_id: Mapped[int] = mapped_column(Integer)
+    assigned_date: Mapped[date] = mapped_column(Date)
+    assigned_at: Mapped[datetime] = mapped_column(DateTime)
+    released_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    cost: Mapped[int] = mapped_column(Integer)
+
+
+class AssignmentArchiveRun(Base):
+    """Completed archive run; the latest archived_before is the hot/cold boundary."""
+
+    __tablename__ = "assignment_archive_runs"
+
+    archived_before: Mapped[date] = mapped_column(Date, primary_key=True)  # Month start
+    moved_count: Mapped[int] = mapped_column(Integer)
+    completed_at: Mapped[datetime] = mapped_column(DateTime)
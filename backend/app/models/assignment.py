@@ -15,13 +15,19 @@ if TYPE_CHECKING:
 
 
 class Assignment(Base):
-    """Assignment model - tracks cage usage and billing."""
+    """Assignment model - tracks cage usage and billing.
+
+    Released, fully billed rows older than ASSIGNMENT_HOT_MONTHS move to
+    AssignmentArchive. On PostgreSQL the table is partitioned by month of
+    assigned_date, so its primary key there is (id, assigned_date).
+    """
 
     __tablename__ = "assignments"
     __table_args__ = (
         Index("ix_assignments_cage_date", "cage_id", "assigned_date"),
         Index("ix_assignments_professor_date", "professor_id", "assigned_date"),
         Index("ix_assignments_date", "assigned_date"),
+        Index("ix_assignments_released_at", "released_at"),  # Open/recently released lookups for accrual
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
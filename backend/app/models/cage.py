@@ -1,8 +1,9 @@
 """Cage model."""
 
+from datetime import date
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy import Date, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -30,7 +31,12 @@ class Cage(Base):
         ForeignKey("professors.id"),
         nullable=True,
     )
+    # Open assignment of the current professor, by its full key. No FK: on PostgreSQL
+    # assignments is partitioned and its primary key is (id, assigned_date)
+    current_assignment_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    current_assignment_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     version: Mapped[int] = mapped_column(Integer, default=1)  # Optimistic locking
+    change_seq: Mapped[int] = mapped_column(Integer, default=0, index=True)  # Global sequence of last change
 
     # Relationships
     rack: Mapped["Rack"] = relationship("Rack", back_populates="cages")
@@ -39,6 +45,14 @@ class Cage(Base):
         back_populates="cages",
         foreign_keys=[current_professor_id],
     )
+    current_assignment: Mapped[Optional["Assignment"]] = relationship(
+        "Assignment",
+        primaryjoin=(
+            "and_(foreign(Cage.current_assignment_id) == Assignment.id, "
+            "foreign(Cage.current_assignment_date) == Assignment.assigned_date)"
+        ),
+        viewonly=True,
+    )
     assignments: Mapped[list["Assignment"]] = relationship(
         "Assignment",
         back_populates="cage",
@@ -0,0 +1,28 @@
+"""Global change sequence models for delta sync."""
+
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ChangeSequence(Base):
+    """SQLite stand-in for the change_seq sequence: its one row holds the last number handed out.
+
+    PostgreSQL uses a real sequence (see app.services.change_sequence) and has no such table.
+    """
+
+    __tablename__ = "change_sequence"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class ChangeTombstone(Base):
+    """A deleted cage, rack or professor, kept so delta sync can report the deletion."""
+
+    __tablename__ = "change_tombstones"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    change_seq: Mapped[int] = mapped_column(Integer, index=True)
+    entity: Mapped[str] = mapped_column(String(20))  # "cage", "rack" or "professor"
+    entity_id: Mapped[int] = mapped_column(Integer)
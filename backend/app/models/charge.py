@@ -0,0 +1,43 @@
+"""Cage-day billing ledger models."""
+
+from datetime import date, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base
+
+if TYPE_CHECKING:
+    from app.models.professor import Professor
+
+
+class CageDayCharge(Base):
+    """One billable cage-day: an assignment held on a charge date."""
+
+    __tablename__ = "cage_day_charges"
+    __table_args__ = (
+        Index("ix_cage_day_charges_date_professor", "charge_date", "professor_id"),
+        Index("ix_cage_day_charges_professor_date", "professor_id", "charge_date"),
+    )
+
+    # (assignment_id, charge_date) makes accrual idempotent per date.
+    # assignment_id/cage_id carry no FK so billing history outlives deleted cages.
+    assignment_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    charge_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    cage_id: Mapped[int] = mapped_column(Integer)
+    professor_id: Mapped[int] = mapped_column(ForeignKey("professors.id"))
+    cost: Mapped[int] = mapped_column(Integer, default=800)  # Daily cost in KRW
+
+    # Relationships
+    professor: Mapped["Professor"] = relationship("Professor")
+
+
+class AccrualRun(Base):
+    """Completed accrual run for a charge date; the latest one is where catch-up resumes."""
+
+    __tablename__ = "accrual_runs"
+
+    charge_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    charge_count: Mapped[int] = mapped_column(Integer)  # Charges inserted by this run
+    completed_at: Mapped[datetime] = mapped_column(DateTime)
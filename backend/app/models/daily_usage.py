@@ -0,0 +1,25 @@
+"""Daily per-professor usage rollup for cost charts and report summaries."""
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base
+
+if TYPE_CHECKING:
+    from app.models.professor import Professor
+
+
+class DailyProfessorUsage(Base):
+    """Number of assignments per professor per billing date, maintained with assignment inserts."""
+
+    __tablename__ = "daily_professor_usage"
+
+    usage_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    professor_id: Mapped[int] = mapped_column(ForeignKey("professors.id"), primary_key=True)
+    cage_count: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Relationships
+    professor: Mapped["Professor"] = relationship("Professor")
@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String
+from sqlalchemy import Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -16,12 +16,17 @@ class Professor(Base):
     """Professor model - researchers who use cages."""
 
     __tablename__ = "professors"
+    __table_args__ = (
+        Index("ix_professors_name", "name"),  # Professor list order
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100))
     student_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     contact: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     color_code: Mapped[str] = mapped_column(String(7), default="#3B82F6")  # UI color (HEX)
+    change_seq: Mapped[int] = mapped_column(Integer, default=0, index=True)  # Global sequence of last change
+    active_cage_count: Mapped[int] = mapped_column(Integer, default=0)  # Maintained count of cages held
 
     # Relationships
     cages: Mapped[list["Cage"]] = relationship(
@@ -33,3 +38,7 @@ class Professor(Base):
         "Assignment",
         back_populates="professor",
     )
+
+
+# Dashboard order: most cages first, then name
+Index("ix_professors_active_cage_count_name", Professor.active_cage_count.desc(), Professor.name)
@@ -21,6 +21,9 @@ class Rack(Base):
     rows: Mapped[int] = mapped_column(Integer)
     columns: Mapped[int] = mapped_column(Integer)
     display_order: Mapped[int] = mapped_column(Integer, default=0)
+    assigned_count: Mapped[int] = mapped_column(Integer, default=0)  # Maintained occupancy counter
+    generation: Mapped[int] = mapped_column(Integer, default=1)  # Grid ETag stamp
+    change_seq: Mapped[int] = mapped_column(Integer, default=0, index=True)  # Global sequence of last change
 
     # Relationships
     cages: Mapped[list["Cage"]] = relationship(
@@ -0,0 +1,128 @@
+"""Per-request SQL query counting for spotting N+1 regressions."""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.queries")
+
+
+@dataclass
+class QueryStats:
+    """Queries executed and time spent in the database for one unit of work."""
+    count: int = 0
+    seconds: float = 0.0
+
+    @property
+    def milliseconds(self) -> float:
+        return round(self.seconds * 1000, 2)
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+# Process-wide trackers: see queries from any thread, e.g. a TestClient's app thread
+_global_stats: list[QueryStats] = []
+_global_lock = threading.Lock()
+
+
+def install_query_hooks(engine: Engine) -> None:
+    """Count every cursor execution on the engine toward the active QueryStats."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+        if _global_stats:
+            with _global_lock:
+                for tracker in _global_stats:
+                    tracker.count += 1
+                    tracker.seconds += elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # Failed statements never reach after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start"):
+            connection.info["query_start"].pop()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect query stats for the enclosed block (and threads that copy its context)."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """
+    Fail with AssertionError if the enclosed block runs more than limit queries.
+    Counts queries from every thread, so it works around TestClient calls in tests
+    to catch routes that regress to N+1.
+    """
+    stats = QueryStats()
+    with _global_lock:
+        _global_stats.append(stats)
+    try:
+        yield stats
+    finally:
+        with _global_lock:
+            _global_stats.remove(stats)
+    if stats.count > limit:
+        raise AssertionError(f"Expected at most {limit} queries, {stats.count} were executed")
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware adding X-DB-Query-Count / X-DB-Time-Ms headers and logging per request.
+
+    Headers cover queries run before the response starts; the log line also
+    includes queries made while a streaming body is sent.
+    """
+
+    def __init__(self, app, warn_threshold: int):
+        self.app = app
+        self.warn_threshold = warn_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.count).encode()))
+                headers.append((b"x-db-time-ms", str(stats.milliseconds).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                level = logging.WARNING if stats.count > self.warn_threshold else logging.DEBUG
+                logger.log(
+                    level,
+                    "%s %s: %d queries, %.2f ms",
+                    scope["method"],
+                    scope["path"],
+                    stats.count,
+                    stats.milliseconds,
+                )
@@ -1,13 +1,21 @@
 """Schemas package - exports all schemas."""
 
+from app.schemas.assignment import AssignmentPageResponse, AssignmentResponse
 from app.schemas.cage import (
     AssignRequest,
+    BulkCageOperation,
+    BulkCageRequest,
+    BulkCageResponse,
+    BulkCageResult,
     CageActionResponse,
+    CageGridCompactResponse,
+    CageGridListResponse,
     CageGridResponse,
     CageResponse,
     ProfessorInfo,
     ReleaseRequest,
 )
+from app.schemas.change import CageChange, ChangesResponse, DeletedEntity, ProfessorChange
 from app.schemas.dashboard import (
     DailyCost,
     DashboardCostsResponse,
@@ -31,17 +39,30 @@ from app.schemas.rack import (
     RackResponse,
     RackUpdate,
 )
+from app.schemas.report import ReportJobCreate, ReportJobResponse
 
 __all__ = [
     "AssignRequest",
+    "AssignmentPageResponse",
+    "AssignmentResponse",
+    "BulkCageOperation",
+    "BulkCageRequest",
+    "BulkCageResponse",
+    "BulkCageResult",
     "CageActionResponse",
+    "CageChange",
+    "CageGridCompactResponse",
+    "CageGridListResponse",
     "CageGridResponse",
     "CageResponse",
+    "ChangesResponse",
     "DailyCost",
     "DashboardCostsResponse",
     "DashboardProfessorsResponse",
     "DashboardSummaryResponse",
+    "DeletedEntity",
     "ProfessorActionResponse",
+    "ProfessorChange",
     "ProfessorCostSummary",
     "ProfessorCreate",
     "ProfessorInfo",
@@ -56,4 +77,6 @@ __all__ = [
     "RackSummary",
     "RackUpdate",
     "ReleaseRequest",
+    "ReportJobCreate",
+    "ReportJobResponse",
 ]
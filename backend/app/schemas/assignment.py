@@ -0,0 +1,26 @@
+"""Pydantic schemas for the assignment history API."""
+
+from datetime import date, datetime
+
+from pydantic import BaseModel
+
+
+class AssignmentResponse(BaseModel):
+    """A single assignment, with its cage and professor for display (null if since deleted)."""
+    id: int
+    cage_id: int
+    rack_id: int | None = None
+    rack_name: str | None = None
+    position: str | None = None
+    professor_id: int
+    professor_name: str | None = None
+    assigned_date: date
+    assigned_at: datetime
+    released_at: datetime | None = None
+    cost: int
+
+
+class AssignmentPageResponse(BaseModel):
+    """One page of assignments, newest first. Pass next_cursor back as cursor for the next page."""
+    assignments: list[AssignmentResponse]
+    next_cursor: str | None = None
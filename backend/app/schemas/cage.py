@@ -1,6 +1,9 @@
 """Pydantic schemas for Cage API."""
 
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
 
 
 class ProfessorInfo(BaseModel):
@@ -22,6 +25,7 @@ class CageResponse(BaseModel):
     col_index: int
     version: int
     current_professor: ProfessorInfo | None = None
+    assigned_since: datetime | None = None  # When the current professor's assignment started
 
     class Config:
         from_attributes = True
@@ -36,6 +40,29 @@ class CageGridResponse(BaseModel):
     cages: list[CageResponse]
 
 
+class CageGridCompactResponse(BaseModel):
+    """Columnar cage grid: row-major arrays of rows x columns cells plus a professor palette.
+
+    Cell i is row i // columns, column i % columns; its position label follows from that.
+    professor_ids refer to entries in professors.
+    """
+    format: Literal["compact"] = "compact"
+    rack_id: int
+    rack_name: str
+    rows: int
+    columns: int
+    cage_ids: list[int | None]
+    versions: list[int | None]
+    professor_ids: list[int | None]
+    assigned_since: list[datetime | None]
+    professors: list[ProfessorInfo]
+
+
+class CageGridListResponse(BaseModel):
+    """Schema for the all-racks grid response; each grid is full or compact as requested."""
+    racks: list[CageGridResponse | CageGridCompactResponse]
+
+
 class AssignRequest(BaseModel):
     """Schema for cage assignment request."""
     professor_id: int
@@ -52,3 +79,34 @@ class CageActionResponse(BaseModel):
     success: bool
     message: str
     cage: CageResponse
+
+
+class BulkCageOperation(BaseModel):
+    """Single assign/release operation in a bulk request."""
+    cage_id: int
+    version: int
+    action: Literal["assign", "release"]
+    professor_id: int | None = None
+
+
+class BulkCageRequest(BaseModel):
+    """Schema for bulk cage assign/release request."""
+    operations: list[BulkCageOperation] = Field(..., min_length=1, max_length=1000)
+    mode: Literal["all_or_nothing", "best_effort"] = "all_or_nothing"
+
+
+class BulkCageResult(BaseModel):
+    """Per-cage result of a bulk request."""
+    cage_id: int
+    success: bool
+    status_code: int
+    message: str
+    cage: CageResponse | None = None  # New state on success, current state on failure
+
+
+class BulkCageResponse(BaseModel):
+    """Schema for bulk cage action response."""
+    success: bool
+    message: str
+    applied_count: int
+    results: list[BulkCageResult]
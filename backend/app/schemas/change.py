@@ -0,0 +1,44 @@
+"""Pydantic schemas for the delta sync API."""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+from app.schemas.professor import ProfessorBase
+from app.schemas.rack import RackResponse
+
+
+class CageChange(BaseModel):
+    """Current state of a changed cage."""
+    id: int
+    rack_id: int
+    position: str
+    row_index: int
+    col_index: int
+    version: int
+    current_professor_id: int | None = None
+
+
+class ProfessorChange(ProfessorBase):
+    """Current state of a changed professor."""
+    id: int
+
+
+class DeletedEntity(BaseModel):
+    """A cage, rack or professor deleted after the client's sequence."""
+    type: Literal["cage", "rack", "professor"]
+    id: int
+
+
+class ChangesResponse(BaseModel):
+    """Rows changed in (since, seq]. Resume with since=seq.
+
+    reset means the client is too far behind (or ahead, after a database reset)
+    to sync incrementally and must refetch everything.
+    """
+    seq: int
+    reset: bool = False
+    cages: list[CageChange] = []
+    racks: list[RackResponse] = []
+    professors: list[ProfessorChange] = []
+    deleted: list[DeletedEntity] = []
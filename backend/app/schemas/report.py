@@ -0,0 +1,30 @@
+"""Pydantic schemas for Reports API."""
+
+from datetime import date, datetime
+from typing import Literal
+
+from pydantic import BaseModel, model_validator
+
+
+class ReportJobCreate(BaseModel):
+    """Schema for creating a report job."""
+    start: date
+    end: date
+
+    @model_validator(mode="after")
+    def check_range(self) -> "ReportJobCreate":
+        if self.end < self.start:
+            raise ValueError("end must not be before start")
+        return self
+
+
+class ReportJobResponse(BaseModel):
+    """Schema for report job status."""
+    job_id: str
+    status: Literal["pending", "running", "completed", "failed"]
+    start: date
+    end: date
+    cached: bool
+    created_at: datetime
+    download_url: str | None = None
+    error: str | None = None
@@ -1,9 +1,46 @@
-"""Seed script to populate initial data."""
+"""Seed script to populate initial data, or a large synthetic dataset.
+
+Usage:
+    python -m app.seed
+    python -m app.seed --scale medium [--seed 42] [--force]
+"""
+
+import argparse
+import bisect
+import csv
+import io
+import random
+import time as timer
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
 
 import bcrypt
+from sqlalchemy import Connection, Engine, Table, delete, insert, select, text
+from sqlalchemy.orm import Session
 
-from app.database import SessionLocal
-from app.models import Professor, Rack, User
+from app.database import SessionLocal, engine
+from app.models import (
+    AccrualRun,
+    Assignment,
+    AssignmentArchive,
+    AssignmentArchiveRun,
+    Cage,
+    CageDayCharge,
+    DailyProfessorUsage,
+    Professor,
+    Rack,
+    User,
+)
+from app.services import (
+    cage_position,
+    ensure_month_partitions,
+    provision_cages,
+    rebuild_daily_usage,
+    rebuild_professor_counters,
+    rebuild_rack_counters,
+    reset_change_sequence,
+)
 
 
 def hash_password(password: str) -> str:
@@ -37,6 +74,9 @@ def seed_database():
             Rack(name="랙3", rows=8, columns=8, display_order=3),
         ]
         db.add_all(racks)
+        db.flush()
+        for rack in racks:
+            provision_cages(db, rack.id, rack.rows, rack.columns)
 
         # Create sample professors with distinct colors
         professors = [
@@ -60,5 +100,288 @@ def seed_database():
         db.close()
 
 
+
+@dataclass(frozen=True)
+class Scale:
+    """Synthetic dataset dimensions."""
+    racks: int
+    rows: int
+    columns: int
+    professors: int
+    history_days: int
+
+
+SCALES = {
+    "tiny": Scale(racks=3, rows=8, columns=8, professors=10, history_days=30),
+    "small": Scale(racks=10, rows=8, columns=8, professors=100, history_days=365),
+    "medium": Scale(racks=100, rows=8, columns=8, professors=1_000, history_days=730),
+    "large": Scale(racks=1_000, rows=8, columns=8, professors=10_000, history_days=1_095),
+}
+
+BATCH_SIZE = 50_000
+SAME_DAY_SHARE = 0.6  # Assignments released on the day they start
+MAX_HOLD_DAYS = 10
+MAX_GAP_DAYS = 8  # Idle days between assignments of one cage
+DAILY_COST = 800
+
+
+class _BulkWriter:
+    """Buffers row tuples for one table and writes them in large batches.
+
+    PostgreSQL (psycopg2) uses COPY; other backends use a driver-level executemany
+    of one prepared INSERT, with values passed through the column types' bind processors.
+    """
+
+    def __init__(self, conn: Connection, table: Table, columns: list[str], before_flush=None):
+        self.conn = conn
+        self.table = table
+        self.columns = columns
+        self.before_flush = before_flush
+        self.rows: list[tuple] = []
+        self.count = 0
+        dialect = conn.dialect
+        self.use_copy = dialect.name == "postgresql" and dialect.driver == "psycopg2"
+        if not self.use_copy:
+            placeholder = "?" if dialect.paramstyle == "qmark" else "%s"
+            self.sql = (
+                f"INSERT INTO {table.name} ({', '.join(columns)}) "
+                f"VALUES ({', '.join([placeholder] * len(columns))})"
+            )
+            self.processors = [table.c[name].type.dialect_impl(dialect).bind_processor(dialect) for name in columns]
+
+    def add(self, row: tuple) -> None:
+        self.rows.append(row)
+        if len(self.rows) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        if self.before_flush:
+            self.before_flush()
+        if self.use_copy:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(self.rows)
+            buffer.seek(0)
+            cursor = self.conn.connection.dbapi_connection.cursor()
+            cursor.copy_expert(
+                f"COPY {self.table.name} ({', '.join(self.columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        else:
+            if any(self.processors):
+                processors = self.processors
+                rows = [
+                    tuple(process(value) if process and value is not None else value
+                          for process, value in zip(processors, row))
+                    for row in self.rows
+                ]
+            else:
+                rows = self.rows
+            self.conn.exec_driver_sql(self.sql, rows)
+        self.count += len(self.rows)
+        self.rows.clear()
+
+
+def _clear_data(conn: Connection) -> None:
+    """Remove all rows, children first, and restart the delta sync change sequence."""
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(
+            "TRUNCATE daily_professor_usage, cage_day_charges, accrual_runs, assignments, "
+            "assignments_archive, assignment_archive_runs, cages, racks, professors, users RESTART IDENTITY"
+        ))
+    else:
+        for model in (
+            DailyProfessorUsage, CageDayCharge, AccrualRun, Assignment, AssignmentArchive, AssignmentArchiveRun,
+            Cage, Rack, Professor, User,
+        ):
+            conn.execute(delete(model))
+    # Tombstones name ids the new data reuses, and old sequence numbers mean nothing now
+    reset_change_sequence(conn)
+
+
+def _reset_sequences(conn: Connection) -> None:
+    """Move PostgreSQL id sequences past the explicitly written ids."""
+    if conn.dialect.name != "postgresql":
+        return
+    for table in ("users", "professors", "racks", "cages", "assignments"):
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}"
+        ))
+
+
+def seed_scaled(
+    bind: Engine,
+    scale: Scale,
+    seed: int = 42,
+    today: date | None = None,
+) -> dict[str, int]:
+    """
+    Replace all data with a deterministic synthetic dataset.
+
+    Every cage gets a timeline of assignments over history_days: most are released
+    the same day, the rest are held up to MAX_HOLD_DAYS, separated by idle gaps.
+    An assignment still held today stays open and sets the cage's current professor.
+    Professors are picked with a Zipf-like skew so a few labs hold most cages.
+    The billing ledger is written alongside; rollup and counters are rebuilt after.
+    Returns row counts per table.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    history_start = today - timedelta(days=scale.history_days)
+    cum_weights = list(accumulate(1 / rank for rank in range(1, scale.professors + 1)))
+    total_weight = cum_weights[-1]
+
+    def pick_professor() -> int:
+        return bisect.bisect(cum_weights, rng.random() * total_weight, hi=scale.professors - 1) + 1
+
+    with bind.begin() as conn:
+        _clear_data(conn)
+        ensure_month_partitions(conn, "assignments", history_start, today)
+        conn.execute(insert(User).values(
+            id=1,
+            email="admin@mslab.com",
+            password_hash=hash_password("admin1234"),
+            name="관리자",
+            role="admin",
+        ))
+
+        professors = _BulkWriter(conn, Professor.__table__, ["id", "name", "student_name", "contact", "color_code"])
+        for professor_id in range(1, scale.professors + 1):
+            professors.add((
+                professor_id,
+                f"교수{professor_id:05d}",
+                f"학생{professor_id:05d}",
+                f"010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}",
+                f"#{rng.randrange(0x1000000):06X}",
+            ))
+        professors.flush()
+
+        racks = _BulkWriter(
+            conn,
+            Rack.__table__,
+            ["id", "name", "rows", "columns", "display_order", "assigned_count", "generation"],
+        )
+        for rack_id in range(1, scale.racks + 1):
+            racks.add((rack_id, f"랙{rack_id}", scale.rows, scale.columns, rack_id, 0, 1))
+        racks.flush()
+
+        cages = _BulkWriter(
+            conn,
+            Cage.__table__,
+            [
+                "id", "rack_id", "position", "row_index", "col_index",
+                "current_professor_id", "current_assignment_id", "current_assignment_date", "version",
+            ],
+        )
+        assignments = _BulkWriter(
+            conn,
+            Assignment.__table__,
+            ["id", "cage_id", "professor_id", "assigned_by_user_id", "assigned_date", "assigned_at", "released_at", "cost"],
+            before_flush=cages.flush,  # Assignments reference cages
+        )
+        charges = _BulkWriter(
+            conn,
+            CageDayCharge.__table__,
+            ["assignment_id", "charge_date", "cage_id", "professor_id", "cost"],
+        )
+
+        cage_id = 0
+        assignment_id = 0
+        for rack_id in range(1, scale.racks + 1):
+            for row_index in range(scale.rows):
+                for col_index in range(scale.columns):
+                    cage_id += 1
+                    version = 1
+                    current_professor_id = None
+                    timeline = []
+                    day = history_start + timedelta(days=rng.randint(0, MAX_GAP_DAYS))
+                    while day <= today:
+                        hold = 0 if rng.random() < SAME_DAY_SHARE else rng.randint(1, MAX_HOLD_DAYS)
+                        release_day = day + timedelta(days=hold)
+                        professor_id = pick_professor()
+                        assigned_at = datetime.combine(day, time(8)) + timedelta(minutes=rng.randrange(600))
+                        if release_day > today:
+                            released_at = None
+                            current_professor_id = professor_id
+                            version += 1
+                        elif hold == 0:
+                            released_at = assigned_at + timedelta(minutes=rng.randint(1, 240))
+                            version += 2
+                        else:
+                            released_at = datetime.combine(release_day, time(9)) + timedelta(minutes=rng.randrange(480))
+                            version += 2
+                        timeline.append((professor_id, day, min(release_day, today), assigned_at, released_at))
+                        day = release_day + timedelta(days=rng.randint(1, MAX_GAP_DAYS))
+
+                    # Cage first: assignments reference it. An open assignment is the timeline's last
+                    current_assignment_id = assignment_id + len(timeline) if current_professor_id else None
+                    current_assignment_date = timeline[-1][1] if current_professor_id else None
+                    cages.add((
+                        cage_id, rack_id, cage_position(row_index, col_index), row_index, col_index,
+                        current_professor_id, current_assignment_id, current_assignment_date, version,
+                    ))
+                    for professor_id, day, last_charge_day, assigned_at, released_at in timeline:
+                        assignment_id += 1
+                        assignments.add((
+                            assignment_id, cage_id, professor_id, 1, day, assigned_at, released_at, DAILY_COST,
+                        ))
+                        while day <= last_charge_day:
+                            charges.add((assignment_id, day, cage_id, professor_id, DAILY_COST))
+                            day += timedelta(days=1)
+
+        cages.flush()
+        assignments.flush()
+        charges.flush()
+        # Today's charges are already written; accrual resumes tomorrow
+        conn.execute(insert(AccrualRun).values(
+            charge_date=today,
+            charge_count=0,
+            completed_at=datetime.now(),
+        ))
+        _reset_sequences(conn)
+
+    with Session(bind) as db:
+        rebuild_rack_counters(db)
+        rebuild_professor_counters(db)
+        usage_rows = rebuild_daily_usage(db)
+
+    return {
+        "professors": professors.count,
+        "racks": racks.count,
+        "cages": cages.count,
+        "assignments": assignments.count,
+        "cage_day_charges": charges.count,
+        "daily_professor_usage": usage_rows,
+    }
+
+
+def _has_data(bind: Engine) -> bool:
+    with Session(bind) as db:
+        return db.scalar(select(User.id).limit(1)) is not None
+
+
+def main() -> None:
+    """Seed initial data, or a scaled synthetic dataset with --scale."""
+    parser = argparse.ArgumentParser(prog="python -m app.seed", description="Seed the MSLab database")
+    parser.add_argument("--scale", choices=SCALES, help="Generate a synthetic dataset of this size")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed; same seed, same data")
+    parser.add_argument("--force", action="store_true", help="Replace existing data when using --scale")
+    args = parser.parse_args()
+
+    if args.scale is None:
+        seed_database()
+        return
+
+    if _has_data(engine) and not args.force:
+        raise SystemExit("Database already has data. Use --force to replace it with a synthetic dataset.")
+
+    started = timer.perf_counter()
+    counts = seed_scaled(engine, SCALES[args.scale], seed=args.seed)
+    print(f"✅ Synthetic '{args.scale}' dataset created in {timer.perf_counter() - started:.1f}s (seed={args.seed})")
+    for table, count in counts.items():
+        print(f"   - {table}: {count:,}")
+
+
 if __name__ == "__main__":
-    seed_database()
+    main()
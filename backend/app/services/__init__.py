@@ -0,0 +1,78 @@
+"""Services package - shared domain logic used by API routes and commands."""
+
+from app.services.accrual import accrual_loop, accrue_date, accrue_through, charge_new_assignments
+from app.services.assignment_archive import (
+    add_months,
+    archive_assignments,
+    archive_boundary,
+    assignment_source,
+    ensure_month_partitions,
+    month_start,
+)
+from app.services.cage_layout import cage_position, provision_cages, trim_cages
+from app.services.change_sequence import change_seq, current_change_seq, record_deletions, reset_change_sequence
+from app.services.change_feed import (
+    change_feed,
+    publish_cage_changes,
+    publish_professor_change,
+    publish_rack_change,
+)
+from app.services.generations import (
+    bump_professor_rack_generations,
+    etag_matches,
+    rack_etag,
+)
+from app.services.occupancy import (
+    adjust_professor_occupancy,
+    adjust_rack_occupancy,
+    rebuild_professor_counters,
+    rebuild_rack_counters,
+)
+from app.services.report_export import ExportFormat, iter_export
+from app.services.report_jobs import ReportJob, report_jobs
+from app.services.report_writer import detail_rows_query, write_xlsx_report
+from app.services.response_cache import ResponseCache, bump_data_version, response_cache
+from app.services.usage_rollup import rebuild_daily_usage, record_daily_usage, refresh_daily_usage
+
+__all__ = [
+    "ExportFormat",
+    "ReportJob",
+    "ResponseCache",
+    "accrual_loop",
+    "accrue_date",
+    "accrue_through",
+    "add_months",
+    "adjust_professor_occupancy",
+    "adjust_rack_occupancy",
+    "archive_assignments",
+    "archive_boundary",
+    "assignment_source",
+    "bump_data_version",
+    "bump_professor_rack_generations",
+    "cage_position",
+    "change_feed",
+    "change_seq",
+    "charge_new_assignments",
+    "current_change_seq",
+    "detail_rows_query",
+    "ensure_month_partitions",
+    "etag_matches",
+    "iter_export",
+    "month_start",
+    "provision_cages",
+    "publish_cage_changes",
+    "publish_professor_change",
+    "publish_rack_change",
+    "rack_etag",
+    "rebuild_daily_usage",
+    "rebuild_professor_counters",
+    "rebuild_rack_counters",
+    "record_daily_usage",
+    "record_deletions",
+    "refresh_daily_usage",
+    "report_jobs",
+    "reset_change_sequence",
+    "response_cache",
+    "trim_cages",
+    "write_xlsx_report",
+]
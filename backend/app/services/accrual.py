@@ -0,0 +1,122 @@
+"""Cage-day billing accrual engine.
+
+Every assignment held at any point during a day is billed one cage-day for it.
+Charges live in the cage_day_charges ledger, keyed by (assignment_id, charge_date),
+so accruing a date twice never double-bills. New assignments are charged for the
+day they start in the same transaction; the accrual run charges everything else.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import date, datetime, time, timedelta
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Date, and_, func, insert, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models import AccrualRun, Assignment, CageDayCharge
+from app.services.response_cache import bump_data_version
+from app.services.usage_rollup import record_daily_usage, refresh_daily_usage
+
+logger = logging.getLogger("app.accrual")
+
+CHARGE_COLUMNS = ["charge_date", "assignment_id", "cage_id", "professor_id", "cost"]
+
+
+def _charge_statement(charge_date: date, *conditions):
+    """INSERT..SELECT charging every assignment held on charge_date and not yet charged."""
+    day_start = datetime.combine(charge_date, time.min)
+    already_charged = (
+        select(CageDayCharge.assignment_id)
+        .where(
+            CageDayCharge.assignment_id == Assignment.id,
+            CageDayCharge.charge_date == charge_date,
+        )
+        .exists()
+    )
+    held = select(
+        literal(charge_date, Date),
+        Assignment.id,
+        Assignment.cage_id,
+        Assignment.professor_id,
+        Assignment.cost,
+    ).where(
+        Assignment.assigned_date <= charge_date,
+        ~already_charged,
+        *conditions,
+    )
+    # Open assignments, and those released on or after the date: two range scans on
+    # ix_assignments_released_at rather than a scan of the whole history
+    source = union_all(
+        held.where(Assignment.released_at.is_(None)),
+        held.where(Assignment.released_at >= day_start),
+    )
+    return insert(CageDayCharge).from_select(CHARGE_COLUMNS, source)
+
+
+def charge_new_assignments(db: Session, charge_date: date, assignment_ids: list[int]) -> None:
+    """Charge assignments opened on charge_date inside the caller's transaction."""
+    if not assignment_ids:
+        return
+    stmt = _charge_statement(
+        charge_date,
+        # New assignments are dated charge_date: matching it keeps the lookup to one partition
+        and_(Assignment.assigned_date == charge_date, Assignment.id.in_(assignment_ids)),
+    ).returning(CageDayCharge.professor_id)
+    record_daily_usage(db, charge_date, Counter(db.scalars(stmt)))
+
+
+def accrue_date(db: Session, charge_date: date) -> int:
+    """
+    Charge every assignment held on a date and refresh that date's usage rollup.
+    Idempotent; commits and returns the number of new charges.
+    """
+    inserted = db.execute(_charge_statement(charge_date)).rowcount
+    refresh_daily_usage(db, charge_date, charge_date)
+    db.merge(AccrualRun(charge_date=charge_date, charge_count=inserted, completed_at=datetime.now()))
+    db.commit()
+    bump_data_version()
+    return inserted
+
+
+def accrue_through(
+    db: Session,
+    through: date | None = None,
+    since: date | None = None,
+) -> dict[date, int]:
+    """
+    Accrue each date from since (default: the day after the last run) through today.
+    Catches up after downtime; returns new charges per accrued date.
+    """
+    through = through or date.today()
+    if since is None:
+        last_run = db.scalar(select(func.max(AccrualRun.charge_date)))
+        since = last_run + timedelta(days=1) if last_run else through
+
+    accrued: dict[date, int] = {}
+    charge_date = since
+    while charge_date <= through:
+        accrued[charge_date] = accrue_date(db, charge_date)
+        charge_date += timedelta(days=1)
+    return accrued
+
+
+def _run_accrual() -> dict[date, int]:
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return accrue_through(db)
+    finally:
+        db.close()
+
+
+async def accrual_loop(interval_seconds: float) -> None:
+    """Accrue missed and current dates on startup, then re-check every interval."""
+    while True:
+        try:
+            await run_in_threadpool(_run_accrual)
+        except Exception:
+            logger.exception("Cage-day accrual failed")
+        await asyncio.sleep(interval_seconds)
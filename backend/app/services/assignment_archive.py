@@ -0,0 +1,173 @@
+"""Monthly partitioning and cold archive for assignment history.
+
+On PostgreSQL, assignments and assignments_archive are range-partitioned by month
+of assigned_date, each with a DEFAULT partition catching months not created yet.
+On SQLite both are plain tables. Either way an archive run moves released, fully
+billed assignments older than a month boundary out of the hot table, and
+assignment_source() reads the archive only for ranges that reach past it.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import Connection, FromClause, delete, func, insert, select, text, union_all
+from sqlalchemy.orm import Session
+
+from app.models import AccrualRun, Assignment, AssignmentArchive, AssignmentArchiveRun
+
+ARCHIVE_COLUMNS = [
+    "id",
+    "cage_id",
+    "professor_id",
+    "assigned_by_user_id",
+    "assigned_date",
+    "assigned_at",
+    "released_at",
+    "cost",
+]
+
+
+def month_start(day: date) -> date:
+    """First day of day's month."""
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    """First day of the month after day's month."""
+    return (month_start(day) + timedelta(days=32)).replace(day=1)
+
+
+def add_months(day: date, months: int) -> date:
+    """First day of the month `months` months after day's month (negative goes back)."""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_names(conn: Connection, table: str) -> set[str]:
+    return set(conn.scalars(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    ))
+
+
+def ensure_month_partitions(conn: Connection, table: str, first: date, last: date) -> list[str]:
+    """Create the missing monthly partitions of table covering first..last. PostgreSQL only.
+
+    Rows the DEFAULT partition already holds for a new month are moved into it,
+    since PostgreSQL refuses to attach a range the default partition overlaps.
+    Returns the partitions created.
+    """
+    if conn.dialect.name != "postgresql":
+        return []
+    existing = _partition_names(conn, table)
+    created = []
+    month = month_start(first)
+    while month <= last:
+        end = next_month(month)
+        name = f"{table}_{month:%Y_%m}"
+        if name not in existing:
+            bounds = {"start": month, "end": end}
+            conn.execute(text(f"CREATE TABLE {name} (LIKE {table} INCLUDING DEFAULTS)"))
+            conn.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {table}_default "
+                    "WHERE assigned_date >= :start AND assigned_date < :end RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved"
+                ),
+                bounds,
+            )
+            conn.execute(text(
+                f"ALTER TABLE {table} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+            created.append(name)
+        month = end
+    return created
+
+
+def archive_boundary(db: Session) -> date | None:
+    """Month start before which some assignments may live in the archive, or None if never archived."""
+    return db.scalar(select(func.max(AssignmentArchiveRun.archived_before)))
+
+
+def archive_assignments(db: Session, before: date) -> dict[date, int]:
+    """
+    Move released, fully billed assignments dated before `before` into the archive.
+
+    `before` is rounded down to a month start and each month moves in its own
+    transaction. Only rows released before the last accrued date move, so accrual
+    never needs an archived row; open assignments stay hot however old they are.
+    Returns the number of rows moved per month.
+    """
+    before = month_start(before)
+    last_accrued = db.scalar(select(func.max(AccrualRun.charge_date)))
+    if last_accrued is None:
+        return {}
+    billed_before = datetime.combine(last_accrued, time.min)
+
+    moved: dict[date, int] = {}
+    first = db.scalar(select(func.min(Assignment.assigned_date)).where(Assignment.assigned_date < before))
+    month = month_start(first) if first is not None else before
+    while month < before:
+        end = next_month(month)
+        ensure_month_partitions(db.connection(), "assignments_archive", month, month)
+        count = db.execute(
+            insert(AssignmentArchive).from_select(
+                ARCHIVE_COLUMNS,
+                select(*(getattr(Assignment, column) for column in ARCHIVE_COLUMNS)).where(
+                    Assignment.assigned_date >= month,
+                    Assignment.assigned_date < end,
+                    Assignment.released_at.is_not(None),
+                    Assignment.released_at < billed_before,
+                ),
+            )
+        ).rowcount
+        if count:
+            # Delete by what reached the archive, not by re-evaluating the filter,
+            # so a row released in between is never dropped unarchived
+            db.execute(
+                delete(Assignment)
+                .where(
+                    Assignment.assigned_date >= month,
+                    Assignment.assigned_date < end,
+                    Assignment.id.in_(
+                        select(AssignmentArchive.id).where(
+                            AssignmentArchive.assigned_date >= month,
+                            AssignmentArchive.assigned_date < end,
+                        )
+                    ),
+                )
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+        moved[month] = count
+        month = end
+
+    db.merge(AssignmentArchiveRun(
+        archived_before=before,
+        moved_count=sum(moved.values()),
+        completed_at=datetime.now(),
+    ))
+    db.commit()
+    return moved
+
+
+def assignment_source(db: Session, start: date | None = None) -> FromClause:
+    """
+    Assignment rows for a read whose date range starts at `start` (None: all history).
+
+    The hot table alone when the range starts on or after the archive boundary,
+    otherwise hot UNION ALL archive. Both have the same columns, so callers filter
+    and order through `.c` either way.
+    """
+    boundary = archive_boundary(db)
+    if boundary is None or (start is not None and start >= boundary):
+        return Assignment.__table__
+    return union_all(
+        select(Assignment.__table__),
+        select(AssignmentArchive.__table__),
+    ).subquery("assignment_history")
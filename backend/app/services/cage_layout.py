@@ -0,0 +1,74 @@
+"""Set-based cage provisioning for rack create and resize."""
+
+from sqlalchemy import delete, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.models import Cage
+from app.services.change_sequence import change_seq, record_deletions
+
+
+def cage_position(row_index: int, col_index: int) -> str:
+    """Generate position string like 'A1', 'B2'."""
+    return f"{chr(ord('A') + row_index)}{col_index + 1}"
+
+
+def _cage_rows(
+    rack_id: int,
+    rows: int,
+    columns: int,
+    existing: tuple[int, int],
+    seq: int,
+) -> list[dict]:
+    """Cage rows for every grid cell of rows x columns outside the existing rows x columns block."""
+    old_rows, old_columns = existing
+    return [
+        {
+            "rack_id": rack_id,
+            "position": cage_position(row, col),
+            "row_index": row,
+            "col_index": col,
+            "version": 1,
+            "change_seq": seq,
+        }
+        for row in range(rows)
+        for col in range(columns)
+        if row >= old_rows or col >= old_columns
+    ]
+
+
+def provision_cages(db: Session, rack_id: int, rows: int, columns: int, existing: tuple[int, int] = (0, 0)) -> int:
+    """Insert the cages a rows x columns grid adds to an existing grid, as one multi-row INSERT.
+
+    Runs inside the caller's transaction. Returns the number of cages created.
+    """
+    values = _cage_rows(rack_id, rows, columns, existing, change_seq(db))
+    if values:
+        db.execute(insert(Cage).values(values))
+    return len(values)
+
+
+def trim_cages(db: Session, rack_id: int, rows: int, columns: int) -> int | None:
+    """Delete the unassigned cages outside a rows x columns grid with one DELETE, leaving tombstones.
+
+    The DELETE itself only matches unassigned cages, so an assign committed after
+    the caller's check is never deleted. If any cage outside the grid is assigned,
+    returns None - the caller must roll back, as unassigned ones may be gone.
+    Otherwise returns the number deleted.
+    """
+    outside = (Cage.rack_id == rack_id, or_(Cage.row_index >= rows, Cage.col_index >= columns))
+    targets = select(Cage.id).where(*outside)
+    if db.get_bind().dialect.name == "postgresql":
+        # Make concurrent assigns to these cages wait for this transaction
+        targets = targets.with_for_update()
+    target_count = len(db.scalars(targets).all())
+
+    deleted_ids = list(db.scalars(
+        delete(Cage)
+        .where(*outside, Cage.current_professor_id.is_(None))
+        .returning(Cage.id)
+        .execution_options(synchronize_session=False)
+    ))
+    if len(deleted_ids) != target_count:
+        return None
+    record_deletions(db, "cage", deleted_ids)
+    return len(deleted_ids)
@@ -0,0 +1,142 @@
+"""In-process change feed for pushing cage grid updates to subscribers."""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from app.config import get_settings
+from app.models import Professor, Rack
+from app.schemas import CageResponse
+
+
+@dataclass
+class ChangeEvent:
+    """A committed change, numbered by the feed's sequence."""
+    seq: int
+    type: str  # "cages", "rack" or "professor"
+    rack_id: int | None
+    data: dict
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    loop: asyncio.AbstractEventLoop
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class ChangeFeed:
+    """Ring buffer of recent changes with async subscribers.
+
+    Route handlers publish from worker threads after their commit; subscribers are
+    woken on their own event loop. Resume tokens are "<epoch>-<seq>", where the epoch
+    identifies this process so tokens from a previous run trigger a resync.
+    """
+
+    def __init__(self, buffer_size: int):
+        self.epoch = format(time.time_ns(), "x")
+        self._events: deque[ChangeEvent] = deque(maxlen=buffer_size)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._subscribers: set[_Subscriber] = set()
+
+    def token(self, seq: int) -> str:
+        """Encode a sequence number as a resume token."""
+        return f"{self.epoch}-{seq}"
+
+    def parse_token(self, token: str | None) -> int | None:
+        """Decode a resume token. Returns None if it is missing or from another run."""
+        if not token:
+            return None
+        epoch, _, seq = token.rpartition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the latest published event."""
+        return self._seq
+
+    def publish(self, type: str, rack_id: int | None, data: dict) -> None:
+        """Append a change and wake every subscriber. Safe to call from any thread."""
+        with self._lock:
+            self._seq += 1
+            self._events.append(ChangeEvent(seq=self._seq, type=type, rack_id=rack_id, data=data))
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.wakeup.set)
+            except RuntimeError:
+                # Event loop already closed
+                pass
+
+    def events_since(self, seq: int) -> tuple[list[ChangeEvent], bool]:
+        """Return buffered events after seq, and whether any were already evicted."""
+        with self._lock:
+            events = [event for event in self._events if event.seq > seq]
+            oldest = self._events[0].seq if self._events else self._seq + 1
+            return events, seq + 1 < oldest and seq < self._seq
+
+    async def subscribe(
+        self,
+        since: int,
+        keepalive: float,
+    ) -> AsyncIterator[list[ChangeEvent] | None]:
+        """Yield batches of events after since; None is yielded on keepalive timeouts.
+
+        Raises LookupError if since is older than the buffer and changes were missed.
+        """
+        subscriber = _Subscriber(loop=asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscriber)
+        try:
+            while True:
+                subscriber.wakeup.clear()
+                events, missed = self.events_since(since)
+                if missed:
+                    raise LookupError(since)
+                if events:
+                    since = events[-1].seq
+                    yield events
+                    continue
+                try:
+                    await asyncio.wait_for(subscriber.wakeup.wait(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+
+change_feed = ChangeFeed(buffer_size=get_settings().change_feed_buffer_size)
+
+
+def publish_cage_changes(cages: list[CageResponse]) -> None:
+    """Publish the committed state of changed cages, grouped by rack, as the grid serializes them."""
+    by_rack: dict[int, list[dict]] = {}
+    for cage in cages:
+        by_rack.setdefault(cage.rack_id, []).append(cage.model_dump(mode="json"))
+    for rack_id, changed in by_rack.items():
+        change_feed.publish("cages", rack_id, {"cages": changed})
+
+
+def publish_rack_change(rack: Rack, resized: bool) -> None:
+    """Publish a rack update. Resized racks must be refetched by clients."""
+    change_feed.publish("rack", rack.id, {
+        "name": rack.name,
+        "rows": rack.rows,
+        "columns": rack.columns,
+        "resized": resized,
+    })
+
+
+def publish_professor_change(professor: Professor) -> None:
+    """Publish a professor name/color change affecting every rack."""
+    change_feed.publish("professor", None, {
+        "id": professor.id,
+        "name": professor.name,
+        "color_code": professor.color_code,
+    })
@@ -0,0 +1,68 @@
+"""Global change sequence stamped on cage, rack and professor mutations.
+
+Numbers are allocated without a lock shared between writers, so transactions can
+commit out of number order. Delta sync therefore reads up to the committed
+watermark - the highest number below which no transaction is still in flight -
+never past a number whose predecessors could still appear.
+"""
+
+from sqlalchemy import Connection, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import ChangeSequence, ChangeTombstone
+
+_SESSION_KEY = "change_seq"
+
+
+def change_seq(db: Session) -> int:
+    """
+    Sequence number for the caller's transaction, allocated on first use.
+
+    PostgreSQL draws it from the change_seq sequence and holds it as an advisory
+    lock until the transaction ends (next_change_seq(), see migration a6d3f9b2c185).
+    SQLite already runs one writer at a time, so its numbers are committed in order
+    and a one-row table suffices.
+    """
+    cached = db.info.get(_SESSION_KEY)
+    transaction = db.get_transaction()
+    if cached is not None and transaction is not None and cached[0] is transaction:
+        return cached[1]
+
+    if db.get_bind().dialect.name == "postgresql":
+        seq = db.scalar(select(func.next_change_seq()))
+    else:
+        # max(rowid) + 1; keeping only the newest row keeps it monotonic
+        seq = db.scalar(insert(ChangeSequence).values(id=None).returning(ChangeSequence.id))
+        db.execute(delete(ChangeSequence).where(ChangeSequence.id < seq))
+    db.info[_SESSION_KEY] = (db.get_transaction(), seq)
+    return seq
+
+
+def current_change_seq(db: Session) -> int:
+    """Committed watermark: every change numbered up to it is committed (or rolled back)."""
+    if db.get_bind().dialect.name == "postgresql":
+        return db.scalar(select(func.committed_change_seq()))
+    return db.scalar(select(func.max(ChangeSequence.id))) or 0
+
+
+def reset_change_sequence(conn: Connection) -> None:
+    """Drop tombstones and restart numbering, after every row has been replaced.
+
+    Delta sync clients then hold a number past the new watermark and get reset: true.
+    """
+    conn.execute(delete(ChangeTombstone))
+    if conn.dialect.name == "postgresql":
+        conn.execute(select(func.setval("change_seq", 1, False)))
+    else:
+        conn.execute(delete(ChangeSequence))
+
+
+def record_deletions(db: Session, entity: str, ids: list[int]) -> None:
+    """Leave tombstones for deleted rows, stamped with the transaction's sequence number."""
+    if not ids:
+        return
+    seq = change_seq(db)
+    db.execute(
+        insert(ChangeTombstone),
+        [{"change_seq": seq, "entity": entity, "entity_id": entity_id} for entity_id in ids],
+    )
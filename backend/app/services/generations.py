@@ -0,0 +1,40 @@
+"""Per-rack generation stamps used as cage grid ETags.
+
+Cage assign/release bumps a rack's generation through adjust_rack_occupancy,
+in the same statement as its occupancy counter.
+"""
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models import Cage, Rack
+
+
+def bump_professor_rack_generations(db: Session, professor_id: int) -> None:
+    """Mark every rack showing one of the professor's cages as changed."""
+    rack_ids = (
+        select(Cage.rack_id)
+        .where(Cage.current_professor_id == professor_id)
+        .distinct()
+    )
+    db.execute(
+        update(Rack)
+        .where(Rack.id.in_(rack_ids))
+        .values(generation=Rack.generation + 1)
+    )
+
+
+def rack_etag(rack: Rack, representation: str | None = None) -> str:
+    """Build the ETag for a rack's cage grid, distinct per representation."""
+    suffix = f"-{representation}" if representation else ""
+    return f'"rack-{rack.id}-{rack.generation}{suffix}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
@@ -0,0 +1,89 @@
+"""Maintained occupancy counters for racks and professors."""
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Cage, Professor, Rack
+from app.services.change_sequence import change_seq
+
+
+def adjust_rack_occupancy(db: Session, rack_id: int, delta: int) -> None:
+    """Record a cage change on its rack inside the caller's transaction.
+
+    Shifts the assigned cage counter by delta, bumps the grid generation and
+    stamps the change sequence in one UPDATE.
+    """
+    db.execute(
+        update(Rack)
+        .where(Rack.id == rack_id)
+        .values(
+            assigned_count=Rack.assigned_count + delta,
+            generation=Rack.generation + 1,
+            change_seq=change_seq(db),
+        )
+    )
+
+
+def adjust_professor_occupancy(db: Session, deltas: dict[int, int]) -> None:
+    """Shift professors' active cage counters inside the caller's transaction.
+
+    deltas maps professor id to the change in cages held. Rows are updated in id
+    order so concurrent writers lock them in the same order.
+    """
+    for professor_id, delta in sorted(deltas.items()):
+        if delta:
+            db.execute(
+                update(Professor)
+                .where(Professor.id == professor_id)
+                .values(active_cage_count=Professor.active_cage_count + delta)
+            )
+
+
+def rebuild_rack_counters(db: Session) -> int:
+    """Recompute every rack's assigned cage counter from the cages table.
+
+    Runs as a single UPDATE with a grouped subquery. Returns the number of racks updated.
+    """
+    assigned = (
+        select(Cage.rack_id, func.count().label("assigned_count"))
+        .where(Cage.current_professor_id.isnot(None))
+        .group_by(Cage.rack_id)
+        .subquery()
+    )
+    result = db.execute(
+        update(Rack).values(
+            assigned_count=func.coalesce(
+                select(assigned.c.assigned_count)
+                .where(assigned.c.rack_id == Rack.id)
+                .scalar_subquery(),
+                0,
+            )
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+def rebuild_professor_counters(db: Session) -> int:
+    """Recompute every professor's active cage counter from the cages table.
+
+    Runs as a single UPDATE with a grouped subquery. Returns the number of professors updated.
+    """
+    held = (
+        select(Cage.current_professor_id, func.count().label("active_cage_count"))
+        .where(Cage.current_professor_id.isnot(None))
+        .group_by(Cage.current_professor_id)
+        .subquery()
+    )
+    result = db.execute(
+        update(Professor).values(
+            active_cage_count=func.coalesce(
+                select(held.c.active_cage_count)
+                .where(held.c.current_professor_id == Professor.id)
+                .scalar_subquery(),
+                0,
+            )
+        )
+    )
+    db.commit()
+    return result.rowcount
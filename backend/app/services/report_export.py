@@ -0,0 +1,76 @@
+"""Streaming CSV/NDJSON export of report detail rows."""
+
+import csv
+import io
+import json
+import zlib
+from datetime import date
+from typing import Iterable, Iterator, Literal
+
+from sqlalchemy.orm import Session
+
+from app.services.report_writer import detail_rows_query
+
+EXPORT_BATCH_SIZE = 5000
+EXPORT_COLUMNS = ["date", "rack", "position", "professor", "student", "cost"]
+
+ExportFormat = Literal["csv", "ndjson"]
+
+
+def _csv_chunks(batches: Iterable[list]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMNS)
+    for batch in batches:
+        writer.writerows(
+            (charge_date.isoformat(), rack, position, professor, student, cost)
+            for charge_date, rack, position, professor, student, cost in batch
+        )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _ndjson_chunks(batches: Iterable[list]) -> Iterator[bytes]:
+    for batch in batches:
+        yield "".join(
+            json.dumps(
+                dict(zip(EXPORT_COLUMNS, (charge_date.isoformat(), rack, position, professor, student, cost))),
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ) + "\n"
+            for charge_date, rack, position, professor, student, cost in batch
+        ).encode("utf-8")
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)  # gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def iter_export(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    export_format: ExportFormat,
+    gzip: bool = False,
+) -> Iterator[bytes]:
+    """
+    Yield detail rows encoded as CSV or NDJSON, batch by batch from a server-side cursor.
+    Memory is bounded by EXPORT_BATCH_SIZE regardless of the range.
+    """
+    result = db.execute(
+        detail_rows_query(start_date, end_date).execution_options(
+            stream_results=True,
+            yield_per=EXPORT_BATCH_SIZE,
+        )
+    )
+    batches = result.partitions()
+    chunks = _csv_chunks(batches) if export_format == "csv" else _ndjson_chunks(batches)
+    return _gzip_chunks(chunks) if gzip else chunks
@@ -0,0 +1,184 @@
+"""Background report jobs with an on-disk artifact cache."""
+
+import multiprocessing
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import AccrualRun, CageDayCharge
+
+MAX_JOBS = 1000
+_COUNT_WIDTH = 12
+_CLOSED = "9" * _COUNT_WIDTH
+
+
+def charges_stamp(db: Session, start_date: date, end_date: date) -> str:
+    """
+    Monotonic stamp of the billed cage-days in a date range; compares as a string.
+
+    Charges land in a range two ways: accrual runs, which record completed_at per
+    date (re-running a date moves it forward), and new assignments charged for
+    today. The ledger is insert-only, so the number of charges dated from today
+    on counts the latter. The stamp is the range's latest run time followed by
+    that count while the range still reaches today, or by all nines once it is
+    closed; writes that charge nothing (releases, edits) leave it unchanged.
+    """
+    last_run = db.scalar(
+        select(func.max(AccrualRun.completed_at)).where(
+            AccrualRun.charge_date >= start_date,
+            AccrualRun.charge_date <= end_date,
+        )
+    )
+    run_part = last_run.strftime("%Y%m%d%H%M%S%f") if last_run else "0" * 20
+    today = date.today()
+    if end_date < today:
+        return run_part + _CLOSED
+    open_charges = db.scalar(
+        select(func.count()).select_from(CageDayCharge).where(
+            CageDayCharge.charge_date >= max(start_date, today),
+            CageDayCharge.charge_date <= end_date,
+        )
+    )
+    return run_part + str(open_charges).zfill(_COUNT_WIDTH)
+
+
+def _build_report(start_date: date, end_date: date, path: str) -> None:
+    """Worker process entry point: write the report to a temp file, then move it into place."""
+    from app.database import SessionLocal
+    from app.services.report_writer import write_xlsx_report
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    db = SessionLocal()
+    try:
+        write_xlsx_report(db, start_date, end_date, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        db.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@dataclass
+class ReportJob:
+    """A report build request and its artifact."""
+    id: str
+    start: date
+    end: date
+    path: Path
+    cached: bool
+    created_at: datetime = field(default_factory=datetime.now)
+    future: Future | None = None
+    error: str | None = None
+
+    @property
+    def status(self) -> str:
+        if self.future is None:
+            return "completed"
+        if not self.future.done():
+            return "running" if self.future.running() else "pending"
+        # A cancelled future raises CancelledError from exception()
+        if self.future.cancelled() or self.future.exception() is not None:
+            return "failed"
+        return "completed"
+
+
+class ReportJobManager:
+    """Runs report builds in a process pool and serves finished files from a disk cache.
+
+    Artifacts are keyed by date range and charges stamp; a finished build for a
+    range removes artifacts with older stamps, never newer ones.
+    """
+
+    def __init__(self, cache_dir: str, max_workers: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._jobs: dict[str, ReportJob] = {}
+        self._jobs_by_path: dict[Path, ReportJob] = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a threaded server process is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _artifact_path(self, start_date: date, end_date: date, stamp: str) -> Path:
+        return self.cache_dir / f"{self._artifact_prefix(start_date, end_date)}{stamp}.xlsx"
+
+    @staticmethod
+    def _artifact_prefix(start_date: date, end_date: date) -> str:
+        return f"report_{start_date}_{end_date}_"
+
+    def submit(self, db: Session, start_date: date, end_date: date) -> ReportJob:
+        """Return a job for the range, reusing a cached artifact or an in-flight build."""
+        path = self._artifact_path(start_date, end_date, charges_stamp(db, start_date, end_date))
+        with self._lock:
+            existing = self._jobs_by_path.get(path)
+            if existing and existing.status in ("pending", "running"):
+                return existing
+
+            job = ReportJob(id=uuid.uuid4().hex, start=start_date, end=end_date, path=path, cached=path.exists())
+            if not job.cached:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                job.future = self._get_executor().submit(
+                    _build_report, start_date, end_date, str(path)
+                )
+                job.future.add_done_callback(lambda future: self._finish(job))
+            self._jobs[job.id] = job
+            self._jobs_by_path[path] = job
+            self._prune()
+            return job
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs once the registry grows past MAX_JOBS."""
+        finished = [job for job in self._jobs.values() if job.status in ("completed", "failed")]
+        for job in finished[: max(0, len(self._jobs) - MAX_JOBS)]:
+            del self._jobs[job.id]
+            if self._jobs_by_path.get(job.path) is job:
+                del self._jobs_by_path[job.path]
+
+    def _finish(self, job: ReportJob) -> None:
+        if job.future.cancelled():
+            job.error = "리포트 작업이 취소되었습니다."
+            return
+        error = job.future.exception()
+        if error is not None:
+            job.error = str(error)
+            return
+        # Invalidate artifacts built from an older state of the same range. A slower
+        # build of an older state must not delete a newer artifact a client may be fetching
+        prefix = self._artifact_prefix(job.start, job.end)
+        stamp = job.path.stem.removeprefix(prefix)
+        for other in self.cache_dir.glob(f"{prefix}*.xlsx"):
+            if other.stem.removeprefix(prefix) < stamp:
+                other.unlink(missing_ok=True)
+
+    def get(self, job_id: str) -> ReportJob | None:
+        """Look up a job by id."""
+        return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, terminating builds still in progress."""
+        if self._executor is not None:
+            processes = list((self._executor._processes or {}).values())
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            # Idle or busy workers would otherwise outlive the server process
+            for process in processes:
+                process.terminate()
+            self._executor = None
+
+
+_settings = get_settings()
+report_jobs = ReportJobManager(_settings.report_cache_dir, _settings.report_workers)
@@ -0,0 +1,169 @@
+"""xlsx report writer shared by the download endpoint and background report jobs."""
+
+from copy import copy
+from datetime import date
+from typing import BinaryIO
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models import Cage, CageDayCharge, DailyProfessorUsage, Professor, Rack
+
+COST_PER_CAGE_DAY = 800
+DETAIL_BATCH_SIZE = 1000
+
+# Styles
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="3B82F6", end_color="3B82F6", fill_type="solid")
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+TOTAL_FONT = Font(bold=True)
+RIGHT_ALIGNMENT = Alignment(horizontal="right")
+THIN_BORDER = Border(
+    left=Side(style="thin"),
+    right=Side(style="thin"),
+    top=Side(style="thin"),
+    bottom=Side(style="thin"),
+)
+NUMBER_FORMAT = "#,##0"
+CURRENCY_FORMAT = "#,##0원"
+
+
+def _cell(ws, value, font=None, fill=None, alignment=None, number_format=None) -> WriteOnlyCell:
+    """Create a bordered write-only cell with optional styling."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.border = THIN_BORDER
+    if font:
+        cell.font = font
+    if fill:
+        cell.fill = fill
+    if alignment:
+        cell.alignment = alignment
+    if number_format:
+        cell.number_format = number_format
+    return cell
+
+
+def _styled(ws, value, template: WriteOnlyCell) -> WriteOnlyCell:
+    """Create a cell sharing a template's style; much cheaper than re-assigning styles per cell."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell._style = copy(template._style)
+    return cell
+
+
+def _header_row(ws, headers: list[str]) -> list[WriteOnlyCell]:
+    """Create a styled header row."""
+    return [
+        _cell(ws, header, font=HEADER_FONT, fill=HEADER_FILL, alignment=HEADER_ALIGNMENT)
+        for header in headers
+    ]
+
+
+def detail_rows_query(start_date: date, end_date: date):
+    """Billed cage-days (date, rack, position, professor, student, cost) ordered like the report."""
+    return (
+        select(
+            CageDayCharge.charge_date,
+            Rack.name,
+            Cage.position,
+            Professor.name,
+            Professor.student_name,
+            CageDayCharge.cost,
+        )
+        .select_from(CageDayCharge)
+        .outerjoin(Cage, Cage.id == CageDayCharge.cage_id)
+        .outerjoin(Rack, Rack.id == Cage.rack_id)
+        .outerjoin(Professor, Professor.id == CageDayCharge.professor_id)
+        .where(
+            CageDayCharge.charge_date >= start_date,
+            CageDayCharge.charge_date <= end_date,
+        )
+        .order_by(CageDayCharge.charge_date, CageDayCharge.cage_id)
+    )
+
+
+def write_xlsx_report(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    output: str | BinaryIO,
+) -> None:
+    """
+    Write xlsx report with summary and detail sheets to a path or binary stream.
+    Uses write-only worksheets and batched queries, so memory stays flat for any range.
+    """
+    wb = Workbook(write_only=True)
+
+    # ========== [요약] Sheet ==========
+    ws_summary = wb.create_sheet(title="요약")
+    ws_summary.column_dimensions["A"].width = 15
+    ws_summary.column_dimensions["B"].width = 15
+    ws_summary.column_dimensions["C"].width = 18
+    ws_summary.column_dimensions["D"].width = 15
+
+    ws_summary.append(_header_row(ws_summary, ["교수명", "담당 학생", "사용 케이지 수", "총 비용"]))
+
+    # Professor summaries from the daily usage rollup
+    cage_count = func.sum(DailyProfessorUsage.cage_count)
+    professor_summary = db.execute(
+        select(Professor.name, Professor.student_name, cage_count)
+        .join(DailyProfessorUsage, DailyProfessorUsage.professor_id == Professor.id)
+        .where(
+            DailyProfessorUsage.usage_date >= start_date,
+            DailyProfessorUsage.usage_date <= end_date,
+        )
+        .group_by(Professor.id, Professor.name, Professor.student_name)
+        .having(cage_count > 0)
+        .order_by(cage_count.desc(), Professor.id)
+    )
+
+    total_cage_count = 0
+    total_cost = 0
+    for professor_name, student_name, count in professor_summary:
+        cost = count * COST_PER_CAGE_DAY
+        total_cage_count += count
+        total_cost += cost
+        ws_summary.append([
+            _cell(ws_summary, professor_name),
+            _cell(ws_summary, student_name or "-"),
+            _cell(ws_summary, count, alignment=RIGHT_ALIGNMENT, number_format=NUMBER_FORMAT),
+            _cell(ws_summary, cost, alignment=RIGHT_ALIGNMENT, number_format=CURRENCY_FORMAT),
+        ])
+
+    # Total row
+    ws_summary.append([
+        _cell(ws_summary, "합계", font=TOTAL_FONT),
+        _cell(ws_summary, ""),
+        _cell(ws_summary, total_cage_count, font=TOTAL_FONT, alignment=RIGHT_ALIGNMENT, number_format=NUMBER_FORMAT),
+        _cell(ws_summary, total_cost, font=TOTAL_FONT, alignment=RIGHT_ALIGNMENT, number_format=CURRENCY_FORMAT),
+    ])
+
+    # ========== [상세] Sheet ==========
+    ws_detail = wb.create_sheet(title="상세")
+    ws_detail.column_dimensions["A"].width = 12
+    ws_detail.column_dimensions["B"].width = 12
+    ws_detail.column_dimensions["C"].width = 12
+    ws_detail.column_dimensions["D"].width = 15
+    ws_detail.column_dimensions["E"].width = 15
+    ws_detail.column_dimensions["F"].width = 12
+
+    ws_detail.append(_header_row(ws_detail, ["날짜", "랙", "케이지 위치", "교수명", "담당 학생", "비용"]))
+
+    text_style = _cell(ws_detail, None)
+    cost_style = _cell(ws_detail, None, alignment=RIGHT_ALIGNMENT, number_format=CURRENCY_FORMAT)
+    detail_rows = db.execute(
+        detail_rows_query(start_date, end_date).execution_options(yield_per=DETAIL_BATCH_SIZE)
+    )
+    for charge_date, rack_name, position, professor_name, student_name, cost in detail_rows:
+        ws_detail.append([
+            _styled(ws_detail, charge_date.strftime("%Y-%m-%d"), text_style),
+            _styled(ws_detail, rack_name or "-", text_style),
+            _styled(ws_detail, position or "-", text_style),
+            _styled(ws_detail, professor_name or "-", text_style),
+            _styled(ws_detail, student_name or "-", text_style),
+            _styled(ws_detail, cost, cost_style),
+        ])
+
+    wb.save(output)
@@ -0,0 +1,101 @@
+"""In-process LRU cache for read-heavy responses, invalidated by a data-version stamp."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, TypeVar
+
+from app.config import get_settings
+
+T = TypeVar("T")
+
+
+class ResponseCache:
+    """Size-bounded LRU of computed responses keyed by endpoint and params.
+
+    Write routes call bump() after their commit. That advances the data version and
+    drops every entry. A response computed while a bump happens is not stored, so
+    a read that raced a write never outlives it.
+
+    The version lives in this process only: writes from other API workers or the
+    manage CLI (accrue, rebuild-*) do not bump it. Entries therefore also expire
+    ttl_seconds after they were computed, which bounds how stale those writes
+    can leave a cached response.
+    """
+
+    def __init__(self, max_entries: int, enabled: bool = True, ttl_seconds: float = 5.0):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, object]] = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def version(self) -> int:
+        """Current data version."""
+        return self._version
+
+    def bump(self) -> None:
+        """Mark the underlying data as changed. Safe to call from any thread."""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached response for key, computing and storing it on a miss."""
+        if not self.enabled:
+            return compute()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            version = self._version
+
+        value = compute()
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "version": self._version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_settings = get_settings()
+response_cache = ResponseCache(
+    max_entries=_settings.response_cache_max_entries,
+    enabled=_settings.response_cache_enabled,
+    ttl_seconds=_settings.response_cache_ttl_seconds,
+)
+
+
+def bump_data_version() -> None:
+    """Invalidate this process's cached responses after a committed write."""
+    response_cache.bump()
@@ -0,0 +1,86 @@
+"""Maintained daily_professor_usage rollup."""
+
+from datetime import date
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models import CageDayCharge, DailyProfessorUsage
+
+
+def record_daily_usage(db: Session, usage_date: date, counts: dict[int, int]) -> None:
+    """Add per-professor cage-day counts for a date inside the caller's transaction."""
+    if not counts:
+        return
+    rows = [
+        {"usage_date": usage_date, "professor_id": professor_id, "cage_count": count}
+        for professor_id, count in counts.items()
+    ]
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        stmt = (pg_insert if dialect == "postgresql" else sqlite_insert)(DailyProfessorUsage)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["usage_date", "professor_id"],
+                set_={"cage_count": DailyProfessorUsage.cage_count + stmt.excluded.cage_count},
+            ),
+            rows,
+        )
+        return
+
+    # Generic fallback: update existing rows, insert the rest
+    for row in rows:
+        result = db.execute(
+            update(DailyProfessorUsage)
+            .where(
+                DailyProfessorUsage.usage_date == row["usage_date"],
+                DailyProfessorUsage.professor_id == row["professor_id"],
+            )
+            .values(cage_count=DailyProfessorUsage.cage_count + row["cage_count"])
+        )
+        if result.rowcount == 0:
+            db.execute(insert(DailyProfessorUsage).values(**row))
+
+
+def rebuild_daily_usage(
+    db: Session,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> int:
+    """
+    Recompute the rollup from the cage-day ledger, optionally limited to a date range.
+    Returns the number of rollup rows written.
+    """
+    count = refresh_daily_usage(db, start_date, end_date)
+    db.commit()
+    return count
+
+
+def refresh_daily_usage(db: Session, start_date: date | None, end_date: date | None) -> int:
+    """Delete and re-aggregate rollup rows for a range inside the caller's transaction."""
+    clear = delete(DailyProfessorUsage)
+    source = (
+        select(
+            CageDayCharge.charge_date,
+            CageDayCharge.professor_id,
+            func.count(),
+        )
+        .group_by(CageDayCharge.charge_date, CageDayCharge.professor_id)
+    )
+    if start_date is not None:
+        clear = clear.where(DailyProfessorUsage.usage_date >= start_date)
+        source = source.where(CageDayCharge.charge_date >= start_date)
+    if end_date is not None:
+        clear = clear.where(DailyProfessorUsage.usage_date <= end_date)
+        source = source.where(CageDayCharge.charge_date <= end_date)
+
+    db.execute(clear)
+    result = db.execute(
+        insert(DailyProfessorUsage).from_select(
+            ["usage_date", "professor_id", "cage_count"],
+            source,
+        )
+    )
+    return result.rowcount
@@ -0,0 +1 @@
+"""Benchmark harness: scaled datasets, HTTP load tests and in-process micro-benchmarks."""
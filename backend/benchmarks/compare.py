@@ -0,0 +1,60 @@
+"""Compare two benchmark result files.
+
+Usage (from backend/):
+    python -m benchmarks.compare base.json head.json [--fail-above 20]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+
+def _change(base: float | None, head: float | None) -> str:
+    if not base or head is None:
+        return "    n/a"
+    return f"{(head - base) / base * 100:+6.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare", description="Compare benchmark results")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument(
+        "--fail-above",
+        type=float,
+        help="Exit non-zero if any p95 latency regresses by more than this percentage",
+    )
+    args = parser.parse_args()
+
+    base = json.loads(args.base.read_text(encoding="utf-8"))
+    head = json.loads(args.head.read_text(encoding="utf-8"))
+    print(f"base {base['meta'].get('commit')}  →  head {head['meta'].get('commit')}")
+    print(f"{'scenario':28} {'p50':>8} {'p95':>8} {'p99':>8} {'rps':>8} {'queries':>8}")
+
+    regressions = []
+    for name, head_result in head["scenarios"].items():
+        base_result = base["scenarios"].get(name)
+        if not base_result:
+            print(f"{name:28} (new)")
+            continue
+        base_latency, head_latency = base_result["latency_ms"], head_result["latency_ms"]
+        base_queries = (base_result.get("queries_per_request") or {}).get("mean")
+        head_queries = (head_result.get("queries_per_request") or {}).get("mean")
+        print(
+            f"{name:28} "
+            f"{_change(base_latency['p50'], head_latency['p50']):>8} "
+            f"{_change(base_latency['p95'], head_latency['p95']):>8} "
+            f"{_change(base_latency['p99'], head_latency['p99']):>8} "
+            f"{_change(base_result.get('throughput_rps'), head_result.get('throughput_rps')):>8} "
+            f"{_change(base_queries, head_queries):>8}"
+        )
+        if args.fail_above is not None and base_latency["p95"]:
+            if (head_latency["p95"] - base_latency["p95"]) / base_latency["p95"] * 100 > args.fail_above:
+                regressions.append(name)
+
+    if regressions:
+        raise SystemExit(f"p95 regression above {args.fail_above}%: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""HTTP load test for every API router against a locally started server.
+
+Usage (from backend/):
+    python -m benchmarks.load --scale small --concurrency 16 --duration 10 --output bench.json
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import httpx
+
+from app.seed import SCALES
+from benchmarks.results import latency_summary, result_metadata, write_results
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = Path(__file__).resolve().parent / ".data"
+
+
+@dataclass
+class Fixture:
+    """Ids discovered from the running server and shared by scenarios."""
+    rack_ids: list[int]
+    professor_ids: list[int]
+    grid_etags: dict[int, str]
+    # Free cages partitioned per worker: [cage_id, version]
+    owned_cages: list[list[list[int]]]
+
+
+@dataclass
+class Samples:
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+
+
+Scenario = Callable[[httpx.AsyncClient, Fixture, int, random.Random, Samples], Awaitable[None]]
+
+
+async def _request(client: httpx.AsyncClient, samples: Samples, method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request, read the full body and record latency and query count."""
+    start = time.perf_counter()
+    response = await client.request(method, url, **kwargs)
+    await response.aread()
+    samples.latencies.append(time.perf_counter() - start)
+    if "x-db-query-count" in response.headers:
+        samples.queries.append(int(response.headers["x-db-query-count"]))
+    if response.status_code >= 400:
+        samples.errors += 1
+    return response
+
+
+def _range(days: int) -> dict[str, str]:
+    today = date.today()
+    return {"start": (today - timedelta(days=days - 1)).isoformat(), "end": today.isoformat()}
+
+
+async def racks_list(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", "/api/racks")
+
+
+async def racks_get(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", f"/api/racks/{rng.choice(fixture.rack_ids)}")
+
+
+async def cages_grid(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", f"/api/cages/rack/{rng.choice(fixture.rack_ids)}")
+
+
+async def cages_grid_not_modified(client, fixture, worker, rng, samples):
+    rack_id = rng.choice(fixture.rack_ids)
+    headers = {"If-None-Match": fixture.grid_etags.get(rack_id, "")}
+    await _request(client, samples, "GET", f"/api/cages/rack/{rack_id}", headers=headers)
+
+
+async def cages_grid_all(client, fixture, worker, rng, samples):
+    """Every rack's grid in one request, as on first paint of the main board."""
+    await _request(client, samples, "GET", "/api/cages/grid")
+
+
+async def cages_grid_all_compact(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", "/api/cages/grid", params={"format": "compact"})
+
+
+async def cages_assign_release(client, fixture, worker, rng, samples):
+    """Assign then release one of this worker's cages (two requests)."""
+    cage = rng.choice(fixture.owned_cages[worker])
+    response = await _request(
+        client, samples, "POST", f"/api/cages/{cage[0]}/assign",
+        json={"professor_id": rng.choice(fixture.professor_ids), "version": cage[1]},
+    )
+    if response.status_code != 200:
+        return
+    cage[1] = response.json()["cage"]["version"]
+    response = await _request(client, samples, "POST", f"/api/cages/{cage[0]}/release", json={"version": cage[1]})
+    if response.status_code == 200:
+        cage[1] = response.json()["cage"]["version"]
+
+
+async def cages_bulk(client, fixture, worker, rng, samples):
+    """Bulk-assign then bulk-release all of this worker's cages (two requests)."""
+    cages = fixture.owned_cages[worker]
+    professor_id = rng.choice(fixture.professor_ids)
+    for action in ("assign", "release"):
+        operations = [
+            {
+                "cage_id": cage_id,
+                "action": action,
+                "version": version,
+                **({"professor_id": professor_id} if action == "assign" else {}),
+            }
+            for cage_id, version in cages
+        ]
+        response = await _request(
+            client, samples, "POST", "/api/cages/bulk",
+            json={"mode": "best_effort", "operations": operations},
+        )
+        if response.status_code not in (200, 409):
+            return
+        for cage, result in zip(cages, response.json()["results"]):
+            if result["cage"]:
+                cage[1] = result["cage"]["version"]
+
+
+async def professors_list(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", "/api/professors")
+
+
+async def professors_get(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", f"/api/professors/{rng.choice(fixture.professor_ids)}")
+
+
+async def dashboard_summary(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", "/api/dashboard/summary")
+
+
+async def dashboard_professors(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", "/api/dashboard/professors")
+
+
+async def dashboard_costs(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", "/api/dashboard/costs", params={"period": rng.choice(["weekly", "monthly"])})
+
+
+async def assignments_pages(client, fixture, worker, rng, samples):
+    """Walk the first five pages of a professor's history (up to five requests)."""
+    params = {"professor_id": rng.choice(fixture.professor_ids), "limit": 100}
+    for _ in range(5):
+        response = await _request(client, samples, "GET", "/api/assignments", params=params)
+        if response.status_code != 200 or not response.json()["next_cursor"]:
+            return
+        params["cursor"] = response.json()["next_cursor"]
+
+
+async def reports_export(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", "/api/reports/export", params={**_range(7), "format": "csv"})
+
+
+async def reports_download(client, fixture, worker, rng, samples):
+    await _request(client, samples, "GET", "/api/reports/download", params=_range(1))
+
+
+async def reports_job_cached(client, fixture, worker, rng, samples):
+    await _request(client, samples, "POST", "/api/reports/jobs", json=_range(1))
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "racks.list": racks_list,
+    "racks.get": racks_get,
+    "cages.grid": cages_grid,
+    "cages.grid_304": cages_grid_not_modified,
+    "cages.grid_all": cages_grid_all,
+    "cages.grid_all_compact": cages_grid_all_compact,
+    "cages.assign_release": cages_assign_release,
+    "cages.bulk": cages_bulk,
+    "professors.list": professors_list,
+    "professors.get": professors_get,
+    "dashboard.summary": dashboard_summary,
+    "dashboard.professors": dashboard_professors,
+    "dashboard.costs": dashboard_costs,
+    "assignments.pages": assignments_pages,
+    "reports.export": reports_export,
+    "reports.download": reports_download,
+    "reports.job_cached": reports_job_cached,
+}
+
+
+async def _load_fixture(client: httpx.AsyncClient, concurrency: int, cages_per_worker: int) -> Fixture:
+    racks = (await client.get("/api/racks")).raise_for_status().json()["racks"]
+    professors = (await client.get("/api/professors")).raise_for_status().json()["professors"]
+    rack_ids = [rack["id"] for rack in racks]
+
+    grid_etags: dict[int, str] = {}
+    free: list[list[int]] = []
+    needed = concurrency * cages_per_worker
+    for rack_id in rack_ids:
+        response = (await client.get(f"/api/cages/rack/{rack_id}")).raise_for_status()
+        grid_etags[rack_id] = response.headers.get("etag", "")
+        if len(free) < needed:
+            free.extend(
+                [cage["id"], cage["version"]]
+                for cage in response.json()["cages"]
+                if cage["current_professor"] is None
+            )
+    if len(free) < needed:
+        raise SystemExit(f"Need {needed} free cages for write scenarios, found {len(free)}")
+
+    return Fixture(
+        rack_ids=rack_ids,
+        professor_ids=[professor["id"] for professor in professors],
+        grid_etags=grid_etags,
+        owned_cages=[free[i * cages_per_worker:(i + 1) * cages_per_worker] for i in range(concurrency)],
+    )
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    fixture: Fixture,
+    scenario: Scenario,
+    concurrency: int,
+    duration: float,
+    seed: int,
+) -> dict:
+    """Run one scenario with concurrent workers for a fixed duration."""
+    samples = Samples()
+    deadline = time.perf_counter() + duration
+
+    async def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        while time.perf_counter() < deadline:
+            try:
+                await scenario(client, fixture, index, rng, samples)
+            except httpx.HTTPError:
+                samples.errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "requests": len(samples.latencies),
+        "errors": samples.errors,
+        "throughput_rps": round(len(samples.latencies) / elapsed, 2),
+        "latency_ms": latency_summary(samples.latencies),
+        "queries_per_request": {
+            "mean": round(sum(samples.queries) / len(samples.queries), 2) if samples.queries else None,
+            "max": max(samples.queries) if samples.queries else None,
+        },
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def prepare_database(database_url: str, scale_name: str, seed: int) -> None:
+    """Migrate and seed a benchmark database."""
+    env = {**os.environ, "DATABASE_URL": database_url}
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"], cwd=BACKEND_DIR, env=env, check=True)
+    subprocess.run(
+        [sys.executable, "-m", "app.seed", "--scale", scale_name, "--seed", str(seed), "--force"],
+        cwd=BACKEND_DIR,
+        env=env,
+        check=True,
+    )
+
+
+def start_server(database_url: str, port: int, db_mode: str, fast_json: bool = False) -> subprocess.Popen:
+    """Start uvicorn against the benchmark database and wait until it is healthy."""
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "DB_MODE": db_mode,
+        "FAST_JSON": str(fast_json).lower(),
+        "ACCRUAL_ENABLED": "false",
+        "QUERY_STATS_ENABLED": "true",
+        "REPORT_CACHE_DIR": str(DATA_DIR / "report_cache"),
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise SystemExit("Server exited during startup")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return server
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    raise SystemExit("Server did not become healthy within 60s")
+
+
+async def run_load(args: argparse.Namespace, port: int) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=120) as client:
+        fixture = await _load_fixture(client, args.concurrency, args.cages_per_worker)
+        results = {}
+        for name, scenario in SCENARIOS.items():
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+            results[name] = await run_scenario(client, fixture, scenario, args.concurrency, args.duration, args.seed)
+            print(
+                f"{name:24} {results[name]['throughput_rps']:>9.1f} req/s  "
+                f"p95 {results[name]['latency_ms']['p95']:>8.2f} ms  "
+                f"queries {results[name]['queries_per_request']['mean']}",
+                flush=True,
+            )
+        return results
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description="MSLab API load test")
+    parser.add_argument("--scale", choices=SCALES, default="small", help="Dataset scale to seed")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for data and request mix")
+    parser.add_argument("--database-url", help="Database to use (default: SQLite file under benchmarks/.data)")
+    parser.add_argument("--reuse-db", action="store_true", help="Skip migration and seeding")
+    parser.add_argument(
+        "--allow-reseed",
+        action="store_true",
+        help="Allow replacing all data in the --database-url database with the synthetic dataset",
+    )
+    parser.add_argument("--db-mode", choices=["sync", "async"], default="sync", help="Server DB_MODE")
+    parser.add_argument("--fast-json", action="store_true", help="Serve hot reads through the orjson fast path")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--cages-per-worker", type=int, default=10, help="Free cages reserved per client for writes")
+    parser.add_argument("--only", nargs="*", help="Scenario name prefixes to run (e.g. cages dashboard.summary)")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.database_url and not args.reuse_db and not args.allow_reseed:
+        raise SystemExit(
+            "Seeding replaces all data in --database-url. "
+            "Pass --allow-reseed to confirm, or --reuse-db to benchmark it as is."
+        )
+    DATA_DIR.mkdir(exist_ok=True)
+    database_url = args.database_url or f"sqlite:///{DATA_DIR / f'bench_{args.scale}.db'}"
+    if not args.reuse_db:
+        prepare_database(database_url, args.scale, args.seed)
+
+    port = _free_port()
+    server = start_server(database_url, port, args.db_mode, args.fast_json)
+    try:
+        scenarios = asyncio.run(run_load(args, port))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    results = {
+        "meta": result_metadata(
+            kind="load",
+            scale=args.scale,
+            seed=args.seed,
+            database=database_url.split(":", 1)[0],
+            db_mode=args.db_mode,
+            fast_json=args.fast_json,
+            concurrency=args.concurrency,
+            duration_seconds=args.duration,
+        ),
+        "scenarios": scenarios,
+    }
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
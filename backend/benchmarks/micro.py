@@ -0,0 +1,127 @@
+"""In-process micro-benchmarks of hot handlers and services against DATABASE_URL.
+
+Usage (from backend/, after seeding with python -m app.seed --scale):
+    DATABASE_URL=sqlite:///./benchmarks/.data/bench_small.db python -m benchmarks.micro --repeat 20
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+from io import BytesIO
+from pathlib import Path
+from typing import Callable
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.api.fast_json import orjson
+from app.api.routes import cages, dashboard, professors, racks
+from app.database import SessionLocal
+from app.models import Rack
+from app.query_stats import track_queries
+from app.schemas import CageGridResponse, ProfessorListResponse
+from app.services import accrue_date, detail_rows_query, iter_export, response_cache, write_xlsx_report
+from benchmarks.results import latency_summary, result_metadata, write_results
+
+
+def _consume(iterable) -> None:
+    for _ in iterable:
+        pass
+
+
+def _response_model_json(adapter: TypeAdapter, payload: dict) -> bytes:
+    """Validate and encode a payload the way FastAPI does for a response_model."""
+    return adapter.dump_json(adapter.validate_python(payload))
+
+
+def build_cases(db: Session) -> dict[str, Callable[[], object]]:
+    """Benchmark cases keyed by name; each is called repeatedly with the same session."""
+    today = date.today()
+    week_ago = today - timedelta(days=6)
+    rack_id = db.scalar(select(Rack.id).order_by(Rack.display_order).limit(1))
+
+    # Payloads as handlers hand them to FastAPI (run without FAST_JSON)
+    grid_payload = cages.get_cage_grid(rack_id, Response(), None, db, None, None)
+    professors_payload = professors.get_professors(None, 0, db)
+    grid_adapter = TypeAdapter(CageGridResponse)
+    professors_adapter = TypeAdapter(ProfessorListResponse)
+
+    cases = {
+        "racks.list": lambda: racks.get_racks(db),
+        "cages.grid": lambda: cages.get_cage_grid(rack_id, Response(), None, db, None, None),
+        "cages.grid.compact": lambda: cages.get_cage_grid(rack_id, Response(), None, db, "compact", None),
+        "professors.list": lambda: professors.get_professors(None, 0, db),
+        "dashboard.summary": lambda: dashboard.get_dashboard_summary(db),
+        "dashboard.professors": lambda: dashboard.get_dashboard_professors(None, 0, db),
+        "dashboard.costs.monthly": lambda: dashboard.get_dashboard_costs("monthly", db),
+        "report.detail_rows.7d": lambda: _consume(db.execute(detail_rows_query(week_ago, today))),
+        "report.export_csv.7d": lambda: _consume(iter_export(db, week_ago, today, "csv")),
+        "report.xlsx.1d": lambda: write_xlsx_report(db, today, today, BytesIO()),
+        "accrual.accrue_today": lambda: accrue_date(db, today),
+        # Encoding only: FastAPI's response_model pass versus the FAST_JSON path
+        "serialize.grid.response_model": lambda: _response_model_json(grid_adapter, grid_payload),
+        "serialize.professors.response_model": lambda: _response_model_json(professors_adapter, professors_payload),
+    }
+    if orjson is not None:
+        cases["serialize.grid.orjson"] = lambda: orjson.dumps(grid_payload)
+        cases["serialize.professors.orjson"] = lambda: orjson.dumps(professors_payload)
+    return cases
+
+
+def run_case(db: Session, case: Callable[[], object], repeat: int) -> dict:
+    """Time repeated calls, expiring the session between them so nothing is served from the identity map."""
+    timings: list[float] = []
+    queries: list[int] = []
+    for _ in range(repeat):
+        db.expire_all()
+        with track_queries() as stats:
+            start = time.perf_counter()
+            case()
+            timings.append(time.perf_counter() - start)
+        queries.append(stats.count)
+    db.rollback()
+    return {
+        "runs": repeat,
+        "latency_ms": latency_summary(timings),
+        "queries_per_call": max(queries),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro", description="In-process micro-benchmarks")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls per case")
+    parser.add_argument("--only", nargs="*", help="Case name prefixes to run")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    # Measure the handlers' own work; the HTTP load test covers cached responses
+    response_cache.enabled = False
+    db = SessionLocal()
+    try:
+        results = {}
+        for name, case in build_cases(db).items():
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+            case()  # Warm up
+            results[name] = run_case(db, case, args.repeat)
+            print(
+                f"{name:28} p50 {results[name]['latency_ms']['p50']:>9.3f} ms  "
+                f"queries {results[name]['queries_per_call']}",
+                flush=True,
+            )
+    finally:
+        db.close()
+
+    write_results(
+        {
+            "meta": result_metadata(kind="micro", database=str(db.get_bind().url.get_backend_name()), repeat=args.repeat),
+            "scenarios": results,
+        },
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,20 +7,7 @@ uv run alembic upgrade head
 
 # Seed data if database is empty
 echo "Checking seed data..."
-uv run python -c "
-from app.database import SessionLocal
-from app.models import User
-
-db = SessionLocal()
-user = db.query(User).first()
-if not user:
-    print('Seeding initial data...')
-    import subprocess
-    subprocess.run(['uv', 'run', 'python', '-m', 'app.seed'])
-else:
-    print('Database already has data, skipping seed.')
-db.close()
-"
+uv run python -m app.seed
 
 # Start the server
 echo "Starting server..."
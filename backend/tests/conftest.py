@@ -0,0 +1,55 @@
+"""Shared fixtures: a migrated, seeded SQLite database and a TestClient on it."""
+
+import os
+import tempfile
+
+# Settings are read at import time, so configure the environment before anything imports the app
+_data_dir = tempfile.mkdtemp(prefix="mslab-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_data_dir, 'test.db')}"
+os.environ["ACCRUAL_ENABLED"] = "false"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"  # Every request must reach the database
+os.environ["REPORT_CACHE_DIR"] = os.path.join(_data_dir, "report_cache")
+
+import pytest  # noqa: E402
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient against a fresh SQLite database seeded with the tiny synthetic dataset."""
+    command.upgrade(Config(os.path.join(os.path.dirname(__file__), "..", "alembic.ini")), "head")
+
+    from app.database import engine
+    from app.main import app
+    from app.seed import SCALES, seed_scaled
+
+    seed_scaled(engine, SCALES["tiny"])
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(client):
+    """A session on the test database, for arranging data and checking stored rows."""
+    from app.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def free_cages(client):
+    """Return n currently unassigned cages, as grid payload dicts."""
+
+    def pick(n: int) -> list[dict]:
+        grids = client.get("/api/cages/grid").json()["racks"]
+        free = [cage for grid in grids for cage in grid["cages"] if cage["current_professor"] is None]
+        assert len(free) >= n, "test dataset ran out of free cages"
+        return free[:n]
+
+    return pick
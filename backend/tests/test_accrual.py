@@ -0,0 +1,157 @@
+"""Cage-day accrual: the cage_day_charges ledger and the daily_professor_usage rollup."""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models import AccrualRun, Assignment, CageDayCharge, DailyProfessorUsage
+from app.services import accrual
+from app.services.accrual import accrue_date, accrue_through
+
+
+def _charge_dates(db, assignment_id: int) -> list[date]:
+    db.expire_all()
+    return list(db.scalars(
+        select(CageDayCharge.charge_date)
+        .where(CageDayCharge.assignment_id == assignment_id)
+        .order_by(CageDayCharge.charge_date)
+    ))
+
+
+def _usage(db, usage_date: date) -> dict[int, int]:
+    db.expire_all()
+    return dict(db.execute(
+        select(DailyProfessorUsage.professor_id, DailyProfessorUsage.cage_count)
+        .where(DailyProfessorUsage.usage_date == usage_date)
+    ).all())
+
+
+def _ledger_usage(db, charge_date: date) -> dict[int, int]:
+    return dict(db.execute(
+        select(CageDayCharge.professor_id, func.count())
+        .where(CageDayCharge.charge_date == charge_date)
+        .group_by(CageDayCharge.professor_id)
+    ).all())
+
+
+def _open_assignment_id(db, cage_id: int) -> int:
+    db.expire_all()
+    return db.scalar(
+        select(Assignment.id).where(Assignment.cage_id == cage_id, Assignment.released_at.is_(None))
+    )
+
+
+def _assign(client, cage: dict, professor_id: int) -> dict:
+    response = client.post(
+        f"/api/cages/{cage['id']}/assign",
+        json={"professor_id": professor_id, "version": cage["version"]},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["cage"]
+
+
+def _release(client, cage: dict) -> dict:
+    response = client.post(f"/api/cages/{cage['id']}/release", json={"version": cage["version"]})
+    assert response.status_code == 200, response.text
+    return response.json()["cage"]
+
+
+def test_assign_release_reassign_charge_today_once(client, db, free_cages):
+    today = date.today()
+    first, second = free_cages(2)
+    before = _usage(db, today)
+
+    first = _assign(client, first, 1)
+    first_assignment = _open_assignment_id(db, first["id"])
+    second = _assign(client, second, 1)
+    second_assignment = _open_assignment_id(db, second["id"])
+    _release(client, first)
+    _assign(client, second, 2)
+    reassigned = _open_assignment_id(db, second["id"])
+
+    # Each assignment is billed for its first day as it opens, releases and reassignments included
+    assert _charge_dates(db, first_assignment) == [today]
+    assert _charge_dates(db, second_assignment) == [today]
+    assert _charge_dates(db, reassigned) == [today]
+    after = _usage(db, today)
+    assert after.get(1, 0) - before.get(1, 0) == 2
+    assert after.get(2, 0) - before.get(2, 0) == 1
+
+    # The accrual run finds nothing left to charge and rebuilds the same rollup
+    assert accrue_date(db, today) == 0
+    assert _usage(db, today) == after == _ledger_usage(db, today)
+
+
+def test_accrue_date_is_idempotent(client, db):
+    charge_date = date.today() + timedelta(days=1)
+
+    inserted = accrue_date(db, charge_date)
+    charges = db.scalar(select(func.count()).where(CageDayCharge.charge_date == charge_date))
+    usage = _usage(db, charge_date)
+
+    assert inserted == charges > 0
+    assert sum(usage.values()) == charges
+    assert accrue_date(db, charge_date) == 0
+    assert db.scalar(select(func.count()).where(CageDayCharge.charge_date == charge_date)) == charges
+    assert _usage(db, charge_date) == usage
+
+
+def test_accrue_through_catches_up_missed_days(client, db, free_cages):
+    (cage,) = free_cages(1)
+    cage = _assign(client, cage, 3)
+    assignment_id = _open_assignment_id(db, cage["id"])
+    last_run = db.scalar(select(func.max(AccrualRun.charge_date)))
+    through = last_run + timedelta(days=3)
+
+    accrued = accrue_through(db, through)
+
+    missed = [last_run + timedelta(days=offset) for offset in range(1, 4)]
+    assert list(accrued) == missed
+    assert _charge_dates(db, assignment_id)[-3:] == missed
+    for charge_date in missed:
+        assert _usage(db, charge_date) == _ledger_usage(db, charge_date)
+    # Nothing left to catch up
+    assert accrue_through(db, through) == {}
+
+
+def test_accrual_charges_only_open_or_recently_released(client, db, free_cages):
+    (cage,) = free_cages(1)
+    today = date.today()
+    released_yesterday = Assignment(
+        cage_id=cage["id"],
+        professor_id=4,
+        assigned_by_user_id=1,
+        assigned_date=today - timedelta(days=3),
+        assigned_at=datetime.combine(today - timedelta(days=3), time(9)),
+        released_at=datetime.combine(today - timedelta(days=1), time(12)),
+        cost=800,
+    )
+    db.add(released_yesterday)
+    db.commit()
+
+    accrue_date(db, today - timedelta(days=1))
+    accrue_date(db, today)
+
+    # Charged for the day it was released, not for the days after
+    assert _charge_dates(db, released_yesterday.id) == [today - timedelta(days=1)]
+
+
+def test_accrual_loop_logs_failures(monkeypatch, caplog):
+    async def fail(_function):
+        raise RuntimeError("database unavailable")
+
+    async def stop(_seconds):
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(accrual, "run_in_threadpool", fail)
+    monkeypatch.setattr(accrual.asyncio, "sleep", stop)
+
+    with caplog.at_level(logging.ERROR, logger="app.accrual"), pytest.raises(asyncio.CancelledError):
+        asyncio.run(accrual.accrual_loop(60))
+
+    (record,) = caplog.records
+    assert record.message == "Cage-day accrual failed"
+    assert record.exc_info[0] is RuntimeError
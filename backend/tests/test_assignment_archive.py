@@ -0,0 +1,44 @@
+"""Archiving closed months: billed history must read the same before and after."""
+
+from datetime import date, timedelta
+
+from sqlalchemy import func, select
+
+from app.models import Assignment, AssignmentArchive
+from app.services.assignment_archive import archive_assignments, month_start
+
+
+def _history(client, params: dict) -> list[dict]:
+    rows, cursor = [], {}
+    while True:
+        body = client.get("/api/assignments", params={**params, "limit": 500, **cursor}).json()
+        rows += body["assignments"]
+        if body["next_cursor"] is None:
+            return rows
+        cursor = {"cursor": body["next_cursor"]}
+
+
+def test_archived_history_still_resolves(client, db):
+    boundary = month_start(date.today())
+    last_month = {"start": month_start(boundary - timedelta(days=1)).isoformat(),
+                  "end": (boundary - timedelta(days=1)).isoformat()}
+    export = client.get("/api/reports/export", params={**last_month, "format": "ndjson"}).content
+    costs = client.get("/api/dashboard/costs", params={"period": "monthly"}).json()
+    history = _history(client, {"end": last_month["end"]})
+    professor_history = _history(client, {"professor_id": 1})
+    assert export and history
+
+    moved = archive_assignments(db, boundary)
+
+    assert sum(moved.values()) > 0
+    assert db.scalar(select(func.count()).select_from(AssignmentArchive)) >= sum(moved.values())
+    assert db.scalar(select(func.count()).where(
+        Assignment.assigned_date < boundary, Assignment.released_at.is_not(None),
+    )) == 0
+    # The billing ledger and its reports never read assignments
+    assert client.get("/api/reports/export", params={**last_month, "format": "ndjson"}).content == export
+    assert client.get("/api/dashboard/costs", params={"period": "monthly"}).json() == costs
+    # History reads the archive for ranges reaching past the boundary, display names included
+    assert _history(client, {"end": last_month["end"]}) == history
+    assert _history(client, {"professor_id": 1}) == professor_history
+    assert all(row["rack_name"] and row["professor_name"] for row in history)
@@ -0,0 +1,63 @@
+"""Assignment history keyset pagination."""
+
+import base64
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+
+
+def _pages(client, params: dict, limit: int) -> list[list[dict]]:
+    pages, cursor = [], {}
+    while True:
+        response = client.get("/api/assignments", params={**params, "limit": limit, **cursor})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        pages.append(body["assignments"])
+        if body["next_cursor"] is None:
+            return pages
+        cursor = {"cursor": body["next_cursor"]}
+
+
+def test_pages_split_date_ties_without_gaps_or_duplicates(client):
+    params = {"start": (date.today() - timedelta(days=14)).isoformat()}
+    (everything,) = _pages(client, params, 500)
+    dates = Counter(row["assigned_date"] for row in everything)
+    assert len(everything) > 7 and max(dates.values()) > 7, "dataset needs dates shared by several rows"
+
+    pages = _pages(client, params, 7)
+
+    paged = [row for page in pages for row in page]
+    assert [row["id"] for row in paged] == [row["id"] for row in everything]
+    assert len({row["id"] for row in paged}) == len(paged)
+    # Some page boundary falls between rows of the same date
+    assert any(
+        previous[-1]["assigned_date"] == page[0]["assigned_date"]
+        for previous, page in zip(pages, pages[1:])
+    )
+
+
+def test_pages_are_ordered_newest_first(client):
+    (rows,) = _pages(client, {"start": (date.today() - timedelta(days=3)).isoformat()}, 500)
+    keys = [(row["assigned_date"], row["id"]) for row in rows]
+    assert keys == sorted(keys, reverse=True)
+
+
+def _encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        _encode(b"2026-01-01"),
+        _encode(b"2026-01-01:abc"),
+        _encode(b"yesterday:5"),
+        _encode(b"\xff\xfe:1"),
+        "A",
+    ],
+)
+def test_invalid_cursor_is_rejected(client, cursor):
+    response = client.get("/api/assignments", params={"cursor": cursor})
+    assert response.status_code == 400
@@ -0,0 +1,88 @@
+"""Bulk assign/release: one stale version among valid operations, in both modes."""
+
+from sqlalchemy import select
+
+from app.models import Assignment, Cage
+
+
+def _assign(client, cage: dict, professor_id: int) -> dict:
+    response = client.post(
+        f"/api/cages/{cage['id']}/assign",
+        json={"professor_id": professor_id, "version": cage["version"]},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["cage"]
+
+
+def _stale_and_valid(client, free_cages) -> tuple[dict, list[dict]]:
+    """A cage modified since it was read (its version now stale), and two untouched free cages."""
+    stale, *valid = free_cages(3)
+    _assign(client, stale, 1)
+    return stale, valid
+
+
+def _operations(stale: dict, valid: list[dict]) -> list[dict]:
+    return [
+        {"cage_id": cage["id"], "version": cage["version"], "action": "assign", "professor_id": 2}
+        for cage in [valid[0], stale, valid[1]]
+    ]
+
+
+def _current(db, cage_id: int) -> Cage:
+    db.expire_all()
+    return db.get(Cage, cage_id)
+
+
+def test_all_or_nothing_rejects_request_with_stale_version(client, db, free_cages):
+    stale, valid = _stale_and_valid(client, free_cages)
+
+    response = client.post("/api/cages/bulk", json={"operations": _operations(stale, valid)})
+
+    assert response.status_code == 409
+    body = response.json()
+    assert body["success"] is False
+    assert body["applied_count"] == 0
+    results = {result["cage_id"]: result for result in body["results"]}
+    assert results[stale["id"]]["status_code"] == 409
+    # The failed operation reports the cage's current state so the client can retry
+    assert results[stale["id"]]["cage"]["version"] == stale["version"] + 1
+    for cage in valid:
+        assert results[cage["id"]]["success"] is False
+        assert results[cage["id"]]["status_code"] == 409
+        current = _current(db, cage["id"])
+        assert current.current_professor_id is None
+        assert current.version == cage["version"]
+    assert _current(db, stale["id"]).current_professor_id == 1
+    assert db.scalars(select(Assignment.id).where(
+        Assignment.cage_id.in_([cage["id"] for cage in valid]),
+        Assignment.released_at.is_(None),
+    )).all() == []
+
+
+def test_best_effort_applies_valid_operations(client, db, free_cages):
+    stale, valid = _stale_and_valid(client, free_cages)
+
+    response = client.post(
+        "/api/cages/bulk",
+        json={"operations": _operations(stale, valid), "mode": "best_effort"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is False
+    assert body["applied_count"] == 2
+    results = {result["cage_id"]: result for result in body["results"]}
+    assert results[stale["id"]]["success"] is False
+    assert results[stale["id"]]["status_code"] == 409
+    assert _current(db, stale["id"]).current_professor_id == 1
+    for cage in valid:
+        assert results[cage["id"]]["success"] is True
+        assert results[cage["id"]]["cage"]["version"] == cage["version"] + 1
+        assert results[cage["id"]]["cage"]["assigned_since"] is not None
+        current = _current(db, cage["id"])
+        assert current.current_professor_id == 2
+        (assignment,) = db.scalars(select(Assignment).where(
+            Assignment.cage_id == cage["id"], Assignment.released_at.is_(None),
+        )).all()
+        assert assignment.professor_id == 2
+        assert current.current_assignment_id == assignment.id
@@ -0,0 +1,80 @@
+"""Assign/release bookkeeping: assignment rows and the cage's current assignment pointer."""
+
+from sqlalchemy import select, update
+
+from app.models import Assignment, Cage
+
+
+def _open_assignments(db, cage_id: int) -> list[Assignment]:
+    db.expire_all()
+    return list(db.scalars(
+        select(Assignment).where(Assignment.cage_id == cage_id, Assignment.released_at.is_(None))
+    ))
+
+
+def _assign(client, cage: dict, professor_id: int) -> dict:
+    response = client.post(
+        f"/api/cages/{cage['id']}/assign",
+        json={"professor_id": professor_id, "version": cage["version"]},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["cage"]
+
+
+def _unpoint(db, cage_id: int) -> None:
+    """Drop the cage's pointer, as for rows the pointer backfill could not match."""
+    db.execute(
+        update(Cage)
+        .where(Cage.id == cage_id)
+        .values(current_assignment_id=None, current_assignment_date=None)
+    )
+    db.commit()
+
+
+def test_assign_points_cage_at_open_assignment(client, db, free_cages):
+    (cage,) = free_cages(1)
+    assigned = _assign(client, cage, 1)
+
+    (opened,) = _open_assignments(db, cage["id"])
+    stored = db.get(Cage, cage["id"])
+    assert (stored.current_assignment_id, stored.current_assignment_date) == (opened.id, opened.assigned_date)
+    assert assigned["assigned_since"] == opened.assigned_at.isoformat()
+
+
+def test_release_without_pointer_closes_open_assignment(client, db, free_cages):
+    (cage,) = free_cages(1)
+    assigned = _assign(client, cage, 1)
+    _unpoint(db, cage["id"])
+
+    response = client.post(f"/api/cages/{cage['id']}/release", json={"version": assigned["version"]})
+
+    assert response.status_code == 200, response.text
+    assert _open_assignments(db, cage["id"]) == []
+
+
+def test_reassign_without_pointer_closes_previous_assignment(client, db, free_cages):
+    (cage,) = free_cages(1)
+    assigned = _assign(client, cage, 1)
+    _unpoint(db, cage["id"])
+
+    _assign(client, assigned, 2)
+
+    (current,) = _open_assignments(db, cage["id"])
+    assert current.professor_id == 2
+    assert db.get(Cage, cage["id"]).current_assignment_id == current.id
+
+
+def test_bulk_release_without_pointer_closes_open_assignment(client, db, free_cages):
+    first, second = free_cages(2)
+    first, second = _assign(client, first, 1), _assign(client, second, 1)
+    _unpoint(db, first["id"])
+
+    response = client.post("/api/cages/bulk", json={"operations": [
+        {"cage_id": first["id"], "version": first["version"], "action": "release"},
+        {"cage_id": second["id"], "version": second["version"], "action": "assign", "professor_id": 2},
+    ]})
+
+    assert response.status_code == 200, response.text
+    assert _open_assignments(db, first["id"]) == []
+    (current,) = _open_assignments(db, second["id"])
+    assert current.professor_id == 2
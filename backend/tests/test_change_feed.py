@@ -0,0 +1,31 @@
+"""Cage change events carry the same cage payload as the grid."""
+
+from app.services.change_feed import change_feed
+
+
+def _grid_cage(client, rack_id: int, cage_id: int) -> dict:
+    cages = client.get(f"/api/cages/rack/{rack_id}").json()["cages"]
+    return next(cage for cage in cages if cage["id"] == cage_id)
+
+
+def test_cage_events_match_grid_payload(client, free_cages):
+    (cage,) = free_cages(1)
+    since = change_feed.last_seq
+
+    response = client.post(
+        f"/api/cages/{cage['id']}/assign",
+        json={"professor_id": 1, "version": cage["version"]},
+    )
+    assert response.status_code == 200, response.text
+    assigned = response.json()["cage"]
+    assigned_grid = _grid_cage(client, cage["rack_id"], cage["id"])
+    response = client.post(f"/api/cages/{cage['id']}/release", json={"version": assigned["version"]})
+    assert response.status_code == 200, response.text
+
+    events, missed = change_feed.events_since(since)
+    assert not missed
+    assign_event, release_event = events
+    assert assign_event.rack_id == release_event.rack_id == cage["rack_id"]
+    assert assign_event.data["cages"] == [assigned_grid]
+    assert assigned_grid["assigned_since"] is not None
+    assert release_event.data["cages"] == [_grid_cage(client, cage["rack_id"], cage["id"])]
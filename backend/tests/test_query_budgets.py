@@ -0,0 +1,40 @@
+"""Query budgets for list and grid endpoints - fail when a route regresses to N+1."""
+
+import pytest
+
+from app.query_stats import assert_max_queries
+
+
+@pytest.mark.parametrize(
+    ("path", "budget"),
+    [
+        ("/api/racks", 1),
+        ("/api/professors", 1),
+        ("/api/dashboard/summary", 1),
+        ("/api/dashboard/professors", 1),
+        ("/api/dashboard/costs?period=daily", 1),
+        ("/api/dashboard/costs?period=weekly", 1),
+        ("/api/dashboard/costs?period=monthly", 1),
+    ],
+)
+def test_list_endpoint_query_budget(client, path, budget):
+    with assert_max_queries(budget):
+        response = client.get(path)
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("format", ["full", "compact"])
+def test_cage_grid_query_budget(client, format):
+    rack_ids = [rack["id"] for rack in client.get("/api/racks").json()["racks"]]
+    for rack_id in rack_ids:
+        # The rack (for its ETag) and its cells
+        with assert_max_queries(2):
+            response = client.get(f"/api/cages/rack/{rack_id}", params={"format": format})
+        assert response.status_code == 200
+
+
+def test_all_cage_grids_query_budget(client):
+    with assert_max_queries(1):
+        response = client.get("/api/cages/grid")
+    assert response.status_code == 200
+    assert len(response.json()["racks"]) == len(client.get("/api/racks").json()["racks"])
@@ -0,0 +1,96 @@
+"""Report job status, artifact bookkeeping and the charges stamp, without the worker pool."""
+
+from concurrent.futures import Future
+from datetime import date, timedelta
+
+import pytest
+
+from app.services.report_jobs import ReportJob, ReportJobManager, charges_stamp
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ReportJobManager(str(tmp_path), max_workers=1)
+
+
+def _job(manager: ReportJobManager, stamp: str, future: Future | None) -> ReportJob:
+    start = end = date(2026, 1, 5)
+    return ReportJob(
+        id=stamp,
+        start=start,
+        end=end,
+        path=manager._artifact_path(start, end, stamp),
+        cached=future is None,
+        future=future,
+    )
+
+
+def _assign(client, cage: dict, professor_id: int) -> dict:
+    response = client.post(
+        f"/api/cages/{cage['id']}/assign",
+        json={"professor_id": professor_id, "version": cage["version"]},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["cage"]
+
+
+def _release(client, cage: dict) -> dict:
+    response = client.post(f"/api/cages/{cage['id']}/release", json={"version": cage["version"]})
+    assert response.status_code == 200, response.text
+    return response.json()["cage"]
+
+
+def test_cancelled_job_reports_failed(manager):
+    future = Future()
+    future.cancel()
+    job = _job(manager, "1", future)
+
+    manager._finish(job)
+
+    assert job.status == "failed"
+    assert job.error
+
+
+def test_failed_job_keeps_error(manager):
+    future = Future()
+    future.set_exception(RuntimeError("worker crashed"))
+    job = _job(manager, "1", future)
+
+    manager._finish(job)
+
+    assert job.status == "failed"
+    assert job.error == "worker crashed"
+
+
+def test_finished_job_removes_only_older_artifacts(manager):
+    older, newer = _job(manager, "1", None), _job(manager, "3", None)
+    for job in (older, newer):
+        job.path.write_bytes(b"xlsx")
+    future = Future()
+    future.set_result(None)
+    job = _job(manager, "2", future)
+    job.path.write_bytes(b"xlsx")
+
+    manager._finish(job)
+
+    assert job.status == "completed"
+    assert not older.path.exists()
+    assert job.path.exists() and newer.path.exists()
+
+
+def test_charges_stamp_moves_only_with_charges_in_range(client, db, free_cages):
+    today = date.today()
+    first, second = free_cages(2)
+    stamp = charges_stamp(db, today, today)
+    closed = charges_stamp(db, today - timedelta(days=7), today - timedelta(days=1))
+
+    first = _assign(client, first, 1)
+    charged = charges_stamp(db, today, today)
+    assert charged > stamp
+
+    # Releasing charges nothing: cached reports stay valid
+    _release(client, first)
+    assert charges_stamp(db, today, today) == charged
+    _assign(client, second, 2)
+    assert charges_stamp(db, today, today) > charged
+    assert charges_stamp(db, today - timedelta(days=7), today - timedelta(days=1)) == closed
@@ -0,0 +1,52 @@
+"""Response cache: invalidation by bump() and expiry for writes it never sees."""
+
+import time
+
+from app.services.response_cache import ResponseCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _cache(monkeypatch, ttl_seconds: float = 5.0) -> tuple[ResponseCache, _Clock]:
+    clock = _Clock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return ResponseCache(max_entries=4, ttl_seconds=ttl_seconds), clock
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache, clock = _cache(monkeypatch)
+    values = iter([1, 2])
+
+    assert cache.get_or_compute("key", lambda: next(values)) == 1
+    clock.now += 4.9
+    assert cache.get_or_compute("key", lambda: next(values)) == 1
+    # A write this process never saw (another worker, the manage CLI) shows up after the TTL
+    clock.now += 0.2
+    assert cache.get_or_compute("key", lambda: next(values)) == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_bump_drops_entries(monkeypatch):
+    cache, _ = _cache(monkeypatch)
+    cache.get_or_compute("key", lambda: 1)
+
+    cache.bump()
+
+    assert cache.get_or_compute("key", lambda: 2) == 2
+
+
+def test_value_computed_across_a_bump_is_not_stored(monkeypatch):
+    cache, _ = _cache(monkeypatch)
+
+    def compute_while_writing():
+        cache.bump()
+        return "stale"
+
+    assert cache.get_or_compute("key", compute_while_writing) == "stale"
+    assert cache.get_or_compute("key", lambda: "fresh") == "fresh"